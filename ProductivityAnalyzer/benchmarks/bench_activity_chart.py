@@ -0,0 +1,84 @@
+# benchmarks/bench_activity_chart.py
+"""
+Benchmark the bar chart's data preparation against the old per-cell scan.
+
+The old ActivityBarChart looked every (date, category) cell up with a scan over
+all rows, which is quadratic in the number of dates; DailyCountMatrix pivots
+the rows in one pass. Also reports the full render time at each size.
+
+    python -m benchmarks.bench_activity_chart --days 7 30 90 365 --hourly
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from reporting.charts.activity_chart import ActivityBarChart
+from reporting.charts.activity_counts import CATEGORIES, DailyCountMatrix
+
+
+def _scan_pivot(daily_counts: list[dict]) -> list[list[int]]:
+    """Reference implementation: the old generator scan for every date x category pair."""
+    dates = sorted(set(d["date"] for d in daily_counts))
+    return [
+        [
+            next(
+                (
+                    item["count"]
+                    for item in daily_counts
+                    if item["date"] == d and item["category"] == cat.value
+                ),
+                0,
+            )
+            for d in dates
+        ]
+        for cat in CATEGORIES
+    ]
+
+
+def _rows(columns: int, step: timedelta, rng: random.Random) -> list[dict]:
+    start = datetime(2026, 1, 1)
+    return [
+        {"date": start + i * step, "category": category.value, "count": rng.randint(1, 500)}
+        for i in range(columns)
+        for category in CATEGORIES
+        if rng.random() < 0.9
+    ]
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--days", type=int, nargs="+", default=[7, 30, 90, 365], help="range sizes in days")
+    parser.add_argument("--hourly", action="store_true", help="also bucket each range per hour")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = [(f"{days} days", days, timedelta(days=1)) for days in args.days]
+    if args.hourly:
+        cases += [(f"{days} days hourly", days * 24, timedelta(hours=1)) for days in args.days]
+
+    print(f"{'range':>20} {'rows':>7} {'scan':>11} {'pivot':>10} {'speedup':>8} {'render':>10}")
+    for label, columns, step in cases:
+        rows = _rows(columns, step, rng)
+        expected, scan = _timed(_scan_pivot, rows)
+        matrix, pivot = _timed(DailyCountMatrix.from_rows, rows)
+        assert matrix.counts.tolist() == expected, "pivot disagrees with the scan"
+        _, render = _timed(lambda m: ActivityBarChart(m, width=9, height=5).image(), matrix)
+        print(
+            f"{label:>20} {len(rows):>7} {scan * 1000:>8.1f} ms {pivot * 1000:>7.2f} ms"
+            f" {scan / pivot:>7.0f}x {render * 1000:>7.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
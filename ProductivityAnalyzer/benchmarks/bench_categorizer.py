@@ -0,0 +1,78 @@
+# benchmarks/bench_categorizer.py
+"""
+Benchmark AppCategorizer.categorize against the old per-keyword substring scan.
+
+    python -m benchmarks.bench_categorizer --rules 5000 --titles 20000
+"""
+
+import argparse
+import random
+import string
+import time
+
+from config.constants import AppCategory
+from tracking.categorizer import CATEGORY_PRECEDENCE, AppCategorizer
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+
+
+def _linear_scan(rules: dict[str, AppCategory], title: str) -> AppCategory:
+    """Reference implementation: test every keyword, keep the best by the same precedence."""
+    title = title.lower()
+    best = None
+    for keyword, category in rules.items():
+        if keyword in title:
+            rank = (CATEGORY_PRECEDENCE.index(category), -len(keyword))
+            if best is None or rank < best[0]:
+                best = (rank, category)
+    return best[1] if best else AppCategory.NEUTRAL
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rules", type=int, default=5000, help="number of extra keyword rules")
+    parser.add_argument("--titles", type=int, default=20000, help="number of window titles")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    categorizer = AppCategorizer(db_pool=None)
+    categories = [AppCategory.PRODUCTIVE, AppCategory.UNPRODUCTIVE, AppCategory.NEUTRAL]
+    for _ in range(args.rules):
+        keyword = f"{_word(rng)} {_word(rng)}" if rng.random() < 0.3 else _word(rng)
+        categorizer.add_rule(keyword, rng.choice(categories))
+    keywords = list(categorizer.rules)
+
+    titles = []
+    for _ in range(args.titles):
+        parts = [_word(rng) for _ in range(rng.randint(2, 6))]
+        if rng.random() < 0.5:
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(keywords).upper())
+        titles.append(" - ".join(parts))
+
+    started = time.perf_counter()
+    expected = [_linear_scan(categorizer.rules, title) for title in titles]
+    linear = time.perf_counter() - started
+
+    started = time.perf_counter()
+    categorizer.categorize("warm up")  # links the automaton
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    actual = [categorizer.categorize(title) for title in titles]
+    automaton = time.perf_counter() - started
+
+    assert actual == expected, "automaton disagrees with the linear scan"
+    print(f"{len(categorizer.rules)} rules, {len(titles)} titles")
+    print(f"  linear scan: {linear * 1000:9.1f} ms  ({linear / len(titles) * 1e6:7.1f} µs/title)")
+    print(f"  automaton:   {automaton * 1000:9.1f} ms  ({automaton / len(titles) * 1e6:7.1f} µs/title)")
+    print(f"  link time:   {build * 1000:9.1f} ms")
+    print(f"  speedup:     {linear / automaton:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
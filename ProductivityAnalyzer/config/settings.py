@@ -23,6 +23,10 @@ class DatabaseConfig:
     database: str = os.getenv("DB_NAME", "remotework")
     min_connections: int = int(os.getenv("DB_MIN_CONNECTIONS", "1"))
     max_connections: int = int(os.getenv("DB_MAX_CONNECTIONS", "10"))
+    pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    cache_ttl: float = float(os.getenv("DB_CACHE_TTL", "30"))
+    cache_past_ttl: float = float(os.getenv("DB_CACHE_PAST_TTL", "600"))
+    cache_max_entries: int = int(os.getenv("DB_CACHE_MAX_ENTRIES", "256"))
 
 
 @dataclass(frozen=True)
@@ -30,6 +34,10 @@ class AppConfig:
     """Application-wide settings."""
 
     tracking_interval: int = int(os.getenv("TRACKING_INTERVAL", "5"))
+    idle_threshold_seconds: int = int(os.getenv("IDLE_THRESHOLD_SECONDS", "300"))
+    write_batch_size: int = int(os.getenv("WRITE_BATCH_SIZE", "50"))
+    write_flush_seconds: float = float(os.getenv("WRITE_FLUSH_SECONDS", "30"))
+    spool_path: str = os.getenv("SPOOL_PATH", os.path.join("data", "activity.spool"))
     log_retention_days: int = int(os.getenv("LOG_RETENTION_DAYS", "90"))
     debug: bool = os.getenv("DEBUG", "false").lower() == "true"
     default_focus_duration: int = int(os.getenv("DEFAULT_FOCUS_DURATION_MINUTES", "25"))
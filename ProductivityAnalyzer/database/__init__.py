@@ -1,11 +1,14 @@
 # database/__init__.py
 from database.connection import DatabasePool
 from database.models import ActivityLog, DailySummary, FocusSettings, ProductivityGoal
+from database.pool import PoolStats, PoolTimeoutError
 
 __all__ = [
     "ActivityLog",
     "DailySummary",
     "DatabasePool",
     "FocusSettings",
+    "PoolStats",
+    "PoolTimeoutError",
     "ProductivityGoal",
 ]
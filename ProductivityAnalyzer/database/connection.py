@@ -4,32 +4,44 @@ Database connection pool management using psycopg2.
 ALL database access goes through this class.
 """
 
+import uuid
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, Protocol
 
 import psycopg2
+import psycopg2.extras
 from psycopg2.extras import RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
 
 from config.settings import db_config
+from database.pool import InstrumentedConnectionPool, PoolStats
+from database.query_cache import QueryCache, QueryCacheStats
 from utils.logger import setup_logger
 
 logger = setup_logger("database.connection")
 
 
+class _TextReader(Protocol):
+    """Anything COPY FROM STDIN can read text from (files, StringIO, generator-backed streams)."""
+
+    def read(self, size: int = -1, /) -> str: ...
+
+
 class DatabasePool:
     """Manages PostgreSQL connection pooling and query execution."""
 
     def __init__(self) -> None:
-        self.pool: SimpleConnectionPool | None = None
+        self.pool: InstrumentedConnectionPool | None = None
+        self.cache = QueryCache(max_entries=db_config.cache_max_entries)
         self._create_pool()
 
     def _create_pool(self) -> None:
         """Create the connection pool."""
         try:
-            self.pool = SimpleConnectionPool(
+            self.pool = InstrumentedConnectionPool(
                 minconn=db_config.min_connections,
                 maxconn=db_config.max_connections,
+                timeout=db_config.pool_timeout,
                 user=db_config.user,
                 password=db_config.password,
                 host=db_config.host,
@@ -45,6 +57,7 @@ class DatabasePool:
     def get_connection(self):  # type: ignore[return]
         """
         Context manager for getting a connection from the pool.
+        Blocks up to DB_POOL_TIMEOUT seconds when every connection is in use.
         Automatically returns connection to pool when done.
         """
         if self.pool is None:
@@ -70,12 +83,57 @@ class DatabasePool:
                 with conn.cursor() as cursor:
                     cursor.execute(query, params)
                     conn.commit()
+                    self.cache.record_write(query)
                     return True
             except psycopg2.Error as e:
                 conn.rollback()
                 logger.error(f"Query execution error: {e}\nQuery: {query}")
                 return False
 
+    def execute_values(self, query: str, rows: list[tuple[Any, ...]], page_size: int = 500) -> bool:
+        """Execute a multi-row write (INSERT ... VALUES %s) in one transaction. Returns True on success."""
+        if not rows:
+            return True
+        with self.get_connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    psycopg2.extras.execute_values(cursor, query, rows, page_size=page_size)
+                    conn.commit()
+                    self.cache.record_write(query)
+                    return True
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error(f"Batch execution error: {e}\nQuery: {query}")
+                return False
+
+    def copy_from(
+        self,
+        copy_sql: str,
+        stream: _TextReader,
+        prologue: Sequence[str] = (),
+        epilogue: Sequence[str] = (),
+    ) -> int | None:
+        """
+        Stream rows into a table with COPY ... FROM STDIN. Statements in `prologue` / `epilogue`
+        run before / after it in the same transaction. Returns rows copied, or None on failure.
+        """
+        with self.get_connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    for statement in prologue:
+                        cursor.execute(statement)
+                    cursor.copy_expert(copy_sql, stream)
+                    rowcount: int = cursor.rowcount
+                    for statement in epilogue:
+                        cursor.execute(statement)
+                    conn.commit()
+                    self.cache.record_write(*prologue, copy_sql, *epilogue)
+                    return rowcount
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error(f"COPY error: {e}\nQuery: {copy_sql}")
+                return None
+
     def execute_query_returning(self, query: str, params: tuple[Any, ...] | None = None) -> Any | None:
         """Execute a write query that returns a value (e.g., RETURNING id)."""
         with self.get_connection() as conn:
@@ -84,6 +142,7 @@ class DatabasePool:
                     cursor.execute(query, params)
                     result = cursor.fetchone()
                     conn.commit()
+                    self.cache.record_write(query)
                     return result[0] if result else None
             except psycopg2.Error as e:
                 conn.rollback()
@@ -101,8 +160,19 @@ class DatabasePool:
                 logger.error(f"Fetch error: {e}\nQuery: {query}")
                 return None
 
-    def fetch_all(self, query: str, params: tuple[Any, ...] | None = None) -> list[tuple[Any, ...]]:
-        """Fetch all rows."""
+    def fetch_all(
+        self, query: str, params: tuple[Any, ...] | None = None, cache_ttl: float | None = None
+    ) -> list[tuple[Any, ...]]:
+        """
+        Fetch all rows. With `cache_ttl` (seconds, or query_cache.FOREVER) the result is served
+        from the query cache until it expires or one of the tables it reads is written to.
+        """
+        if cache_ttl is None:
+            return self._fetch_all(query, params) or []
+        return self.cache.get_or_load(query, params, cache_ttl, lambda: self._fetch_all(query, params)) or []
+
+    def _fetch_all(self, query: str, params: tuple[Any, ...] | None) -> list[tuple[Any, ...]] | None:
+        """Fetch all rows, or None on error."""
         with self.get_connection() as conn:
             try:
                 with conn.cursor() as cursor:
@@ -110,7 +180,7 @@ class DatabasePool:
                     return cursor.fetchall()  # type: ignore[no-any-return]
             except psycopg2.Error as e:
                 logger.error(f"Fetch error: {e}\nQuery: {query}")
-                return []
+                return None
 
     def fetch_all_dict(self, query: str, params: tuple[Any, ...] | None = None) -> list[dict]:
         """Fetch all rows as dictionaries."""
@@ -123,8 +193,52 @@ class DatabasePool:
                 logger.error(f"Fetch error: {e}\nQuery: {query}")
                 return []
 
+    def stats(self) -> PoolStats:
+        """Return checkout/hold timings, saturation and churn counters for the pool."""
+        if self.pool is None:
+            raise Exception("Connection pool not initialized")
+        return self.pool.stats()
+
+    def cache_stats(self) -> QueryCacheStats:
+        """Hit rate and size of the query result cache."""
+        return self.cache.stats()
+
+    def iter_query(
+        self, query: str, params: tuple[Any, ...] | None = None, itersize: int = 2000
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Stream rows through a named server-side cursor, `itersize` rows per round trip.
+        The connection stays checked out until the generator is exhausted or closed.
+        A database error, even mid-stream, is raised to the caller once the transaction is rolled back.
+        """
+        with self.get_connection() as conn:
+            try:
+                with conn.cursor(name=f"stream_{uuid.uuid4().hex}") as cursor:
+                    cursor.itersize = itersize
+                    cursor.execute(query, params)
+                    yield from cursor
+            except psycopg2.Error as e:
+                logger.error(f"Stream error: {e}\nQuery: {query}")
+                raise
+            finally:
+                # Named cursors live inside a transaction; end it before the connection goes back
+                if not conn.closed:
+                    conn.rollback()
+
     def close_all(self) -> None:
         """Close all connections in the pool."""
         if self.pool:
+            stats = self.pool.stats()
+            logger.info(
+                f"Pool stats: {stats.checkouts} checkouts, peak {stats.peak_in_use}/{stats.max_connections} "
+                f"in use, avg wait {stats.avg_wait_seconds * 1000:.1f}ms, "
+                f"max wait {stats.max_wait_seconds * 1000:.1f}ms, {stats.timeouts} timeouts, "
+                f"{stats.connections_opened} opened / {stats.connections_closed} closed"
+            )
+            cache = self.cache.stats()
+            logger.info(
+                f"Query cache: {cache.hits} hits / {cache.misses} misses "
+                f"({cache.hit_rate:.0%}), {cache.size} entries, {cache.evictions} evicted"
+            )
             self.pool.closeall()
             logger.info("All database connections closed")
@@ -0,0 +1,142 @@
+"""
+Migration 003: Keep daily_summary as an incrementally maintained rollup of activity_log.
+
+Statement-level triggers with transition tables fold every INSERT/UPDATE/DELETE
+on activity_log into per-day totals, so reports read one row per day instead of
+re-aggregating raw logs. Existing history is backfilled once here; afterwards
+`python -m database.rebuild_summaries` can rebuild any date range.
+"""
+
+from database.connection import DatabasePool
+from utils.logger import setup_logger
+
+logger = setup_logger("migration.003")
+
+MIGRATION_VERSION = 3
+MIGRATION_NAME = "daily_summary_rollup"
+
+# Per-day category totals of a set of activity rows; {source} is a transition table
+_DELTA_SELECT = """
+        SELECT DATE(timestamp),
+               {sign}COALESCE(SUM(duration_seconds) FILTER (WHERE category = 'productive'), 0),
+               {sign}COALESCE(SUM(duration_seconds) FILTER (WHERE category = 'unproductive'), 0),
+               {sign}COALESCE(SUM(duration_seconds) FILTER (WHERE category = 'neutral'), 0),
+               {sign}COALESCE(SUM(duration_seconds) FILTER (WHERE category = 'idle'), 0),
+               {sign}COUNT(*)
+        FROM {source}
+        GROUP BY DATE(timestamp)
+"""
+
+_APPLY_DELTA = """
+        INSERT INTO daily_summary AS ds
+            (summary_date, productive_seconds, unproductive_seconds, neutral_seconds,
+             idle_seconds, total_entries)
+        {select}
+        ON CONFLICT (summary_date) DO UPDATE SET
+            productive_seconds = ds.productive_seconds + EXCLUDED.productive_seconds,
+            unproductive_seconds = ds.unproductive_seconds + EXCLUDED.unproductive_seconds,
+            neutral_seconds = ds.neutral_seconds + EXCLUDED.neutral_seconds,
+            idle_seconds = ds.idle_seconds + EXCLUDED.idle_seconds,
+            total_entries = ds.total_entries + EXCLUDED.total_entries;
+"""
+
+# Attach the rollup functions to activity_log (re-run whenever the table is recreated)
+TRIGGER_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS trg_activity_rollup_insert ON activity_log;",
+    """
+    CREATE TRIGGER trg_activity_rollup_insert
+    AFTER INSERT ON activity_log
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rollup_activity_log();
+    """,
+    "DROP TRIGGER IF EXISTS trg_activity_rollup_update ON activity_log;",
+    """
+    CREATE TRIGGER trg_activity_rollup_update
+    AFTER UPDATE ON activity_log
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rollup_activity_log();
+    """,
+    "DROP TRIGGER IF EXISTS trg_activity_rollup_delete ON activity_log;",
+    """
+    CREATE TRIGGER trg_activity_rollup_delete
+    AFTER DELETE ON activity_log
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION rollup_activity_log();
+    """,
+    "DROP TRIGGER IF EXISTS trg_activity_rollup_truncate ON activity_log;",
+    """
+    CREATE TRIGGER trg_activity_rollup_truncate
+    AFTER TRUNCATE ON activity_log
+    FOR EACH STATEMENT EXECUTE FUNCTION rollup_activity_log_truncate();
+    """,
+]
+
+SQL_STATEMENTS = [
+    # Rollup function shared by the INSERT / UPDATE / DELETE triggers
+    f"""
+    CREATE OR REPLACE FUNCTION rollup_activity_log() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            {_APPLY_DELTA.format(select=_DELTA_SELECT.format(sign="-", source="old_rows"))}
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            {_APPLY_DELTA.format(select=_DELTA_SELECT.format(sign="", source="new_rows"))}
+        END IF;
+        RETURN NULL;
+    END;
+    $$;
+    """,
+    """
+    CREATE OR REPLACE FUNCTION rollup_activity_log_truncate() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        DELETE FROM daily_summary;
+        RETURN NULL;
+    END;
+    $$;
+    """,
+    # Backfill existing history before the triggers start applying deltas
+    "LOCK TABLE activity_log IN SHARE MODE;",
+    "DELETE FROM daily_summary;",
+    f"""
+    INSERT INTO daily_summary
+        (summary_date, productive_seconds, unproductive_seconds, neutral_seconds,
+         idle_seconds, total_entries)
+    {_DELTA_SELECT.format(sign="", source="activity_log")};
+    """,
+    *TRIGGER_STATEMENTS,
+]
+
+
+def run_migration(db_pool: DatabasePool):
+    """Execute migration if not already applied."""
+    logger.info(f"Checking migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    result = db_pool.fetch_one(
+        "SELECT version FROM schema_migrations WHERE version = %s",
+        (MIGRATION_VERSION,),
+    )
+    if result:
+        logger.info(f"Migration {MIGRATION_VERSION} already applied, skipping.")
+        return
+
+    logger.info(f"Applying migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    with db_pool.get_connection() as conn, conn.cursor() as cursor:
+        for i, sql in enumerate(SQL_STATEMENTS):
+            try:
+                cursor.execute(sql)
+                logger.debug(f"  Statement {i + 1}/{len(SQL_STATEMENTS)} executed")
+            except Exception as e:
+                logger.error(f"  Statement {i + 1} failed: {e}")
+                conn.rollback()
+                raise
+
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+            (MIGRATION_VERSION, MIGRATION_NAME),
+        )
+        conn.commit()
+
+    logger.info(f"Migration {MIGRATION_VERSION} applied successfully!")
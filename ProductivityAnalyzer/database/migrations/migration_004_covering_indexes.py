@@ -0,0 +1,61 @@
+"""
+Migration 004: Covering timestamp index for activity_log range queries.
+
+Repository reads now filter on half-open `timestamp >= x AND timestamp < y`
+ranges instead of DATE(timestamp). A (timestamp) INCLUDE (category,
+duration_seconds) index lets summary queries run as index-only scans, so the
+old expression index and the plain timestamp index become redundant.
+"""
+
+from database.connection import DatabasePool
+from utils.logger import setup_logger
+
+logger = setup_logger("migration.004")
+
+MIGRATION_VERSION = 4
+MIGRATION_NAME = "covering_indexes"
+
+SQL_STATEMENTS = [
+    """
+    CREATE INDEX IF NOT EXISTS idx_activity_ts_covering
+    ON activity_log (timestamp) INCLUDE (category, duration_seconds);
+    """,
+    # Superseded by idx_activity_ts_covering; dropping them saves work on every insert
+    "DROP INDEX IF EXISTS idx_activity_date;",
+    "DROP INDEX IF EXISTS idx_activity_timestamp;",
+    # Refresh statistics so the planner sees the new index immediately
+    "ANALYZE activity_log;",
+]
+
+
+def run_migration(db_pool: DatabasePool):
+    """Execute migration if not already applied."""
+    logger.info(f"Checking migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    result = db_pool.fetch_one(
+        "SELECT version FROM schema_migrations WHERE version = %s",
+        (MIGRATION_VERSION,),
+    )
+    if result:
+        logger.info(f"Migration {MIGRATION_VERSION} already applied, skipping.")
+        return
+
+    logger.info(f"Applying migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    with db_pool.get_connection() as conn, conn.cursor() as cursor:
+        for i, sql in enumerate(SQL_STATEMENTS):
+            try:
+                cursor.execute(sql)
+                logger.debug(f"  Statement {i + 1}/{len(SQL_STATEMENTS)} executed")
+            except Exception as e:
+                logger.error(f"  Statement {i + 1} failed: {e}")
+                conn.rollback()
+                raise
+
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+            (MIGRATION_VERSION, MIGRATION_NAME),
+        )
+        conn.commit()
+
+    logger.info(f"Migration {MIGRATION_VERSION} applied successfully!")
@@ -0,0 +1,165 @@
+"""
+Migration 005: Range-partition activity_log by month.
+
+Each calendar month lives in its own partition (activity_log_pYYYY_MM), so
+day/week queries prune to a single partition and retention drops whole
+partitions instead of DELETEing rows. Rows outside every monthly partition
+land in activity_log_default until ensure_activity_partitions() creates their
+month and moves them over.
+"""
+
+from database.connection import DatabasePool
+from database.migrations.migration_003_daily_summary_rollup import TRIGGER_STATEMENTS
+from utils.logger import setup_logger
+
+logger = setup_logger("migration.005")
+
+MIGRATION_VERSION = 5
+MIGRATION_NAME = "partition_activity_log"
+
+SQL_STATEMENTS = [
+    # ──────────────── Partitioned Table ────────────────
+    "LOCK TABLE activity_log IN ACCESS EXCLUSIVE MODE;",
+    "ALTER TABLE activity_log RENAME TO activity_log_unpartitioned;",
+    """
+    CREATE TABLE activity_log (
+        id INTEGER NOT NULL DEFAULT nextval('activity_log_id_seq'),
+        timestamp TIMESTAMP NOT NULL DEFAULT NOW(),
+        window_title TEXT NOT NULL DEFAULT '',
+        category VARCHAR(20) NOT NULL DEFAULT 'neutral',
+        duration_seconds INTEGER NOT NULL DEFAULT 0,
+        deleted_at TIMESTAMP DEFAULT NULL
+    ) PARTITION BY RANGE (timestamp);
+    """,
+    "CREATE TABLE activity_log_default PARTITION OF activity_log DEFAULT;",
+    # ──────────────── Partition Maintenance ────────────────
+    r"""
+    CREATE OR REPLACE FUNCTION ensure_activity_partitions(from_date DATE, to_date DATE)
+    RETURNS INTEGER LANGUAGE plpgsql AS $$
+    DECLARE
+        month_start DATE := date_trunc('month', from_date);
+        month_end DATE;
+        part_name TEXT;
+        created INTEGER := 0;
+    BEGIN
+        WHILE month_start <= to_date LOOP
+            month_end := month_start + INTERVAL '1 month';
+            part_name := 'activity_log_p' || to_char(month_start, 'YYYY_MM');
+            IF to_regclass(part_name) IS NULL THEN
+                -- Build the partition standalone so rows parked in the default partition
+                -- can be moved in before it is attached
+                EXECUTE format('CREATE TABLE %I (LIKE activity_log INCLUDING DEFAULTS)', part_name);
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM activity_log_default '
+                    'WHERE timestamp >= %L AND timestamp < %L RETURNING *) '
+                    'INSERT INTO %I SELECT * FROM moved',
+                    month_start, month_end, part_name
+                );
+                EXECUTE format(
+                    'ALTER TABLE activity_log ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                    part_name, month_start, month_end
+                );
+                created := created + 1;
+            END IF;
+            month_start := month_end;
+        END LOOP;
+        RETURN created;
+    END;
+    $$;
+    """,
+    r"""
+    CREATE OR REPLACE FUNCTION drop_activity_partitions_before(cutoff DATE)
+    RETURNS INTEGER LANGUAGE plpgsql AS $$
+    DECLARE
+        part RECORD;
+        dropped INTEGER := 0;
+    BEGIN
+        FOR part IN
+            SELECT c.relname,
+                   to_date(substring(c.relname FROM '\d{4}_\d{2}$'), 'YYYY_MM') AS month_start
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'activity_log'::regclass
+              AND c.relname ~ '^activity_log_p\d{4}_\d{2}$'
+            ORDER BY month_start
+        LOOP
+            -- Only partitions that lie entirely before the cutoff are dropped
+            EXIT WHEN part.month_start + INTERVAL '1 month' > cutoff;
+            EXECUTE format('ALTER TABLE activity_log DETACH PARTITION %I', part.relname);
+            EXECUTE format('DROP TABLE %I', part.relname);
+            -- Dropping a partition bypasses the rollup triggers, so clear its days by hand
+            DELETE FROM daily_summary
+            WHERE summary_date >= part.month_start
+              AND summary_date < part.month_start + INTERVAL '1 month';
+            dropped := dropped + 1;
+        END LOOP;
+        -- Stragglers in the default partition are few; delete them through the parent
+        DELETE FROM activity_log
+        WHERE timestamp < cutoff AND tableoid = 'activity_log_default'::regclass;
+        RETURN dropped;
+    END;
+    $$;
+    """,
+    # ──────────────── Data Copy ────────────────
+    """
+    SELECT ensure_activity_partitions(
+        COALESCE((SELECT MIN(timestamp) FROM activity_log_unpartitioned)::date, CURRENT_DATE),
+        (CURRENT_DATE + INTERVAL '3 months')::date
+    );
+    """,
+    # daily_summary already covers these rows and the new table has no triggers yet
+    """
+    INSERT INTO activity_log (id, timestamp, window_title, category, duration_seconds, deleted_at)
+    SELECT id, timestamp, window_title, category, duration_seconds, deleted_at
+    FROM activity_log_unpartitioned;
+    """,
+    "ALTER SEQUENCE activity_log_id_seq OWNED BY activity_log.id;",
+    "DROP TABLE activity_log_unpartitioned;",
+    # ──────────────── Indexes ────────────────
+    # Unique constraints on a partitioned table must include the partition key
+    "ALTER TABLE activity_log ADD PRIMARY KEY (id, timestamp);",
+    """
+    CREATE INDEX idx_activity_ts_covering
+    ON activity_log (timestamp) INCLUDE (category, duration_seconds);
+    """,
+    "CREATE INDEX idx_activity_category ON activity_log (category);",
+    """
+    CREATE INDEX idx_activity_not_deleted
+    ON activity_log (deleted_at) WHERE deleted_at IS NULL;
+    """,
+    *TRIGGER_STATEMENTS,
+    "ANALYZE activity_log;",
+]
+
+
+def run_migration(db_pool: DatabasePool):
+    """Execute migration if not already applied."""
+    logger.info(f"Checking migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    result = db_pool.fetch_one(
+        "SELECT version FROM schema_migrations WHERE version = %s",
+        (MIGRATION_VERSION,),
+    )
+    if result:
+        logger.info(f"Migration {MIGRATION_VERSION} already applied, skipping.")
+        return
+
+    logger.info(f"Applying migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    with db_pool.get_connection() as conn, conn.cursor() as cursor:
+        for i, sql in enumerate(SQL_STATEMENTS):
+            try:
+                cursor.execute(sql)
+                logger.debug(f"  Statement {i + 1}/{len(SQL_STATEMENTS)} executed")
+            except Exception as e:
+                logger.error(f"  Statement {i + 1} failed: {e}")
+                conn.rollback()
+                raise
+
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+            (MIGRATION_VERSION, MIGRATION_NAME),
+        )
+        conn.commit()
+
+    logger.info(f"Migration {MIGRATION_VERSION} applied successfully!")
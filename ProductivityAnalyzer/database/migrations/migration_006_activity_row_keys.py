@@ -0,0 +1,60 @@
+"""
+Migration 006: Idempotent row keys for activity_log.
+
+Each row written by the tracker carries a client-generated UUID, so replaying
+the local spool after an outage (or retrying a batch whose commit was not
+acknowledged) inserts every activity at most once: writes use
+ON CONFLICT (row_key, timestamp) DO NOTHING, and skipped rows never reach the
+daily_summary rollup triggers. Rows logged before this migration keep a NULL key.
+"""
+
+from database.connection import DatabasePool
+from utils.logger import setup_logger
+
+logger = setup_logger("migration.006")
+
+MIGRATION_VERSION = 6
+MIGRATION_NAME = "activity_row_keys"
+
+SQL_STATEMENTS = [
+    # Added to the partitioned parent, so every existing and future partition gets it
+    "ALTER TABLE activity_log ADD COLUMN IF NOT EXISTS row_key UUID;",
+    # Unique indexes on a partitioned table must contain the partition key
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_activity_row_key
+    ON activity_log (row_key, timestamp);
+    """,
+]
+
+
+def run_migration(db_pool: DatabasePool):
+    """Execute migration if not already applied."""
+    logger.info(f"Checking migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    result = db_pool.fetch_one(
+        "SELECT version FROM schema_migrations WHERE version = %s",
+        (MIGRATION_VERSION,),
+    )
+    if result:
+        logger.info(f"Migration {MIGRATION_VERSION} already applied, skipping.")
+        return
+
+    logger.info(f"Applying migration {MIGRATION_VERSION}: {MIGRATION_NAME}")
+
+    with db_pool.get_connection() as conn, conn.cursor() as cursor:
+        for i, sql in enumerate(SQL_STATEMENTS):
+            try:
+                cursor.execute(sql)
+                logger.debug(f"  Statement {i + 1}/{len(SQL_STATEMENTS)} executed")
+            except Exception as e:
+                logger.error(f"  Statement {i + 1} failed: {e}")
+                conn.rollback()
+                raise
+
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+            (MIGRATION_VERSION, MIGRATION_NAME),
+        )
+        conn.commit()
+
+    logger.info(f"Migration {MIGRATION_VERSION} applied successfully!")
@@ -19,6 +19,8 @@ class ActivityLog:
     window_title: str = ""
     category: AppCategory = AppCategory.NEUTRAL
     duration_seconds: int = 0
+    # Client-generated UUID that makes re-inserting the same activity a no-op
+    row_key: str | None = None
 
     @classmethod
     def from_db_row(cls, row: tuple) -> "ActivityLog":
@@ -105,6 +107,19 @@ class DailySummary:
     def total_seconds(self) -> int:
         return self.productive_seconds + self.unproductive_seconds + self.neutral_seconds + self.idle_seconds
 
+    @classmethod
+    def from_db_row(cls, row: tuple) -> "DailySummary":
+        """Create from database tuple (date, productive, unproductive, neutral, idle, entries[, score])."""
+        return cls(
+            date=row[0],
+            productive_seconds=row[1] or 0,
+            unproductive_seconds=row[2] or 0,
+            neutral_seconds=row[3] or 0,
+            idle_seconds=row[4] or 0,
+            total_entries=row[5] or 0,
+            score=float(row[6]) if len(row) > 6 and row[6] is not None else 0.0,
+        )
+
     @property
     def productive_minutes(self) -> float:
         return self.productive_seconds / 60
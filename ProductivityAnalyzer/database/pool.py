@@ -0,0 +1,200 @@
+"""
+Thread-safe, blocking connection pool with usage instrumentation.
+
+The tracker thread, the app blocker thread and the Qt UI thread all share one
+pool, so checkouts are serialized under a condition variable and callers wait
+(up to a timeout) for a connection instead of failing when the pool is full.
+New connections are opened outside the lock, so a slow connect only delays the
+thread that needs it.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+import psycopg2
+from psycopg2.pool import AbstractConnectionPool, PoolError
+
+
+class PoolTimeoutError(PoolError):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time snapshot of connection pool usage."""
+
+    min_connections: int = 0
+    max_connections: int = 0
+    in_use: int = 0
+    idle: int = 0
+    waiting: int = 0
+    peak_in_use: int = 0
+    checkouts: int = 0
+    waited_checkouts: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    total_hold_seconds: float = 0.0
+    max_hold_seconds: float = 0.0
+    connections_opened: int = 0
+    connections_closed: int = 0
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of the pool currently checked out (0.0 - 1.0)."""
+        if self.max_connections <= 0:
+            return 0.0
+        return self.in_use / self.max_connections
+
+    @property
+    def peak_saturation(self) -> float:
+        if self.max_connections <= 0:
+            return 0.0
+        return self.peak_in_use / self.max_connections
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+    @property
+    def avg_hold_seconds(self) -> float:
+        returned = self.checkouts - self.in_use
+        return self.total_hold_seconds / returned if returned > 0 else 0.0
+
+
+class InstrumentedConnectionPool(AbstractConnectionPool):
+    """
+    psycopg2 connection pool that is safe to share between threads.
+
+    getconn() blocks until a connection is free or `timeout` seconds elapse,
+    and every checkout/return is recorded for stats().
+    """
+
+    def __init__(self, minconn: int, maxconn: int, *args, timeout: float = 30.0, **kwargs) -> None:
+        self.timeout = timeout
+        self._cond = threading.Condition()
+        self._checked_out_at: dict[int, float] = {}
+        self._waiting = 0
+        self._peak_in_use = 0
+        self._checkouts = 0
+        self._waited_checkouts = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_hold = 0.0
+        self._max_hold = 0.0
+        self._opened = 0
+        self._closed = 0
+        # Slots reserved by getconn() calls that are opening a connection outside the lock
+        self._connecting = 0
+        with self._cond:
+            super().__init__(minconn, maxconn, *args, **kwargs)
+
+    def _connect(self, key=None):
+        conn = super()._connect(key)
+        self._opened += 1
+        return conn
+
+    def getconn(self, timeout: float | None = None):
+        """Check out a connection, waiting up to `timeout` seconds for one to free up."""
+        timeout = self.timeout if timeout is None else timeout
+        started = time.perf_counter()
+        deadline = started + timeout
+
+        with self._cond:
+            waited = False
+            while not self.closed and not self._pool and len(self._used) + self._connecting >= self.maxconn:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"no connection available after {timeout:.1f}s "
+                        f"({len(self._used) + self._connecting}/{self.maxconn} in use)"
+                    )
+                waited = True
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+            if self.closed or self._pool:
+                conn = self._getconn()
+                return self._checked_out(conn, started, waited)
+            # Reserve the slot, then connect without holding up other checkouts and returns
+            self._connecting += 1
+
+        try:
+            conn = psycopg2.connect(*self._args, **self._kwargs)
+        except BaseException:
+            with self._cond:
+                self._connecting -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._connecting -= 1
+            if self.closed:
+                conn.close()
+                self._cond.notify()
+                raise PoolError("connection pool is closed")
+            key = self._getkey()
+            self._used[key] = conn
+            self._rused[id(conn)] = key
+            self._opened += 1
+            return self._checked_out(conn, started, waited)
+
+    def _checked_out(self, conn, started: float, waited: bool):
+        """Record a checkout of `conn`. Caller holds the lock."""
+        now = time.perf_counter()
+        wait = now - started
+        self._checked_out_at[id(conn)] = now
+        self._checkouts += 1
+        self._waited_checkouts += int(waited)
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        self._peak_in_use = max(self._peak_in_use, len(self._used))
+        return conn
+
+    def putconn(self, conn, close: bool = False) -> None:
+        """Return a connection to the pool and wake one waiting thread."""
+        with self._cond:
+            checked_out_at = self._checked_out_at.pop(id(conn), None)
+            was_open = not conn.closed
+            self._putconn(conn, close=close)
+            if was_open and conn.closed:
+                self._closed += 1
+            if checked_out_at is not None:
+                hold = time.perf_counter() - checked_out_at
+                self._total_hold += hold
+                self._max_hold = max(self._max_hold, hold)
+            self._cond.notify()
+
+    def closeall(self) -> None:
+        """Close every connection, including ones still checked out."""
+        with self._cond:
+            self._closed += sum(1 for conn in self._pool + list(self._used.values()) if not conn.closed)
+            self._closeall()
+            self._cond.notify_all()
+
+    def stats(self) -> PoolStats:
+        """Return a consistent snapshot of the pool counters."""
+        with self._cond:
+            return PoolStats(
+                min_connections=self.minconn,
+                max_connections=self.maxconn,
+                in_use=len(self._used),
+                idle=len(self._pool),
+                waiting=self._waiting,
+                peak_in_use=self._peak_in_use,
+                checkouts=self._checkouts,
+                waited_checkouts=self._waited_checkouts,
+                timeouts=self._timeouts,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+                total_hold_seconds=self._total_hold,
+                max_hold_seconds=self._max_hold,
+                connections_opened=self._opened,
+                connections_closed=self._closed,
+            )
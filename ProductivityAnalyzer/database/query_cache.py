@@ -0,0 +1,171 @@
+# database/query_cache.py
+"""
+Read-through cache for repository queries.
+
+Results are keyed by (query, params). Every table has a write counter that
+DatabasePool bumps after each committed write; a cached result remembers the
+counters of the tables it read and is discarded as soon as one of them moves.
+Entries also expire after a TTL (which bounds staleness from writes made
+outside this process) and the least recently used ones are evicted beyond
+`max_entries`.
+
+Queries over days that are fully in the past get the longer PAST_TTL: they
+only change through writes, and this process's own writes invalidate them at
+once. Writes from other processes (the recategorizer and rebuild_summaries
+commands, a second app instance) show up once PAST_TTL expires.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, TypeVar
+
+from config.settings import db_config
+
+T = TypeVar("T")
+
+FOREVER = math.inf
+DEFAULT_TTL = db_config.cache_ttl
+PAST_TTL = db_config.cache_past_ttl
+
+_READ_TABLES = re.compile(r"\b(?:FROM|JOIN)\s+([a-z_][a-z0-9_]*)", re.IGNORECASE)
+_WRITE_TABLES = re.compile(
+    r"\b(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM|COPY|TRUNCATE(?:\s+TABLE)?|LOCK\s+TABLE)\s+([a-z_][a-z0-9_]*)",
+    re.IGNORECASE,
+)
+# Monthly partitions (activity_log_p2026_03, activity_log_default) count as their parent table
+_PARTITION = re.compile(r"^(\w+?)_(?:p\d{4}_\d{2}|default)$")
+
+# Tables that triggers write to whenever the key table is written
+TRIGGERED_WRITES = {"activity_log": ("daily_summary",)}
+
+
+def range_ttl(end_date: date) -> float:
+    """Cache lifetime for a query over days up to `end_date`: closed days change rarely, so they live longer."""
+    return PAST_TTL if end_date < date.today() else DEFAULT_TTL
+
+
+def _tables(pattern: re.Pattern[str], query: str) -> frozenset[str]:
+    tables = set()
+    for name in pattern.findall(query):
+        name = name.lower()
+        match = _PARTITION.match(name)
+        tables.add(match.group(1) if match else name)
+    return frozenset(tables)
+
+
+@dataclass(frozen=True)
+class QueryCacheStats:
+    """Hit/miss counters and current size of the query cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+    max_entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    versions: tuple[int, ...]
+    expires: float
+
+
+class QueryCache:
+    """Thread-safe LRU of query results, invalidated by per-table write counters."""
+
+    def __init__(self, max_entries: int = 256, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._tables_of: dict[str, tuple[str, ...]] = {}
+        self._versions: dict[str, int] = {}
+        # Bumped by writes whose tables cannot be told (e.g. SELECT some_function()); stales everything
+        self._global_version = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get_or_load(self, query: str, params: Any, ttl: float, load: Callable[[], T | None]) -> T | None:
+        """
+        Return the cached result of `query` with `params`, or call `load()` and cache what it
+        returns. A None result (a failed query) is never cached.
+        """
+        key = (query, params)
+        try:
+            hash(key)
+        except TypeError:
+            return load()
+
+        with self._lock:
+            tables = self._tables_of.get(query)
+            if tables is None:
+                tables = self._tables_of[query] = tuple(sorted(_tables(_READ_TABLES, query)))
+            versions = self._versions_locked(tables)
+            entry = self._entries.get(key)
+            if entry is not None and entry.versions == versions and entry.expires > self._clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.value  # type: ignore[no-any-return]
+            self._misses += 1
+
+        # Versions were taken before the query ran, so a write that lands meanwhile stales the result
+        value = load()
+        if value is None:
+            return None
+        with self._lock:
+            self._entries[key] = _Entry(value, versions, self._clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def record_write(self, *queries: str) -> None:
+        """Invalidate cached results that read any table the committed `queries` wrote to."""
+        tables: set[str] = set()
+        for query in queries:
+            tables |= _tables(_WRITE_TABLES, query)
+        for table in list(tables):
+            tables.update(TRIGGERED_WRITES.get(table, ()))
+        with self._lock:
+            if tables:
+                for table in tables:
+                    self._versions[table] = self._versions.get(table, 0) + 1
+            else:
+                self._global_version += 1
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> QueryCacheStats:
+        with self._lock:
+            return QueryCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def _versions_locked(self, tables: tuple[str, ...]) -> tuple[int, ...]:
+        return (self._global_version, *(self._versions.get(table, 0) for table in tables))
@@ -0,0 +1,34 @@
+"""
+Rebuild the daily_summary rollup from raw activity_log history.
+
+Usage:
+    python -m database.rebuild_summaries [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+"""
+
+import argparse
+import sys
+from datetime import date
+
+from database.connection import DatabasePool
+from database.repositories.daily_summary_repo import DailySummaryRepository
+from utils.logger import setup_logger
+
+logger = setup_logger("database.rebuild_summaries")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the daily_summary rollup table.")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="First day (default: all)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="Last day (default: all)")
+    args = parser.parse_args(argv)
+
+    db_pool = DatabasePool()
+    try:
+        success = DailySummaryRepository(db_pool).rebuild(args.start, args.end)
+    finally:
+        db_pool.close_all()
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,13 @@
 # database/repositories/__init__.py
-from database.repositories.activity_repo import ActivityRepository
+from database.repositories.activity_repo import ActivityRepository, BulkLoadResult
+from database.repositories.daily_summary_repo import DailySummaryRepository
 from database.repositories.focus_settings_repo import FocusSettingsRepository
 from database.repositories.goals_repo import GoalsRepository
 
-__all__ = ["ActivityRepository", "FocusSettingsRepository", "GoalsRepository"]
+__all__ = [
+    "ActivityRepository",
+    "BulkLoadResult",
+    "DailySummaryRepository",
+    "FocusSettingsRepository",
+    "GoalsRepository",
+]
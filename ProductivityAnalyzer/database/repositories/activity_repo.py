@@ -3,26 +3,135 @@
 Repository for activity_log table operations.
 """
 
-from datetime import date
+import csv
+import io
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import islice
 
 from database.connection import DatabasePool
 from database.models import ActivityLog
+from database.query_cache import range_ttl
 from utils.logger import setup_logger
 
 logger = setup_logger("repo.activity")
 
+# Bulk loads go through a staging table so rows whose row_key already exists are skipped
+COPY_STAGING_PROLOGUE = (
+    """
+    CREATE TEMPORARY TABLE activity_log_staging
+        (row_key UUID, timestamp TIMESTAMP, window_title TEXT, category VARCHAR(20), duration_seconds INTEGER)
+    ON COMMIT DROP
+    """,
+)
+
+COPY_ACTIVITY_SQL = """
+    COPY activity_log_staging (row_key, timestamp, window_title, category, duration_seconds)
+    FROM STDIN WITH (FORMAT csv, FORCE_NULL (row_key))
+"""
+
+COPY_STAGING_EPILOGUE = (
+    """
+    INSERT INTO activity_log (row_key, timestamp, window_title, category, duration_seconds)
+    SELECT row_key, timestamp, window_title, category, duration_seconds FROM activity_log_staging
+    ON CONFLICT (row_key, timestamp) DO NOTHING
+    """,
+)
+
+# Set-based category rewrite; rows are (id, timestamp, category) so each one prunes to its partition
+UPDATE_CATEGORIES_SQL = """
+    UPDATE activity_log AS a SET category = v.category
+    FROM (VALUES %s) AS v(id, timestamp, category)
+    WHERE a.id = v.id AND a.timestamp = v.timestamp
+"""
+
+
+def day_bounds(start_date: date, end_date: date) -> tuple[datetime, datetime]:
+    """
+    Half-open timestamp range [start_date 00:00, end_date + 1 day 00:00) covering whole days.
+    Filtering on `timestamp >= lower AND timestamp < upper` lets the planner use the
+    timestamp indexes, unlike DATE(timestamp) = / BETWEEN.
+    """
+    lower = datetime.combine(start_date, datetime.min.time())
+    if end_date == date.max:
+        return lower, datetime.max
+    return lower, datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+
+
+@dataclass(frozen=True)
+class BulkLoadResult:
+    """Outcome of a COPY-based bulk load."""
+
+    rows: int = 0
+    seconds: float = 0.0
+    success: bool = True
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class _ActivityCsvStream:
+    """
+    Read-only file-like object that renders ActivityLog rows as CSV on demand,
+    so COPY FROM STDIN can consume an arbitrarily large iterable in constant memory.
+    """
+
+    def __init__(self, activities: Iterable[ActivityLog], rows_per_chunk: int = 1000) -> None:
+        self._activities: Iterator[ActivityLog] = iter(activities)
+        self._rows_per_chunk = rows_per_chunk
+        self._pending = ""
+        self._chunk = io.StringIO()
+        # QUOTE_NONNUMERIC keeps empty titles as "" (empty string) instead of NULL
+        self._writer = csv.writer(self._chunk, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+        self.rows = 0
+
+    def _render_more(self) -> bool:
+        batch = list(islice(self._activities, self._rows_per_chunk))
+        if not batch:
+            return False
+        for a in batch:
+            self._writer.writerow(
+                (
+                    # Rows without a key are written as "" and loaded as NULL (FORCE_NULL)
+                    a.row_key or "",
+                    a.timestamp.isoformat(sep=" "),
+                    a.window_title.replace("\x00", ""),
+                    a.category.value,
+                    int(a.duration_seconds),
+                )
+            )
+        self.rows += len(batch)
+        self._pending += self._chunk.getvalue()
+        self._chunk.seek(0)
+        self._chunk.truncate()
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while (size < 0 or len(self._pending) < size) and self._render_more():
+            pass
+        if size < 0:
+            data, self._pending = self._pending, ""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
 
 class ActivityRepository:
     def __init__(self, db_pool: DatabasePool):
         self.db = db_pool
 
     def log_activity(self, activity: ActivityLog) -> bool:
-        """Insert a new activity log entry."""
+        """Insert a new activity log entry (a no-op if its row_key was already logged)."""
         query = """
-            INSERT INTO activity_log (timestamp, window_title, category, duration_seconds)
-            VALUES (%s, %s, %s, %s)
+            INSERT INTO activity_log (row_key, timestamp, window_title, category, duration_seconds)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (row_key, timestamp) DO NOTHING
         """
         params = (
+            activity.row_key,
             activity.timestamp,
             activity.window_title,
             activity.category.value,
@@ -33,28 +142,177 @@ class ActivityRepository:
             logger.debug(f"Logged: [{activity.category.value}] {activity.window_title[:50]}")
         return success
 
+    def log_activities(self, activities: list[ActivityLog]) -> bool:
+        """Insert many activity log entries with a single multi-row INSERT, skipping known row_keys."""
+        query = """
+            INSERT INTO activity_log (row_key, timestamp, window_title, category, duration_seconds)
+            VALUES %s
+            ON CONFLICT (row_key, timestamp) DO NOTHING
+        """
+        rows = [
+            (a.row_key, a.timestamp, a.window_title, a.category.value, a.duration_seconds) for a in activities
+        ]
+        success = self.db.execute_values(query, rows)
+        if success:
+            logger.debug(f"Logged {len(rows)} activities in one batch")
+        return success
+
+    def bulk_load_activities(self, activities: Iterable[ActivityLog]) -> BulkLoadResult:
+        """
+        Stream many activity entries into activity_log with COPY FROM STDIN.
+        Used for history imports, backfills and replaying buffered tracker data;
+        rows whose row_key is already logged are skipped.
+        """
+        stream = _ActivityCsvStream(activities)
+        started = time.perf_counter()
+        copied = self.db.copy_from(
+            COPY_ACTIVITY_SQL, stream, prologue=COPY_STAGING_PROLOGUE, epilogue=COPY_STAGING_EPILOGUE
+        )
+        elapsed = time.perf_counter() - started
+
+        if copied is None:
+            logger.error(f"Bulk load failed after {stream.rows} rows")
+            return BulkLoadResult(rows=0, seconds=elapsed, success=False)
+
+        result = BulkLoadResult(rows=copied if copied >= 0 else stream.rows, seconds=elapsed)
+        logger.info(
+            f"Bulk loaded {result.rows} activities in {elapsed:.2f}s ({result.rows_per_second:,.0f} rows/s)"
+        )
+        return result
+
     def get_activities_by_date(self, target_date: date) -> list[ActivityLog]:
         """Get all activities for a specific date."""
         query = """
             SELECT id, timestamp, window_title, category, duration_seconds
             FROM activity_log
-            WHERE DATE(timestamp) = %s
+            WHERE timestamp >= %s AND timestamp < %s
             ORDER BY timestamp DESC
         """
-        rows = self.db.fetch_all(query, (target_date,))
+        rows = self.db.fetch_all(query, day_bounds(target_date, target_date))
         return [ActivityLog.from_db_row(row) for row in rows]
 
+    def get_activities_page(
+        self,
+        target_date: date,
+        category: str | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 200,
+    ) -> list[ActivityLog]:
+        """
+        One page of a day's activities, newest first, optionally of one category.
+        `after` is the (timestamp, id) of the last row of the previous page (keyset pagination),
+        so every page costs the same however deep the user has scrolled.
+        """
+        query = """
+            SELECT id, timestamp, window_title, category, duration_seconds
+            FROM activity_log
+            WHERE timestamp >= %s AND timestamp < %s
+        """
+        params: tuple = day_bounds(target_date, target_date)
+        if category:
+            query += " AND category = %s"
+            params += (category,)
+        if after is not None:
+            query += " AND (timestamp, id) < (%s, %s)"
+            params += after
+        query += " ORDER BY timestamp DESC, id DESC LIMIT %s"
+        rows = self.db.fetch_all(query, (*params, limit))
+        return [ActivityLog.from_db_row(row) for row in rows]
+
+    def count_activities(self, target_date: date, category: str | None = None) -> int:
+        """Number of activities on a day, optionally of one category."""
+        query = "SELECT COUNT(*) FROM activity_log WHERE timestamp >= %s AND timestamp < %s"
+        params: tuple = day_bounds(target_date, target_date)
+        if category:
+            query += " AND category = %s"
+            params += (category,)
+        result = self.db.fetch_one(query, params)
+        return result[0] if result else 0
+
     def get_activities_date_range(self, start_date: date, end_date: date) -> list[ActivityLog]:
         """Get activities within a date range."""
         query = """
             SELECT id, timestamp, window_title, category, duration_seconds
             FROM activity_log
-            WHERE DATE(timestamp) BETWEEN %s AND %s
+            WHERE timestamp >= %s AND timestamp < %s
             ORDER BY timestamp DESC
         """
-        rows = self.db.fetch_all(query, (start_date, end_date))
+        rows = self.db.fetch_all(query, day_bounds(start_date, end_date))
         return [ActivityLog.from_db_row(row) for row in rows]
 
+    def iter_activities(
+        self, start_date: date, end_date: date, itersize: int = 2000
+    ) -> Iterator[ActivityLog]:
+        """Stream activities within a date range without loading them all into memory."""
+        query = """
+            SELECT id, timestamp, window_title, category, duration_seconds
+            FROM activity_log
+            WHERE timestamp >= %s AND timestamp < %s
+            ORDER BY timestamp DESC
+        """
+        for row in self.db.iter_query(query, day_bounds(start_date, end_date), itersize=itersize):
+            yield ActivityLog.from_db_row(row)
+
+    def iter_categorized_titles(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        title_contains: str | None = None,
+        itersize: int = 2000,
+    ) -> Iterator[tuple[int, datetime, str, str]]:
+        """
+        Yield (id, timestamp, window_title, category) for recategorization, oldest first.
+        `title_contains` restricts to titles containing a lower-case keyword.
+
+        Rows are read in keyset pages of `itersize`, each one in full before it is yielded, so no
+        connection is held while the caller writes its changes back (even with a one-connection pool).
+        """
+        query = """
+            SELECT id, timestamp, window_title, category
+            FROM activity_log
+            WHERE timestamp >= %s AND timestamp < %s
+        """
+        params: tuple = day_bounds(start_date or date.min, end_date or date.max)
+        if title_contains:
+            query += " AND strpos(lower(window_title), %s) > 0"
+            params += (title_contains,)
+        after: tuple = ()
+        while True:
+            page_query = query + (" AND (timestamp, id) > (%s, %s)" if after else "")
+            page_query += " ORDER BY timestamp, id LIMIT %s"
+            page = list(self.db.iter_query(page_query, (*params, *after, itersize), itersize=itersize))
+            yield from page
+            if len(page) < itersize:
+                return
+            after = (page[-1][1], page[-1][0])
+
+    def update_categories(self, rows: list[tuple[int, datetime, str]]) -> bool:
+        """Rewrite the category of many rows at once; `rows` are (id, timestamp, category)."""
+        if not rows:
+            return True
+        return self.db.execute_values(UPDATE_CATEGORIES_SQL, rows, page_size=1000)
+
+    def set_category_for_keyword(
+        self, keyword: str, category: str, from_categories: list[str], exclude_titles: tuple[str, ...] = ()
+    ) -> int | None:
+        """
+        Move every row whose title contains `keyword` and whose category is one of
+        `from_categories` to `category`, in a single statement. Returns rows changed, or None on error.
+        """
+        query = """
+            WITH changed AS (
+                UPDATE activity_log SET category = %s
+                WHERE strpos(lower(window_title), %s) > 0
+                  AND category = ANY(%s)
+                  AND window_title <> ALL(%s)
+                RETURNING 1
+            )
+            SELECT COUNT(*) FROM changed
+        """
+        return self.db.execute_query_returning(
+            query, (category, keyword, list(from_categories), list(exclude_titles))
+        )
+
     def get_recent_activities(self, limit: int = 50) -> list[ActivityLog]:
         """Get the most recent activities."""
         query = """
@@ -71,34 +329,37 @@ class ActivityRepository:
         query = """
             SELECT category, COUNT(*) as entry_count, COALESCE(SUM(duration_seconds), 0) as total_seconds
             FROM activity_log
-            WHERE DATE(timestamp) BETWEEN %s AND %s
+            WHERE timestamp >= %s AND timestamp < %s
             GROUP BY category
         """
-        rows = self.db.fetch_all(query, (start_date, end_date))
+        rows = self.db.fetch_all(query, day_bounds(start_date, end_date), cache_ttl=range_ttl(end_date))
         return {row[0]: {"count": row[1], "total_seconds": row[2]} for row in rows}
 
-    def get_top_apps(self, target_date: date, category: str | None = None, limit: int = 10) -> list[dict]:
-        """Get top applications by time spent."""
+    def get_top_apps(
+        self, target_date: date, category: str | None = None, limit: int | None = 10
+    ) -> list[dict]:
+        """Get top applications by time spent (every application when limit is None)."""
+        lower, upper = day_bounds(target_date, target_date)
         if category:
             query = """
                 SELECT window_title, COUNT(*) as count, COALESCE(SUM(duration_seconds), 0) as total
                 FROM activity_log
-                WHERE DATE(timestamp) = %s AND category = %s
+                WHERE timestamp >= %s AND timestamp < %s AND category = %s
                 GROUP BY window_title
                 ORDER BY total DESC
                 LIMIT %s
             """
-            rows = self.db.fetch_all(query, (target_date, category, limit))
+            rows = self.db.fetch_all(query, (lower, upper, category, limit), cache_ttl=range_ttl(target_date))
         else:
             query = """
                 SELECT window_title, COUNT(*) as count, COALESCE(SUM(duration_seconds), 0) as total
                 FROM activity_log
-                WHERE DATE(timestamp) = %s
+                WHERE timestamp >= %s AND timestamp < %s
                 GROUP BY window_title
                 ORDER BY total DESC
                 LIMIT %s
             """
-            rows = self.db.fetch_all(query, (target_date, limit))
+            rows = self.db.fetch_all(query, (lower, upper, limit), cache_ttl=range_ttl(target_date))
 
         return [{"window_title": r[0], "count": r[1], "total_seconds": r[2]} for r in rows]
 
@@ -114,13 +375,26 @@ class ActivityRepository:
         rows = self.db.fetch_all(query, (days,))
         return [{"date": r[0], "category": r[1], "count": r[2]} for r in rows]
 
-    def cleanup_old_logs(self, retention_days: int = 90) -> bool:
-        """Delete logs older than retention period."""
-        query = "DELETE FROM activity_log WHERE timestamp < NOW() - INTERVAL '%s days'"
-        success = self.db.execute_query(query, (retention_days,))
-        if success:
-            logger.info(f"Cleaned up logs older than {retention_days} days")
-        return success
+    def ensure_partitions(self, months_ahead: int = 3) -> int:
+        """Create monthly activity_log partitions from this month through `months_ahead` months out."""
+        today = date.today()
+        query = "SELECT ensure_activity_partitions(%s, (%s + %s * INTERVAL '1 month')::date)"
+        created = self.db.execute_query_returning(query, (today, today, months_ahead))
+        if created:
+            logger.info(f"Created {created} activity_log partition(s)")
+        return created or 0
+
+    def cleanup_old_logs(self, retention_days: int = 90) -> int | None:
+        """
+        Drop logs older than the retention period. Returns the number of monthly partitions dropped,
+        or None on error. Whole months are dropped, so a month is kept until all of it has expired.
+        """
+        cutoff = date.today() - timedelta(days=retention_days)
+        dropped = self.db.execute_query_returning("SELECT drop_activity_partitions_before(%s)", (cutoff,))
+        if dropped is None:
+            return None
+        logger.info(f"Cleaned up logs older than {retention_days} days ({dropped} partition(s) dropped)")
+        return int(dropped)
 
     def get_total_count(self) -> int:
         """Get total number of activity log entries."""
@@ -0,0 +1,64 @@
+"""
+Repository for the daily_summary rollup table.
+
+Rows are kept current by triggers on activity_log (migration 003), so readers
+get one pre-aggregated row per day instead of scanning raw logs. The table is
+owned by those triggers: nothing but them and rebuild() may write its totals,
+or the deltas applied afterwards drift from activity_log. Scores are not
+stored; ReportGenerator derives them from the totals when reading.
+"""
+
+from datetime import date
+
+from database.connection import DatabasePool
+from database.models import DailySummary
+from database.query_cache import range_ttl
+from database.repositories.activity_repo import day_bounds
+from utils.logger import setup_logger
+
+logger = setup_logger("repo.daily_summary")
+
+
+class DailySummaryRepository:
+    def __init__(self, db_pool: DatabasePool):
+        self.db = db_pool
+
+    def get_summaries(self, start_date: date, end_date: date) -> list[DailySummary]:
+        """Get rolled-up totals for each day in a range that has activity (score is not set)."""
+        query = """
+            SELECT summary_date, productive_seconds, unproductive_seconds, neutral_seconds,
+                   idle_seconds, total_entries
+            FROM daily_summary
+            WHERE summary_date BETWEEN %s AND %s AND total_entries > 0
+            ORDER BY summary_date
+        """
+        rows = self.db.fetch_all(query, (start_date, end_date), cache_ttl=range_ttl(end_date))
+        return [DailySummary.from_db_row(row) for row in rows]
+
+    def rebuild(self, start_date: date | None = None, end_date: date | None = None) -> bool:
+        """
+        Recompute the rollup from activity_log for a date range (all history by default).
+        Writers are blocked for the duration so no delta is applied twice or lost.
+        """
+        start_date = start_date or date.min
+        end_date = end_date or date.max
+        query = """
+            LOCK TABLE activity_log IN SHARE MODE;
+            DELETE FROM daily_summary WHERE summary_date BETWEEN %s AND %s;
+            INSERT INTO daily_summary
+                (summary_date, productive_seconds, unproductive_seconds, neutral_seconds,
+                 idle_seconds, total_entries)
+            SELECT DATE(timestamp),
+                   COALESCE(SUM(duration_seconds) FILTER (WHERE category = 'productive'), 0),
+                   COALESCE(SUM(duration_seconds) FILTER (WHERE category = 'unproductive'), 0),
+                   COALESCE(SUM(duration_seconds) FILTER (WHERE category = 'neutral'), 0),
+                   COALESCE(SUM(duration_seconds) FILTER (WHERE category = 'idle'), 0),
+                   COUNT(*)
+            FROM activity_log
+            WHERE timestamp >= %s AND timestamp < %s
+            GROUP BY DATE(timestamp);
+        """
+        success = self.db.execute_query(query, (start_date, end_date, *day_bounds(start_date, end_date)))
+        if success:
+            logger.info(f"Rebuilt daily_summary rollup for {start_date} .. {end_date}")
+        return success
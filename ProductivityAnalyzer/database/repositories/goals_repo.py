@@ -5,6 +5,7 @@ Repository for goals table operations.
 
 from database.connection import DatabasePool
 from database.models import ProductivityGoal
+from database.query_cache import DEFAULT_TTL
 from utils.logger import setup_logger
 
 logger = setup_logger("repo.goals")
@@ -37,7 +38,7 @@ class GoalsRepository:
             WHERE is_active = TRUE
             ORDER BY created_at DESC
         """
-        rows = self.db.fetch_all(query)
+        rows = self.db.fetch_all(query, cache_ttl=DEFAULT_TTL)
         return [ProductivityGoal.from_db_row(row) for row in rows]
 
     def get_all_goals(self) -> list[ProductivityGoal]:
@@ -47,7 +48,7 @@ class GoalsRepository:
             FROM goals
             ORDER BY created_at DESC
         """
-        rows = self.db.fetch_all(query)
+        rows = self.db.fetch_all(query, cache_ttl=DEFAULT_TTL)
         return [ProductivityGoal.from_db_row(row) for row in rows]
 
     def get_goal_by_id(self, goal_id: int) -> ProductivityGoal | None:
@@ -6,6 +6,7 @@ ProductivityAnalyzer v2.0 — Entry Point
 import os
 import sys
 
+from PyQt5.QtCore import QObject, QTimer
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication
 
@@ -13,11 +14,21 @@ from config.settings import app_config
 from database.connection import DatabasePool
 from database.migrations.migration_001_initial_schema import run_migration as run_migration_001
 from database.migrations.migration_002_soft_deletes import run_migration as run_migration_002
+from database.migrations.migration_003_daily_summary_rollup import run_migration as run_migration_003
+from database.migrations.migration_004_covering_indexes import run_migration as run_migration_004
+from database.migrations.migration_005_partition_activity_log import run_migration as run_migration_005
+from database.migrations.migration_006_activity_row_keys import run_migration as run_migration_006
+from database.repositories.activity_repo import ActivityRepository
+from ui.data_loader import DataLoader
 from ui.main_window import MainWindow
 from utils.logger import setup_logger
+from utils.startup_trace import StartupTrace
 
 logger = setup_logger("main")
 
+# Partitions are created three months ahead; re-checking daily keeps a long-running app ahead of the calendar
+PARTITION_CHECK_MS = 24 * 60 * 60 * 1000
+
 # ── Sentry Error Tracking (optional) ──
 SENTRY_DSN = os.getenv("SENTRY_DSN", "")
 if SENTRY_DSN:
@@ -35,16 +46,46 @@ if SENTRY_DSN:
         logger.warning("sentry-sdk not installed, error tracking disabled")
 
 
+def run_migrations(db_pool: DatabasePool) -> None:
+    """Bring the schema up to date; safe to run on every start."""
+    run_migration_001(db_pool)
+    run_migration_002(db_pool)
+    run_migration_003(db_pool)
+    run_migration_004(db_pool)
+    run_migration_005(db_pool)
+    run_migration_006(db_pool)
+    ActivityRepository(db_pool).ensure_partitions()
+
+
+def schedule_partition_maintenance(
+    db_pool: DatabasePool, parent: QObject, interval_ms: int = PARTITION_CHECK_MS
+) -> QTimer:
+    """Re-run ensure_partitions() periodically off the GUI thread, so no month lands in the default partition."""
+    repo = ActivityRepository(db_pool)
+    loader = DataLoader("partitions", parent=parent)
+    timer = QTimer(parent)
+    timer.setInterval(interval_ms)
+
+    def check() -> None:
+        loader.load(repo.ensure_partitions, lambda _created: None)
+
+    timer.timeout.connect(check)
+    timer.start()
+    return timer
+
+
 def main():
     """Application entry point."""
+    trace = StartupTrace()
     logger.info("=" * 50)
     logger.info("ProductivityAnalyzer v2.0 Starting...")
     logger.info("=" * 50)
 
     # 1. Create Qt Application
-    app = QApplication(sys.argv)
-    app.setApplicationName("ProductivityAnalyzer")
-    app.setApplicationVersion("2.0.0")
+    with trace.phase("qt_app"):
+        app = QApplication(sys.argv)
+        app.setApplicationName("ProductivityAnalyzer")
+        app.setApplicationVersion("2.0.0")
 
     # Set app icon if exists
     icon_path = os.path.join(os.path.dirname(__file__), "assets", "icon.png")
@@ -54,7 +95,8 @@ def main():
     # 2. Initialize Database Pool
     db_pool = None
     try:
-        db_pool = DatabasePool()
+        with trace.phase("database_pool"):
+            db_pool = DatabasePool()
         logger.info("Database pool initialized successfully")
     except Exception as e:
         logger.critical(f"Failed to initialize database: {e}")
@@ -67,18 +109,12 @@ def main():
         )
         sys.exit(1)
 
-    # 3. Run Migrations
+    # 3. Create and Show Main Window (pages are built as they are first shown)
     try:
-        run_migration_001(db_pool)
-        run_migration_002(db_pool)
-        logger.info("Database migrations completed")
-    except Exception as e:
-        logger.error(f"Migration error: {e}", exc_info=True)
-
-    # 4. Create and Show Main Window
-    try:
-        window = MainWindow(db_pool=db_pool)
-        window.show()
+        with trace.phase("main_window"):
+            window = MainWindow(db_pool=db_pool)
+            window.show()
+        trace.mark("window_shown")
         logger.info("Main window displayed")
     except Exception as e:
         logger.critical(f"Failed to create main window: {e}", exc_info=True)
@@ -86,6 +122,32 @@ def main():
             db_pool.close_all()
         sys.exit(1)
 
+    # 4. Run Migrations off the GUI thread; tracking and the first dashboard load wait for them
+    def on_dashboard_shown() -> None:
+        window.dashboard_widget.data_shown.disconnect(on_dashboard_shown)
+        trace.end("first_dashboard_load")
+        trace.log_summary()
+
+    def on_migrations_done(_result: object) -> None:
+        trace.end("migrations")
+        logger.info("Database migrations completed")
+        start_window()
+
+    def on_migrations_failed(error: Exception) -> None:
+        trace.end("migrations")
+        logger.error(f"Migration error: {error}", exc_info=error)
+        start_window()
+
+    def start_window() -> None:
+        trace.begin("first_dashboard_load")
+        window.dashboard_widget.data_shown.connect(on_dashboard_shown)
+        window.start()
+        schedule_partition_maintenance(db_pool, window)
+
+    trace.begin("migrations")
+    migration_loader = DataLoader("migrations", parent=window)
+    migration_loader.load(lambda: run_migrations(db_pool), on_migrations_done, on_migrations_failed)
+
     # 5. Run Event Loop
     exit_code = app.exec_()
 
@@ -1,4 +1,11 @@
 # reporting/__init__.py
-from reporting.report_generator import ReportGenerator
+from typing import TYPE_CHECKING
+
+from utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from reporting.report_generator import ReportGenerator
+
+__getattr__, __dir__ = lazy_exports(__name__, {"ReportGenerator": "reporting.report_generator"})
 
 __all__ = ["ReportGenerator"]
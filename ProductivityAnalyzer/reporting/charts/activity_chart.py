@@ -3,73 +3,109 @@
 Bar chart showing activity counts per day.
 """
 
+from __future__ import annotations
+
 from datetime import date
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+import numpy as np
+from matplotlib.collections import PolyCollection
 
-from config.constants import CHART_COLORS, AppCategory
+from config.constants import CHART_COLORS
+from reporting.charts.activity_counts import CATEGORIES, DailyCountMatrix
+from reporting.charts.base import BaseChart
 from utils.logger import setup_logger
 
 logger = setup_logger("charts.activity")
 
+BAR_WIDTH = 0.2
+# Beyond this many dates only every n-th one gets a tick label
+MAX_DATE_LABELS = 15
+
+
+def _bar_vertices(x: np.ndarray, heights: np.ndarray) -> np.ndarray:
+    """Corners of one bar per (x, height) pair, as an (n, 4, 2) array for a PolyCollection."""
+    vertices = np.empty((len(x), 4, 2))
+    vertices[:, :, 0] = x[:, None] + np.array([0.0, 0.0, BAR_WIDTH, BAR_WIDTH])
+    vertices[:, :, 1] = heights[:, None] * np.array([0.0, 1.0, 1.0, 0.0])
+    return vertices
+
+
+class ActivityBarChart(BaseChart[DailyCountMatrix]):
+    """
+    Matplotlib bar chart showing daily activity per category.
+
+    Each category's bars are one PolyCollection built from the count matrix with
+    numpy, rather than one Rectangle artist per bar, so long or hourly ranges
+    plot and update in time linear in the number of bars with a small constant.
+    """
+
+    def __init__(self, daily_counts: DailyCountMatrix | list, width: float = 8, height: float = 4) -> None:
+        self._bars: list[PolyCollection] = []
+        super().__init__(self._as_matrix(daily_counts), width, height)
+
+    def update(self, data: DailyCountMatrix | list) -> None:
+        super().update(self._as_matrix(data))
 
-class ActivityBarChart(FigureCanvas):
-    """Matplotlib bar chart embedded in a Qt widget showing daily activity."""
-
-    def __init__(self, daily_counts: list, parent=None, width=8, height=4):
-        self.fig = Figure(figsize=(width, height), dpi=100)
-        self.fig.patch.set_facecolor("#f4f4f9")
-        super().__init__(self.fig)
-        self.setParent(parent)
-        self._plot(daily_counts)
-
-    def _plot(self, daily_counts: list):
-        """
-        daily_counts: list of dicts with keys: date, category, count
-        """
-        ax = self.fig.add_subplot(111)
-
-        if not daily_counts:
-            ax.text(0.5, 0.5, "No data available", ha="center", va="center", fontsize=14, color="#999")
-            ax.set_axis_off()
-            return
-
-        # Organize data by date and category
-        dates = sorted(set(d["date"] for d in daily_counts))
-        categories = [AppCategory.PRODUCTIVE, AppCategory.UNPRODUCTIVE, AppCategory.NEUTRAL, AppCategory.IDLE]
-
-        date_labels = [d.strftime("%m/%d") if isinstance(d, date) else str(d) for d in dates]
-        x_positions = range(len(dates))
-        bar_width = 0.2
-
-        for i, cat in enumerate(categories):
-            counts = []
-            for d in dates:
-                val = next(
-                    (
-                        item["count"]
-                        for item in daily_counts
-                        if item["date"] == d and item["category"] == cat.value
-                    ),
-                    0,
-                )
-                counts.append(val)
-            offset = (i - 1.5) * bar_width
-            ax.bar(
-                [x + offset for x in x_positions],
-                counts,
-                bar_width,
-                label=cat.value.capitalize(),
-                color=CHART_COLORS[cat].lstrip("#"),
+    @staticmethod
+    def _as_matrix(data: DailyCountMatrix | list) -> DailyCountMatrix:
+        """Accept raw get_daily_counts() rows too; they are pivoted once, up front."""
+        return data if isinstance(data, DailyCountMatrix) else DailyCountMatrix.from_rows(data)
+
+    def _plot(self, matrix: DailyCountMatrix) -> bool:
+        ax = self.ax
+
+        if not len(matrix):
+            self._show_message("No data available", color="#999")
+            return False
+
+        self._bars = []
+        for i, category in enumerate(CATEGORIES):
+            bars = PolyCollection(
+                self._vertices(matrix, i),  # type: ignore[arg-type]
+                facecolors=CHART_COLORS[category],
                 alpha=0.85,
+                label=category.value.capitalize(),
             )
+            ax.add_collection(bars)
+            self._bars.append(bars)
 
         ax.set_xlabel("Date", fontsize=10)
         ax.set_ylabel("Activity Count", fontsize=10)
         ax.set_title("Daily Activity Breakdown", fontsize=13, fontweight="bold")
-        ax.set_xticks(list(x_positions))
-        ax.set_xticklabels(date_labels, rotation=45, ha="right")
-        ax.legend(fontsize=8)
+        self._set_limits(matrix)
+        # loc="best" tests every bar against every candidate spot, which dominates long ranges
+        ax.legend(fontsize=8, loc="upper left")
         ax.grid(axis="y", alpha=0.3)
         self.fig.tight_layout()
+        return True
+
+    def _update_artists(self, matrix: DailyCountMatrix) -> bool:
+        if not len(matrix) or not self._bars:
+            return False
+        # A PolyCollection takes any number of bars, so a new range is updated in place as well
+        for i, bars in enumerate(self._bars):
+            # An (n, 4, 2) array takes matplotlib's vectorized path; the stubs only list sequences
+            bars.set_verts(self._vertices(matrix, i))  # type: ignore[arg-type]
+        self._set_limits(matrix)
+        return True
+
+    @staticmethod
+    def _vertices(matrix: DailyCountMatrix, category_row: int) -> np.ndarray:
+        x = np.arange(len(matrix)) + (category_row - 2) * BAR_WIDTH
+        return _bar_vertices(x, matrix.counts[category_row])
+
+    def _set_limits(self, matrix: DailyCountMatrix) -> None:
+        # Collections are not part of autoscaling, so the limits follow the data directly
+        self.ax.set_xlim(-0.5, len(matrix) - 0.5)
+        self.ax.set_ylim(0, max(1, int(matrix.counts.max())) * 1.05)
+        self._set_date_ticks(matrix)
+
+    def _set_date_ticks(self, matrix: DailyCountMatrix) -> None:
+        step = -(-len(matrix) // MAX_DATE_LABELS)
+        ticks = np.arange(0, len(matrix), step)
+        self.ax.set_xticks(ticks)
+        self.ax.set_xticklabels(
+            [d.strftime("%m/%d") if isinstance(d, date) else str(d) for d in matrix.dates[::step]],
+            rotation=45,
+            ha="right",
+        )
@@ -0,0 +1,50 @@
+# reporting/charts/activity_counts.py
+"""
+Activity counts pivoted into a dates x categories matrix for the bar chart.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from config.constants import AppCategory
+
+# Row order of the matrix, which is also the bar order in the chart
+CATEGORIES = (AppCategory.PRODUCTIVE, AppCategory.UNPRODUCTIVE, AppCategory.NEUTRAL, AppCategory.IDLE)
+
+_ROW = {category.value: i for i, category in enumerate(CATEGORIES)}
+
+
+@dataclass(frozen=True, eq=False, repr=False)
+class DailyCountMatrix:
+    """Activity counts with one row per category (in CATEGORIES order) and one column per date."""
+
+    dates: tuple[date, ...]
+    counts: np.ndarray  # int64, shape (len(CATEGORIES), len(dates))
+
+    @classmethod
+    def from_rows(cls, daily_counts: Iterable[dict]) -> DailyCountMatrix:
+        """
+        Pivot {"date", "category", "count"} rows (as returned by ActivityRepository.get_daily_counts)
+        in linear time. Missing (date, category) pairs count as 0; unknown categories are ignored.
+        """
+        rows = list(daily_counts)
+        dates = tuple(sorted({row["date"] for row in rows}))
+        column = {day: i for i, day in enumerate(dates)}
+        counts = np.zeros((len(CATEGORIES), len(dates)), dtype=np.int64)
+        for row in rows:
+            category_row = _ROW.get(row["category"])
+            if category_row is not None:
+                counts[category_row, column[row["date"]]] += row["count"]
+        return cls(dates, counts)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        # Full values, never numpy's abbreviated form: the chart renderer hashes this as a cache key
+        return f"DailyCountMatrix(dates={self.dates!r}, counts={self.counts.tolist()!r})"
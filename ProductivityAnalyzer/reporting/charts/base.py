@@ -0,0 +1,89 @@
+# reporting/charts/base.py
+"""
+Shared plumbing for the matplotlib charts.
+
+Charts draw headlessly on an Agg canvas, so they can be rendered on a worker
+thread (see reporting.charts.renderer); the UI only displays the resulting
+image. A chart keeps one Figure for its whole lifetime. update(data) swaps
+new data onto the existing artists when the shape allows it (same number of
+slices, points or bars), and otherwise replots on the same axes.
+"""
+
+from __future__ import annotations
+
+import io
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+T = TypeVar("T")
+
+BACKGROUND_COLOR = "#f4f4f9"
+DPI = 100
+
+
+@dataclass(frozen=True)
+class ChartImage:
+    """A rendered chart: `width` x `height` pixels of RGBA8888."""
+
+    key: str
+    width: int
+    height: int
+    rgba: bytes
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.rgba)
+
+    def to_png(self) -> bytes:
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.frombuffer("RGBA", (self.width, self.height), self.rgba, "raw", "RGBA", 0, 1).save(
+            buffer, "PNG"
+        )
+        return buffer.getvalue()
+
+
+class BaseChart(ABC, Generic[T]):
+    """A matplotlib figure on an Agg canvas; update(data) to change it, image() to render it."""
+
+    def __init__(self, data: T, width: float = 8, height: float = 4) -> None:
+        self.fig = Figure(figsize=(width, height), dpi=DPI)
+        self.fig.patch.set_facecolor(BACKGROUND_COLOR)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(111)
+        # Whether the artists on the axes can take new data in place
+        self._plotted = False
+        self.update(data)
+
+    def update(self, data: T) -> None:
+        """Show `data` on the next render."""
+        if not (self._plotted and self._update_artists(data)):
+            self._reset_axes()
+            self._plotted = self._plot(data)
+
+    def image(self, key: str = "") -> ChartImage:
+        """Render the figure as it stands now."""
+        self.canvas.draw()
+        width, height = self.canvas.get_width_height()
+        return ChartImage(key, width, height, bytes(self.canvas.buffer_rgba()))
+
+    @abstractmethod
+    def _plot(self, data: T) -> bool:
+        """Draw `data` on cleared axes; return False if nothing was plotted that update can reuse."""
+
+    def _update_artists(self, data: T) -> bool:
+        """Put `data` on the existing artists; return False if its shape needs a full replot."""
+        return False
+
+    def _reset_axes(self) -> None:
+        self.ax.clear()
+        self.ax.set_axis_on()
+
+    def _show_message(self, message: str, **text_kwargs) -> None:
+        self.ax.text(0.5, 0.5, message, ha="center", va="center", fontsize=14, **text_kwargs)
+        self.ax.set_axis_off()
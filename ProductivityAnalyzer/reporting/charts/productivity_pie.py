@@ -3,92 +3,93 @@
 Pie chart showing time distribution across categories.
 """
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+import numpy as np
 
 from config.constants import CHART_COLORS, AppCategory
 from database.models import DailySummary
+from reporting.charts.base import BaseChart
 from utils.logger import setup_logger
 
 logger = setup_logger("charts.pie")
 
 
-class ProductivityPieChart(FigureCanvas):
+class ProductivityPieChart(BaseChart[DailySummary]):
     """Matplotlib pie chart showing productive vs unproductive time."""
 
-    def __init__(self, summary: DailySummary, parent=None, width: int = 5, height: int = 5) -> None:
-        self.fig = Figure(figsize=(width, height), dpi=100)
-        self.fig.patch.set_facecolor("#f4f4f9")
-        super().__init__(self.fig)
-        self.setParent(parent)
-        self._plot(summary)
-
-    def _plot(self, summary: DailySummary) -> None:
-        ax = self.fig.add_subplot(111)
-
-        if summary.total_seconds == 0:
-            ax.text(
-                0.5,
-                0.5,
-                "No data yet",
-                ha="center",
-                va="center",
-                fontsize=14,
-                color="#999",
-            )
-            ax.set_axis_off()
-            return
-
-        labels = []
-        sizes = []
-        colors = []
+    def __init__(self, summary: DailySummary, width: float = 5, height: float = 5) -> None:
+        self._wedges: list = []
+        self._labels: list = []
+        self._autotexts: list = []
+        self._categories: tuple[str, ...] = ()
+        super().__init__(summary, width, height)
 
+    @staticmethod
+    def _slices(summary: DailySummary) -> list[tuple[str, int, str]]:
         data = [
             ("Productive", summary.productive_seconds, CHART_COLORS[AppCategory.PRODUCTIVE]),
             ("Unproductive", summary.unproductive_seconds, CHART_COLORS[AppCategory.UNPRODUCTIVE]),
             ("Neutral", summary.neutral_seconds, CHART_COLORS[AppCategory.NEUTRAL]),
             ("Idle", summary.idle_seconds, CHART_COLORS[AppCategory.IDLE]),
         ]
+        return [(label, seconds, color) for label, seconds, color in data if seconds > 0]
 
-        for label, seconds, color in data:
-            if seconds > 0:
-                labels.append(f"{label}\n({seconds // 60}m)")
-                sizes.append(seconds)
-                colors.append(color)
+    def _plot(self, summary: DailySummary) -> bool:
+        slices = self._slices(summary)
+        if summary.total_seconds == 0 or not slices:
+            self._show_message("No data yet", color="#999")
+            return False
 
-        if not sizes:
-            ax.text(
-                0.5,
-                0.5,
-                "No data yet",
-                ha="center",
-                va="center",
-                fontsize=14,
+        # pie() gives (patches, texts[, autotexts]); newer matplotlib wraps them in an iterable container
+        wedges_and_texts = tuple(
+            self.ax.pie(
+                [seconds for _, seconds, _ in slices],
+                labels=[f"{label}\n({seconds // 60}m)" for label, seconds, _ in slices],
+                colors=[color for _, _, color in slices],
+                autopct="%1.1f%%",
+                startangle=140,
+                pctdistance=0.75,
+                textprops={"fontsize": 9},
             )
-            ax.set_axis_off()
-            return
-
-        wedges_and_texts = ax.pie(
-            sizes,
-            labels=labels,
-            colors=colors,
-            autopct="%1.1f%%",
-            startangle=140,
-            pctdistance=0.75,
-            textprops={"fontsize": 9},
         )
+        self._wedges, self._labels = list(wedges_and_texts[0]), list(wedges_and_texts[1])
+        self._autotexts = list(wedges_and_texts[2]) if len(wedges_and_texts) >= 3 else []
+        for autotext in self._autotexts:
+            autotext.set_fontsize(8)
+            autotext.set_fontweight("bold")
+        self._categories = tuple(label for label, _, _ in slices)
+
+        self._set_title(summary)
+        self.fig.tight_layout()
+        return True
 
-        # pie() returns (patches, texts) or (patches, texts, autotexts) depending on autopct
-        if len(wedges_and_texts) >= 3:
-            autotexts = wedges_and_texts[2]
-            for autotext in autotexts:
-                autotext.set_fontsize(8)
-                autotext.set_fontweight("bold")
+    def _update_artists(self, summary: DailySummary) -> bool:
+        slices = self._slices(summary)
+        if summary.total_seconds == 0 or tuple(label for label, _, _ in slices) != self._categories:
+            return False
+        # Same slices as before: re-angle the wedges and move their labels, as pie() would place them
+        total = sum(seconds for _, seconds, _ in slices)
+        theta = 140.0
+        for i, (label, seconds, _) in enumerate(slices):
+            span = 360.0 * seconds / total
+            wedge = self._wedges[i]
+            wedge.set_theta1(theta)
+            wedge.set_theta2(theta + span)
+            middle = np.deg2rad(theta + span / 2)
+            x, y = np.cos(middle), np.sin(middle)
+            self._labels[i].set_position((1.1 * x, 1.1 * y))
+            self._labels[i].set_horizontalalignment("left" if x > 0 else "right")
+            self._labels[i].set_text(f"{label}\n({seconds // 60}m)")
+            if self._autotexts:
+                self._autotexts[i].set_position((0.75 * x, 0.75 * y))
+                self._autotexts[i].set_text(f"{100.0 * seconds / total:1.1f}%")
+            theta += span
+        self._set_title(summary)
+        return True
 
-        ax.set_title(
+    def _set_title(self, summary: DailySummary) -> None:
+        self.ax.set_title(
             f"Time Distribution - Score: {summary.score}/100 ({summary.grade})",
             fontsize=12,
             fontweight="bold",
             pad=15,
         )
-        self.fig.tight_layout()
@@ -0,0 +1,130 @@
+# reporting/charts/renderer.py
+"""
+Headless chart rendering with a content-addressed image cache.
+
+render() is meant to run on a worker thread (a page's DataLoader fetch): it
+draws the chart with Agg and returns a ChartImage that the UI only has to
+display. Images are cached under a hash of the chart kind, its options, the
+figure size and the input data, so showing the same data again (switching
+back to a chart, a refresh that found nothing new, the PDF export of a chart
+already on screen) costs a dictionary lookup.
+
+matplotlib is imported on the first render, not when this module is.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from reporting.charts.base import BaseChart, ChartImage
+
+logger = setup_logger("charts.renderer")
+
+# Chart kind -> (module, class)
+CHART_CLASSES = {
+    "pie": ("reporting.charts.productivity_pie", "ProductivityPieChart"),
+    "trend": ("reporting.charts.trend_line", "ProductivityTrendChart"),
+    "bars": ("reporting.charts.activity_chart", "ActivityBarChart"),
+}
+
+# A 9x5 inch chart at 100 dpi is ~1.8 MB of RGBA
+DEFAULT_MAX_IMAGES = 16
+
+
+def content_key(kind: str, data: Any, width: float, height: float, options: dict[str, Any]) -> str:
+    """Hash identifying a render: same kind, options, size and data give the same image."""
+    payload = repr((kind, sorted(options.items()), float(width), float(height), data))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class ChartRenderStats:
+    """Cache counters of a ChartRenderer."""
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    cached_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ChartRenderer:
+    """Renders charts off the GUI thread and keeps the most recent images."""
+
+    def __init__(self, max_images: int = DEFAULT_MAX_IMAGES) -> None:
+        self.max_images = max(1, max_images)
+        self._lock = threading.Lock()
+        # matplotlib's text and font caches are not thread-safe, so renders run one at a time
+        self._render_lock = threading.Lock()
+        self._images: OrderedDict[str, ChartImage] = OrderedDict()
+        # One live figure per kind, options and size, updated in place between renders
+        self._charts: dict[tuple, BaseChart] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def render(self, kind: str, data: Any, width: float, height: float, **options: Any) -> ChartImage:
+        """Image of chart `kind` ("pie", "trend", "bars") showing `data` at `width` x `height` inches."""
+        key = content_key(kind, data, width, height, options)
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self._hits += 1
+                return image
+            self._misses += 1
+
+        with self._render_lock:
+            chart_id = (kind, tuple(sorted(options.items())), width, height)
+            chart = self._charts.get(chart_id)
+            if chart is None:
+                module, name = CHART_CLASSES[kind]
+                chart_class = getattr(importlib.import_module(module), name)
+                chart = self._charts[chart_id] = chart_class(data, width=width, height=height, **options)
+            else:
+                chart.update(data)
+            image = chart.image(key)
+
+        with self._lock:
+            self._images[key] = image
+            while len(self._images) > self.max_images:
+                self._images.popitem(last=False)
+        logger.debug(f"Rendered {kind} chart {image.width}x{image.height}")
+        return image
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+
+    def stats(self) -> ChartRenderStats:
+        with self._lock:
+            return ChartRenderStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._images),
+                cached_bytes=sum(image.nbytes for image in self._images.values()),
+            )
+
+
+_renderer: ChartRenderer | None = None
+_renderer_lock = threading.Lock()
+
+
+def get_chart_renderer() -> ChartRenderer:
+    """The renderer shared by the pages and the PDF exporter."""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = ChartRenderer()
+        return _renderer
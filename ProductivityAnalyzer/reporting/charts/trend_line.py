@@ -3,57 +3,76 @@
 Line chart showing productivity score trends over time.
 """
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
+from matplotlib.container import BarContainer
+from matplotlib.lines import Line2D
 
 from database.models import DailySummary
+from reporting.charts.base import BaseChart
 from utils.logger import setup_logger
 
 logger = setup_logger("charts.trend")
 
 
-class ProductivityTrendChart(FigureCanvas):
+class ProductivityTrendChart(BaseChart[list[DailySummary]]):
     """Line chart showing productivity score trend over multiple days."""
 
-    def __init__(self, summaries: list[DailySummary], parent=None, width=8, height=4):
-        self.fig = Figure(figsize=(width, height), dpi=100)
-        self.fig.patch.set_facecolor("#f4f4f9")
-        super().__init__(self.fig)
-        self.setParent(parent)
-        self._plot(summaries)
+    def __init__(
+        self,
+        summaries: list[DailySummary],
+        width: float = 8,
+        height: float = 4,
+        title: str = "Productivity Trend (Last 7 Days)",
+    ) -> None:
+        self.title = title
+        self.ax2: Axes | None = None
+        self._score_line: Line2D | None = None
+        self._score_fill: PolyCollection | None = None
+        self._productive_bars: BarContainer | None = None
+        self._unproductive_bars: BarContainer | None = None
+        super().__init__(summaries, width, height)
 
-    def _plot(self, summaries: list[DailySummary]):
-        ax = self.fig.add_subplot(111)
+    def _reset_axes(self) -> None:
+        super()._reset_axes()
+        if self.ax2 is not None:
+            self.ax2.clear()
+            self.ax2.set_axis_off()
 
+    def _plot(self, summaries: list[DailySummary]) -> bool:
         if not summaries:
-            ax.text(0.5, 0.5, "No data available", ha="center", va="center", fontsize=14, color="#999")
-            ax.set_axis_off()
-            return
+            self._show_message("No data available", color="#999")
+            return False
 
-        dates = [s.date.strftime("%m/%d") for s in summaries]
+        ax = self.ax
+        if self.ax2 is None:
+            # Second Y-axis for minutes
+            self.ax2 = ax.twinx()
+        ax2 = self.ax2
+        ax2.set_axis_on()
+
+        x = list(range(len(summaries)))
         scores = [s.score for s in summaries]
-        productive = [s.productive_minutes for s in summaries]
-        unproductive = [s.unproductive_minutes for s in summaries]
 
         # Score line
-        ax.plot(dates, scores, "o-", color="#2ecc71", linewidth=2, markersize=6, label="Score")
+        (self._score_line,) = ax.plot(
+            x, scores, "o-", color="#2ecc71", linewidth=2, markersize=6, label="Score"
+        )
 
         # Fill area
-        ax.fill_between(dates, scores, alpha=0.1, color="#2ecc71")
+        self._score_fill = ax.fill_between(x, scores, alpha=0.1, color="#2ecc71")
 
-        # Second Y-axis for minutes
-        ax2 = ax.twinx()
-        ax2.bar(
-            [i - 0.15 for i in range(len(dates))],
-            productive,
+        self._productive_bars = ax2.bar(
+            [i - 0.15 for i in x],
+            [s.productive_minutes for s in summaries],
             width=0.3,
             alpha=0.4,
             color="#2ecc71",
             label="Productive (min)",
         )
-        ax2.bar(
-            [i + 0.15 for i in range(len(dates))],
-            unproductive,
+        self._unproductive_bars = ax2.bar(
+            [i + 0.15 for i in x],
+            [s.unproductive_minutes for s in summaries],
             width=0.3,
             alpha=0.4,
             color="#e74c3c",
@@ -63,8 +82,10 @@ class ProductivityTrendChart(FigureCanvas):
 
         ax.set_xlabel("Date", fontsize=10)
         ax.set_ylabel("Score", fontsize=10)
-        ax.set_title("Productivity Trend (Last 7 Days)", fontsize=13, fontweight="bold")
+        ax.set_title(self.title, fontsize=13, fontweight="bold")
         ax.set_ylim(0, 105)
+        ax.set_xticks(x)
+        ax.set_xticklabels([s.date.strftime("%m/%d") for s in summaries])
         ax.grid(axis="y", alpha=0.3)
 
         # Combined legend
@@ -73,3 +94,29 @@ class ProductivityTrendChart(FigureCanvas):
         ax.legend(lines1 + lines2, labels1 + labels2, fontsize=8, loc="upper left")
 
         self.fig.tight_layout()
+        return True
+
+    def _update_artists(self, summaries: list[DailySummary]) -> bool:
+        line, fill = self._score_line, self._score_fill
+        productive, unproductive = self._productive_bars, self._unproductive_bars
+        if line is None or fill is None or productive is None or unproductive is None or self.ax2 is None:
+            return False
+        if len(summaries) != len(productive):
+            return False
+
+        x = list(range(len(summaries)))
+        scores = [s.score for s in summaries]
+        line.set_ydata(scores)
+        # A fill is a single polygon, so it is cheaper to redo than to reshape
+        fill.remove()
+        self._score_fill = self.ax.fill_between(x, scores, alpha=0.1, color="#2ecc71")
+
+        for bar, minutes in zip(productive, (s.productive_minutes for s in summaries), strict=True):
+            bar.set_height(minutes)
+        for bar, minutes in zip(unproductive, (s.unproductive_minutes for s in summaries), strict=True):
+            bar.set_height(minutes)
+        self.ax2.relim()
+        self.ax2.autoscale_view()
+
+        self.ax.set_xticklabels([s.date.strftime("%m/%d") for s in summaries])
+        return True
@@ -5,6 +5,7 @@ Export activity data and reports to CSV format.
 
 import csv
 import os
+from collections.abc import Iterable
 from datetime import date, timedelta
 
 from database.connection import DatabasePool
@@ -29,14 +30,14 @@ class CSVExporter:
         if target_date is None:
             target_date = date.today()
 
-        activities = self.activity_repo.get_activities_by_date(target_date)
+        activities = self.activity_repo.iter_activities(target_date, target_date)
         filename = os.path.join(EXPORT_DIR, f"activity_{target_date.isoformat()}.csv")
 
         return self._write_activities(activities, filename)
 
     def export_date_range(self, start_date: date, end_date: date) -> str:
         """Export activities within a date range to CSV."""
-        activities = self.activity_repo.get_activities_date_range(start_date, end_date)
+        activities = self.activity_repo.iter_activities(start_date, end_date)
         filename = os.path.join(
             EXPORT_DIR, f"activity_{start_date.isoformat()}_to_{end_date.isoformat()}.csv"
         )
@@ -48,8 +49,9 @@ class CSVExporter:
         start = today - timedelta(days=6)
         return self.export_date_range(start, today)
 
-    def _write_activities(self, activities: list[ActivityLog], filepath: str) -> str:
-        """Write activity list to a CSV file."""
+    def _write_activities(self, activities: Iterable[ActivityLog], filepath: str) -> str:
+        """Write activities to a CSV file as they are streamed from the database."""
+        row_count = 0
         try:
             with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
                 writer = csv.writer(csvfile)
@@ -65,10 +67,14 @@ class CSVExporter:
                             activity.duration_seconds,
                         ]
                     )
+                    row_count += 1
 
-            logger.info(f"CSV exported: {filepath} ({len(activities)} rows)")
+            logger.info(f"CSV exported: {filepath} ({row_count} rows)")
             return filepath
 
         except Exception as e:
-            logger.error(f"CSV export error: {e}")
+            logger.error(f"CSV export error after {row_count} rows: {e}")
+            # A stream that failed part-way would leave a truncated file that looks complete
+            if os.path.exists(filepath):
+                os.remove(filepath)
             raise
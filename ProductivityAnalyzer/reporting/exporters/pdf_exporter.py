@@ -3,23 +3,36 @@
 Export productivity reports to PDF format using ReportLab.
 """
 
+from __future__ import annotations
+
+import io
 import os
 from datetime import date
+from typing import TYPE_CHECKING
 
 from database.connection import DatabasePool
+from reporting.charts.renderer import get_chart_renderer
 from reporting.report_generator import ReportGenerator
 from utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from tracking.live_aggregator import LiveAggregator
+
 logger = setup_logger("reporting.pdf_exporter")
 
 EXPORT_DIR = "exports"
 
 
 class PDFExporter:
-    """Exports productivity reports to PDF."""
+    """
+    Exports productivity reports to PDF.
+
+    With the tracker's LiveAggregator, today's report uses the same live totals
+    as the dashboard. Exporting renders a chart, so run it off the GUI thread.
+    """
 
-    def __init__(self, db_pool: DatabasePool) -> None:
-        self.report_gen = ReportGenerator(db_pool)
+    def __init__(self, db_pool: DatabasePool, live: LiveAggregator | None = None) -> None:
+        self.report_gen = ReportGenerator(db_pool, live=live)
         os.makedirs(EXPORT_DIR, exist_ok=True)
 
     def export_daily_report(self, target_date: date | None = None) -> str:
@@ -28,7 +41,7 @@ class PDFExporter:
             from reportlab.lib import colors
             from reportlab.lib.pagesizes import A4
             from reportlab.lib.styles import getSampleStyleSheet
-            from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+            from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
         except ImportError:
             logger.error("reportlab not installed. Run: pip install reportlab")
             raise ImportError("reportlab is required for PDF export.") from None
@@ -96,6 +109,11 @@ class PDFExporter:
         )
         elements.append(table)
         elements.append(Spacer(1, 15))
+
+        # Same size as the dashboard's pie, so a chart already rendered for the screen is reused
+        chart = get_chart_renderer().render("pie", summary, width=4, height=3.5)
+        elements.append(Image(io.BytesIO(chart.to_png()), width=4 * 72, height=3.5 * 72))
+        elements.append(Spacer(1, 15))
         elements.append(Paragraph(f"Total tracked entries: {summary.total_entries}", styles["Normal"]))
 
         doc.build(elements)
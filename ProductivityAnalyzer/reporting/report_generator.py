@@ -3,153 +3,137 @@
 Central report generation coordinator.
 """
 
+from __future__ import annotations
+
 from datetime import date, timedelta
+from typing import TYPE_CHECKING
 
 from config.constants import AppCategory
 from database.connection import DatabasePool
 from database.models import DailySummary
 from database.repositories.activity_repo import ActivityRepository
+from database.repositories.daily_summary_repo import DailySummaryRepository
 from utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from tracking.live_aggregator import LiveAggregator
+
 logger = setup_logger("reporting.generator")
 
 
 class ReportGenerator:
     """Generates productivity reports and summaries."""
 
-    def __init__(self, db_pool: DatabasePool) -> None:
+    def __init__(self, db_pool: DatabasePool, live: LiveAggregator | None = None) -> None:
         self.db_pool = db_pool
         self.activity_repo = ActivityRepository(db_pool)
+        self.summary_repo = DailySummaryRepository(db_pool)
+        # Today's running totals from the tracker, when available
+        self.live = live
 
     def get_daily_summary(self, target_date: date | None = None) -> DailySummary:
-        """Generate a summary for a specific date."""
+        """Generate a summary for a specific date (today's comes from the live totals if possible)."""
         if target_date is None:
             target_date = date.today()
 
-        summary_data = self.activity_repo.get_productivity_summary(target_date, target_date)
-
-        productive = summary_data.get(AppCategory.PRODUCTIVE.value, {})
-        unproductive = summary_data.get(AppCategory.UNPRODUCTIVE.value, {})
-        neutral = summary_data.get(AppCategory.NEUTRAL.value, {})
-        idle = summary_data.get(AppCategory.IDLE.value, {})
-
-        prod_seconds = productive.get("total_seconds", 0)
-        unprod_seconds = unproductive.get("total_seconds", 0)
-        neutral_seconds = neutral.get("total_seconds", 0)
-        idle_seconds = idle.get("total_seconds", 0)
-        total_entries = sum(d.get("count", 0) for d in summary_data.values())
-        total = prod_seconds + unprod_seconds + neutral_seconds + idle_seconds
-
-        if total > 0:
-            score = min(
-                100,
-                max(
-                    0,
-                    (prod_seconds * 1.5 - unprod_seconds + neutral_seconds * 0.3) / total * 100,
-                ),
-            )
+        if self.live is not None and self.live.covers(target_date):
+            summary_data = self.live.summary()
         else:
-            score = 0.0
-
-        return DailySummary(
-            date=target_date,
-            productive_seconds=prod_seconds,
-            unproductive_seconds=unprod_seconds,
-            neutral_seconds=neutral_seconds,
-            idle_seconds=idle_seconds,
-            total_entries=total_entries,
-            score=round(score, 1),
-        )
+            summary_data = self.activity_repo.get_productivity_summary(target_date, target_date)
+        return self._build_summary(target_date, summary_data)
 
     def get_weekly_summaries(self) -> list[DailySummary]:
         """Get daily summaries for the past 7 days."""
-        today = date.today()
-        summaries: list[DailySummary] = []
-        for i in range(6, -1, -1):
-            day = today - timedelta(days=i)
-            summaries.append(self.get_daily_summary(day))
-        return summaries
+        return self.get_summaries_for_range(date.today() - timedelta(days=6), date.today())
 
     def get_monthly_summaries(self) -> list[DailySummary]:
         """Get daily summaries for the past 30 days."""
+        return self.get_summaries_for_range(date.today() - timedelta(days=29), date.today())
+
+    def get_summaries_for_range(self, start_date: date, end_date: date) -> list[DailySummary]:
+        """
+        Get one summary per day from start_date to end_date, read from the daily_summary rollup.
+        Today's comes from the live totals if possible, so it matches get_daily_summary().
+        """
+        rolled_up = {s.date: s for s in self.summary_repo.get_summaries(start_date, end_date)}
         today = date.today()
-        summaries: list[DailySummary] = []
-        for i in range(29, -1, -1):
-            day = today - timedelta(days=i)
-            summaries.append(self.get_daily_summary(day))
-        return summaries
+        if start_date <= today <= end_date and self.live is not None and self.live.covers(today):
+            # The rollup has no open window and lags the write buffer
+            rolled_up[today] = self._build_summary(today, self.live.summary())
+        days = (end_date - start_date).days + 1
+        return [
+            self._scored(rolled_up.get(day) or DailySummary(date=day))
+            for day in (start_date + timedelta(days=i) for i in range(days))
+        ]
 
     def get_quarterly_summaries(self) -> list[DailySummary]:
         """Get weekly aggregated summaries for the past 90 days (12-13 weeks)."""
         today = date.today()
-        summaries: list[DailySummary] = []
-        for week in range(12, -1, -1):
-            week_start = today - timedelta(weeks=week)
-            week_end = week_start + timedelta(days=6)
-            if week_end > today:
-                week_end = today
-
-            summary_data = self.activity_repo.get_productivity_summary(week_start, week_end)
-
-            productive = summary_data.get(AppCategory.PRODUCTIVE.value, {})
-            unproductive = summary_data.get(AppCategory.UNPRODUCTIVE.value, {})
-            neutral_d = summary_data.get(AppCategory.NEUTRAL.value, {})
-            idle_d = summary_data.get(AppCategory.IDLE.value, {})
-
-            prod_s = productive.get("total_seconds", 0)
-            unprod_s = unproductive.get("total_seconds", 0)
-            neutral_s = neutral_d.get("total_seconds", 0)
-            idle_s = idle_d.get("total_seconds", 0)
-            total = prod_s + unprod_s + neutral_s + idle_s
-
-            score = 0.0
-            if total > 0:
-                score = min(
-                    100,
-                    max(0, (prod_s * 1.5 - unprod_s + neutral_s * 0.3) / total * 100),
-                )
+        daily = self.get_summaries_for_range(today - timedelta(weeks=12), today)
 
+        # Weeks stay anchored on today rather than on Mondays: [today-12w .. today-11w-1], ..., [today]
+        summaries: list[DailySummary] = []
+        for start in range(0, len(daily), 7):
+            week = daily[start : start + 7]
             summaries.append(
-                DailySummary(
-                    date=week_start,
-                    productive_seconds=prod_s,
-                    unproductive_seconds=unprod_s,
-                    neutral_seconds=neutral_s,
-                    idle_seconds=idle_s,
-                    total_entries=sum(d.get("count", 0) for d in summary_data.values()),
-                    score=round(score, 1),
+                self._scored(
+                    DailySummary(
+                        date=week[0].date,
+                        productive_seconds=sum(d.productive_seconds for d in week),
+                        unproductive_seconds=sum(d.unproductive_seconds for d in week),
+                        neutral_seconds=sum(d.neutral_seconds for d in week),
+                        idle_seconds=sum(d.idle_seconds for d in week),
+                        total_entries=sum(d.total_entries for d in week),
+                    )
                 )
             )
         return summaries
 
+    @staticmethod
+    def _build_summary(summary_date: date, summary_data: dict) -> DailySummary:
+        """Turn {category: {"count", "total_seconds"}} totals into a scored DailySummary."""
+        return ReportGenerator._scored(
+            DailySummary(
+                date=summary_date,
+                productive_seconds=summary_data.get(AppCategory.PRODUCTIVE.value, {}).get("total_seconds", 0),
+                unproductive_seconds=summary_data.get(AppCategory.UNPRODUCTIVE.value, {}).get(
+                    "total_seconds", 0
+                ),
+                neutral_seconds=summary_data.get(AppCategory.NEUTRAL.value, {}).get("total_seconds", 0),
+                idle_seconds=summary_data.get(AppCategory.IDLE.value, {}).get("total_seconds", 0),
+                total_entries=sum(d.get("count", 0) for d in summary_data.values()),
+            )
+        )
+
+    @staticmethod
+    def _scored(summary: DailySummary) -> DailySummary:
+        """Fill in the productivity score from the summary's category totals."""
+        total = summary.total_seconds
+        if total > 0:
+            score = min(
+                100,
+                max(
+                    0,
+                    (
+                        summary.productive_seconds * 1.5
+                        - summary.unproductive_seconds
+                        + summary.neutral_seconds * 0.3
+                    )
+                    / total
+                    * 100,
+                ),
+            )
+        else:
+            score = 0.0
+        summary.score = round(score, 1)
+        return summary
+
+    def get_top_apps(self, target_date: date, limit: int = 10) -> list[dict]:
+        """Get the apps used most on a date (today's come from the live totals if possible)."""
+        if self.live is not None and self.live.covers(target_date):
+            return self.live.top_apps(limit)
+        return self.activity_repo.get_top_apps(target_date, limit=limit)
+
     def get_top_apps_today(self, limit: int = 10) -> list:
         """Get top apps used today."""
-        return self.activity_repo.get_top_apps(date.today(), limit=limit)
-
-    def save_daily_summary(self, summary: DailySummary) -> bool:
-        """Persist a daily summary to the daily_summary table."""
-        query = """
-            INSERT INTO daily_summary
-                (summary_date, productive_seconds, unproductive_seconds, neutral_seconds,
-                 idle_seconds, total_entries, score)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (summary_date) DO UPDATE SET
-                productive_seconds = EXCLUDED.productive_seconds,
-                unproductive_seconds = EXCLUDED.unproductive_seconds,
-                neutral_seconds = EXCLUDED.neutral_seconds,
-                idle_seconds = EXCLUDED.idle_seconds,
-                total_entries = EXCLUDED.total_entries,
-                score = EXCLUDED.score
-        """
-        return self.db_pool.execute_query(
-            query,
-            (
-                summary.date,
-                summary.productive_seconds,
-                summary.unproductive_seconds,
-                summary.neutral_seconds,
-                summary.idle_seconds,
-                summary.total_entries,
-                summary.score,
-            ),
-        )
+        return self.get_top_apps(date.today(), limit=limit)
@@ -1,6 +1,20 @@
 # services/__init__.py
-from services.notification_service import NotificationService
-from services.productivity_scorer import ProductivityScorer
-from services.suggestion_engine import SuggestionEngine
+from typing import TYPE_CHECKING
+
+from utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from services.notification_service import NotificationService
+    from services.productivity_scorer import ProductivityScorer
+    from services.suggestion_engine import SuggestionEngine
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "NotificationService": "services.notification_service",
+        "ProductivityScorer": "services.productivity_scorer",
+        "SuggestionEngine": "services.suggestion_engine",
+    },
+)
 
 __all__ = ["NotificationService", "ProductivityScorer", "SuggestionEngine"]
@@ -0,0 +1,217 @@
+# services/recategorizer.py
+"""
+Re-apply the current categorization rules to historical activity.
+
+History is read from activity_log in keyset pages, with no connection held
+between pages, so even a one-connection pool is free for the writes. Rows are
+categorized in a process pool and only those whose category changed are
+written back with set-based UPDATE ... FROM (VALUES ...) batches. A newly
+added keyword rule whose effect can be expressed in SQL is pushed down into a
+single UPDATE instead.
+
+Usage:
+    python -m services.recategorizer [--start YYYY-MM-DD] [--end YYYY-MM-DD] [--keyword KW] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+from itertools import islice
+
+from config.constants import AppCategory
+from database.connection import DatabasePool
+from database.repositories.activity_repo import ActivityRepository
+from tracking.categorizer import CATEGORY_PRECEDENCE, IDLE_TITLES, AppCategorizer
+from utils.logger import setup_logger
+
+logger = setup_logger("services.recategorizer")
+
+Row = tuple[int, datetime, str, str]
+Change = tuple[int, datetime, str]
+
+
+@dataclass(frozen=True)
+class RecategorizeStats:
+    """Progress / result of a recategorization run."""
+
+    scanned: int = 0
+    changed: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    pushed_down: bool = False
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scanned / self.seconds if self.seconds > 0 else 0.0
+
+
+def _changed_rows(categorizer: AppCategorizer, rows: list[Row]) -> list[Change]:
+    changes = []
+    for row_id, timestamp, title, category in rows:
+        new_category = categorizer.categorize(title).value
+        if new_category != category:
+            changes.append((row_id, timestamp, new_category))
+    return changes
+
+
+# Per-process categorizer, built once by the pool initializer
+_worker_categorizer: AppCategorizer | None = None
+
+
+def _init_worker(rules: dict[str, str]) -> None:
+    global _worker_categorizer
+    _worker_categorizer = AppCategorizer.from_rules(rules)
+
+
+def _categorize_chunk(rows: list[Row]) -> list[Change]:
+    assert _worker_categorizer is not None
+    return _changed_rows(_worker_categorizer, rows)
+
+
+def _chunked(rows: Iterable[Row], size: int) -> Iterator[list[Row]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Recategorizer:
+    """Brings activity_log categories in line with the categorizer's current rules."""
+
+    def __init__(
+        self,
+        db_pool: DatabasePool,
+        categorizer: AppCategorizer | None = None,
+        chunk_size: int = 5000,
+        workers: int | None = None,
+    ) -> None:
+        self.activity_repo = ActivityRepository(db_pool)
+        self.categorizer = categorizer or AppCategorizer(db_pool)
+        self.chunk_size = max(1, chunk_size)
+        self.workers = max(1, (os.cpu_count() or 2) - 1) if workers is None else max(0, workers)
+
+    def run(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        title_contains: str | None = None,
+        progress: Callable[[RecategorizeStats], None] | None = None,
+    ) -> RecategorizeStats:
+        """Recategorize every row in the range (optionally only titles containing a keyword)."""
+        rules = self.categorizer.get_all_rules()
+        local = AppCategorizer.from_rules(rules)
+        rows = self.activity_repo.iter_categorized_titles(
+            start_date, end_date, title_contains, itersize=self.chunk_size
+        )
+        started = time.perf_counter()
+        stats = RecategorizeStats()
+        executor: ProcessPoolExecutor | None = None
+        pending: deque[tuple[Future[list[Change]], int]] = deque()
+
+        def write(changes: list[Change], scanned: int) -> None:
+            nonlocal stats
+            written = self.activity_repo.update_categories(changes)
+            stats = replace(
+                stats,
+                scanned=stats.scanned + scanned,
+                changed=stats.changed + (len(changes) if written else 0),
+                failed=stats.failed + (0 if written else len(changes)),
+                seconds=time.perf_counter() - started,
+            )
+            logger.debug(f"Recategorized {stats.scanned} rows ({stats.rows_per_second:.0f} rows/s)")
+            if progress:
+                progress(stats)
+
+        try:
+            for index, chunk in enumerate(_chunked(rows, self.chunk_size)):
+                # Small jobs never pay for starting worker processes
+                if index == 0 or self.workers <= 1:
+                    write(_changed_rows(local, chunk), len(chunk))
+                    continue
+                if executor is None:
+                    executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker,
+                        initargs=(rules,),
+                    )
+                pending.append((executor.submit(_categorize_chunk, chunk), len(chunk)))
+                # Bound memory: never hold more than two chunks per worker
+                while len(pending) >= self.workers * 2:
+                    future, scanned = pending.popleft()
+                    write(future.result(), scanned)
+            while pending:
+                future, scanned = pending.popleft()
+                write(future.result(), scanned)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        stats = replace(stats, seconds=time.perf_counter() - started)
+        logger.info(
+            f"Recategorized {stats.scanned} rows in {stats.seconds:.1f}s "
+            f"({stats.rows_per_second:.0f} rows/s): {stats.changed} changed, {stats.failed} failed"
+        )
+        return stats
+
+    def apply_rule_change(
+        self,
+        keyword: str,
+        category: AppCategory | None,
+        previous: AppCategory | None = None,
+        progress: Callable[[RecategorizeStats], None] | None = None,
+    ) -> RecategorizeStats:
+        """
+        Update history after `keyword` was added (category set), re-categorized (previous set)
+        or removed (category None). The categorizer must already reflect the change.
+        """
+        keyword = keyword.lower().strip()
+        if category is not None and previous is None and category is not AppCategory.IDLE:
+            # A new keyword only wins on titles that currently resolve to a lower-precedence category
+            rank = CATEGORY_PRECEDENCE.index(category)
+            weaker = [c.value for c in CATEGORY_PRECEDENCE[rank + 1 :]]
+            started = time.perf_counter()
+            changed = self.activity_repo.set_category_for_keyword(
+                keyword, category.value, weaker, exclude_titles=IDLE_TITLES
+            )
+            stats = RecategorizeStats(
+                changed=changed or 0,
+                failed=int(changed is None),
+                seconds=time.perf_counter() - started,
+                pushed_down=True,
+            )
+            logger.info(f"Rule '{keyword}' -> {category.value} applied to {stats.changed} historical rows")
+            return stats
+        # Removals and changed categories can hand titles to other rules: re-run the matcher on them
+        return self.run(title_contains=keyword, progress=progress)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-apply category rules to stored activity.")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="First day (default: all)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="Last day (default: all)")
+    parser.add_argument("--keyword", default=None, help="Only titles containing this keyword")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPUs - 1)")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    db_pool = DatabasePool()
+    try:
+        recategorizer = Recategorizer(db_pool, chunk_size=args.chunk_size, workers=args.workers)
+        keyword = args.keyword.lower().strip() if args.keyword else None
+        stats = recategorizer.run(args.start, args.end, keyword)
+    finally:
+        db_pool.close_all()
+    return 0 if not stats.failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,19 @@
 Generates actionable productivity suggestions based on user activity patterns.
 """
 
+from __future__ import annotations
+
 from datetime import date
+from typing import TYPE_CHECKING
 
 from database.connection import DatabasePool
 from database.models import DailySummary
-from database.repositories.activity_repo import ActivityRepository
 from reporting.report_generator import ReportGenerator
 from utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from tracking.live_aggregator import LiveAggregator
+
 logger = setup_logger("services.suggestions")
 
 
@@ -30,9 +35,9 @@ class Suggestion:
 class SuggestionEngine:
     """Analyzes activity data and generates actionable suggestions."""
 
-    def __init__(self, db_pool: DatabasePool) -> None:
+    def __init__(self, db_pool: DatabasePool, live: LiveAggregator | None = None) -> None:
         self.db_pool = db_pool
-        self.report_gen = ReportGenerator(db_pool)
+        self.report_gen = ReportGenerator(db_pool, live=live)
 
     def get_suggestions(self) -> list[Suggestion]:
         """Generate suggestions based on today's and recent activity."""
@@ -198,8 +203,7 @@ class SuggestionEngine:
             target_date = date.today()
 
         results: list[Suggestion] = []
-        activity_repo = ActivityRepository(self.db_pool)
-        top_apps = activity_repo.get_top_apps(target_date, limit=20)
+        top_apps = self.report_gen.get_top_apps(target_date, limit=20)
 
         meeting_keywords = ["zoom", "teams", "meet", "webex", "slack huddle", "discord call"]
         meeting_seconds = 0
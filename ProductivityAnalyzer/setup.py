@@ -15,6 +15,8 @@ setup(
         "psycopg2-binary>=2.9.9",
         "python-dotenv>=1.0.0",
         "pygetwindow>=0.0.9",
+        'python-xlib>=0.33; sys_platform == "linux"',
+        "numpy>=1.26.0",
         "pandas>=2.2.0",
         "matplotlib>=3.8.0",
         "reportlab>=4.1.0",
@@ -18,6 +18,7 @@ def mock_db_pool():
     pool = MagicMock()
     pool.execute_query.return_value = True
     pool.execute_query_returning.return_value = 1
+    pool.execute_values.return_value = True
     pool.fetch_one.return_value = None
     pool.fetch_all.return_value = []
     pool.fetch_all_dict.return_value = []
@@ -1,10 +1,12 @@
 # tests/test_database/test_activity_repo.py
 """Tests for ActivityRepository."""
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock
 
 from config.constants import AppCategory
+from database.models import ActivityLog
+from database.query_cache import DEFAULT_TTL, PAST_TTL
 from database.repositories.activity_repo import ActivityRepository
 
 
@@ -24,6 +26,64 @@ class TestActivityRepository:
         result = self.repo.log_activity(sample_activity)
         assert result is False
 
+    def test_log_activities_single_batch(self, sample_activities):
+        self.mock_pool.execute_values.return_value = True
+        result = self.repo.log_activities(sample_activities)
+        assert result is True
+        self.mock_pool.execute_values.assert_called_once()
+        rows = self.mock_pool.execute_values.call_args[0][1]
+        assert len(rows) == 4
+        assert rows[1][3] == "unproductive"
+        assert "ON CONFLICT (row_key, timestamp) DO NOTHING" in self.mock_pool.execute_values.call_args[0][0]
+
+    def test_bulk_load_streams_csv(self, sample_activities):
+        received = {}
+
+        def fake_copy(sql, stream, prologue=(), epilogue=()):
+            received["data"] = stream.read(16) + stream.read()
+            received["epilogue"] = epilogue
+            return 4
+
+        self.mock_pool.copy_from.side_effect = fake_copy
+        result = self.repo.bulk_load_activities(iter(sample_activities))
+
+        assert result.success is True
+        assert result.rows == 4
+        assert result.rows_per_second > 0
+        lines = received["data"].splitlines()
+        assert len(lines) == 4
+        assert lines[0] == '"","2026-03-24 09:00:00","VS Code","productive",1800'
+        assert "ON CONFLICT (row_key, timestamp) DO NOTHING" in received["epilogue"][0]
+
+    def test_bulk_load_writes_row_keys(self):
+        received = {}
+
+        def fake_copy(sql, stream, prologue=(), epilogue=()):
+            received["data"] = stream.read()
+            return 1
+
+        self.mock_pool.copy_from.side_effect = fake_copy
+        key = "5f0c9a52-3c1e-4f7b-9a55-7d7b2f1e0c11"
+        self.repo.bulk_load_activities([ActivityLog(timestamp=datetime(2026, 3, 24), row_key=key)])
+        assert received["data"].startswith(f'"{key}",')
+
+    def test_bulk_load_keeps_empty_title_non_null(self):
+        received = {}
+
+        def fake_copy(sql, stream, prologue=(), epilogue=()):
+            received["data"] = stream.read()
+            return 1
+
+        self.mock_pool.copy_from.side_effect = fake_copy
+        self.repo.bulk_load_activities([ActivityLog(timestamp=datetime(2026, 3, 24), window_title="")])
+        assert ',"",' in received["data"]
+
+    def test_bulk_load_failure(self, sample_activities):
+        self.mock_pool.copy_from.return_value = None
+        result = self.repo.bulk_load_activities(sample_activities)
+        assert result.success is False
+        assert result.rows == 0
+
     def test_get_activities_by_date(self):
         self.mock_pool.fetch_all.return_value = [
             (1, datetime(2026, 3, 24, 10, 0), "VS Code", "productive", 300),
@@ -33,11 +93,50 @@ class TestActivityRepository:
         assert activities[0].window_title == "VS Code"
         assert activities[0].category == AppCategory.PRODUCTIVE
 
+    def test_get_activities_page_pushes_filter_and_keyset_into_sql(self):
+        self.mock_pool.fetch_all.return_value = [
+            (7, datetime(2026, 3, 24, 9, 0), "VS Code", "productive", 60),
+        ]
+        after = (datetime(2026, 3, 24, 10, 0), 9)
+        page = self.repo.get_activities_page(date(2026, 3, 24), "productive", after, limit=50)
+
+        query, params = self.mock_pool.fetch_all.call_args[0]
+        assert "category = %s" in query
+        assert "(timestamp, id) < (%s, %s)" in query
+        assert "ORDER BY timestamp DESC, id DESC" in query
+        assert params[2:] == ("productive", after[0], 9, 50)
+        assert page[0].id == 7
+
+    def test_get_activities_first_page_has_no_keyset(self):
+        self.mock_pool.fetch_all.return_value = []
+        self.repo.get_activities_page(date(2026, 3, 24))
+        query, params = self.mock_pool.fetch_all.call_args[0]
+        assert "(timestamp, id)" not in query
+        assert "category" not in query.split("WHERE")[1]
+        assert len(params) == 3
+
+    def test_count_activities(self):
+        self.mock_pool.fetch_one.return_value = (42,)
+        assert self.repo.count_activities(date(2026, 3, 24), "idle") == 42
+        assert self.mock_pool.fetch_one.call_args[0][1][-1] == "idle"
+
     def test_get_activities_by_date_empty(self):
         self.mock_pool.fetch_all.return_value = []
         activities = self.repo.get_activities_by_date(date(2026, 1, 1))
         assert len(activities) == 0
 
+    def test_iter_activities_streams_models(self):
+        self.mock_pool.iter_query.return_value = iter(
+            [
+                (1, datetime(2026, 3, 24, 10, 0), "VS Code", "productive", 300),
+                (2, datetime(2026, 3, 24, 11, 0), "YouTube", "unproductive", 60),
+            ]
+        )
+        stream = self.repo.iter_activities(date(2026, 3, 1), date(2026, 3, 31), itersize=100)
+        activities = list(stream)
+        assert [a.category for a in activities] == [AppCategory.PRODUCTIVE, AppCategory.UNPRODUCTIVE]
+        assert self.mock_pool.iter_query.call_args.kwargs["itersize"] == 100
+
     def test_get_productivity_summary(self):
         self.mock_pool.fetch_all.return_value = [
             ("productive", 50, 7200),
@@ -47,6 +146,14 @@ class TestActivityRepository:
         assert "productive" in summary
         assert summary["productive"]["total_seconds"] == 7200
 
+    def test_closed_days_are_cached_longer(self):
+        self.mock_pool.fetch_all.return_value = []
+        yesterday = date.today() - timedelta(days=1)
+        self.repo.get_productivity_summary(yesterday - timedelta(days=6), yesterday)
+        assert self.mock_pool.fetch_all.call_args.kwargs["cache_ttl"] == PAST_TTL
+        self.repo.get_top_apps(date.today())
+        assert self.mock_pool.fetch_all.call_args.kwargs["cache_ttl"] == DEFAULT_TTL
+
     def test_get_total_count(self):
         self.mock_pool.fetch_one.return_value = (42,)
         count = self.repo.get_total_count()
@@ -56,3 +163,62 @@ class TestActivityRepository:
         self.mock_pool.fetch_one.return_value = None
         count = self.repo.get_total_count()
         assert count == 0
+
+    def test_cleanup_drops_partitions_before_cutoff(self):
+        self.mock_pool.execute_query_returning.return_value = 2
+        assert self.repo.cleanup_old_logs(30) == 2
+        query, params = self.mock_pool.execute_query_returning.call_args[0]
+        assert "drop_activity_partitions_before" in query
+        assert params == (date.today() - timedelta(days=30),)
+
+    def test_cleanup_failure(self):
+        self.mock_pool.execute_query_returning.return_value = None
+        assert self.repo.cleanup_old_logs(30) is None
+
+    def test_ensure_partitions(self):
+        self.mock_pool.execute_query_returning.return_value = 1
+        assert self.repo.ensure_partitions(months_ahead=2) == 1
+        assert self.mock_pool.execute_query_returning.call_args[0][1][2] == 2
+
+    def test_iter_categorized_titles_filters_keyword(self):
+        self.mock_pool.iter_query.return_value = iter([(1, datetime(2026, 3, 1, 9), "GitHub", "neutral")])
+        rows = list(self.repo.iter_categorized_titles(title_contains="github"))
+        query, params = self.mock_pool.iter_query.call_args[0]
+        assert "strpos(lower(window_title), %s)" in query
+        assert params[-2:] == ("github", 2000)
+        assert rows == [(1, datetime(2026, 3, 1, 9), "GitHub", "neutral")]
+
+    def test_iter_categorized_titles_reads_keyset_pages(self):
+        first = [
+            (1, datetime(2026, 3, 1, 9), "GitHub", "neutral"),
+            (2, datetime(2026, 3, 1, 10), "VS Code", "idle"),
+        ]
+        second = [(3, datetime(2026, 3, 2, 9), "YouTube", "neutral")]
+        self.mock_pool.iter_query.side_effect = [iter(first), iter(second)]
+
+        rows = list(self.repo.iter_categorized_titles(itersize=2))
+
+        assert rows == first + second
+        # Each page is read in full before the next query, continuing after the last (timestamp, id)
+        query, params = self.mock_pool.iter_query.call_args[0]
+        assert "(timestamp, id) > (%s, %s)" in query
+        assert params[-3:] == (datetime(2026, 3, 1, 10), 2, 2)
+
+    def test_update_categories_uses_values_batch(self):
+        self.mock_pool.execute_values.return_value = True
+        rows = [(1, datetime(2026, 3, 1, 9), "productive")]
+        assert self.repo.update_categories(rows) is True
+        query, passed = self.mock_pool.execute_values.call_args[0]
+        assert "FROM (VALUES %s)" in query
+        assert passed == rows
+
+    def test_update_categories_skips_empty(self):
+        assert self.repo.update_categories([]) is True
+        self.mock_pool.execute_values.assert_not_called()
+
+    def test_set_category_for_keyword(self):
+        self.mock_pool.execute_query_returning.return_value = 12
+        changed = self.repo.set_category_for_keyword("github", "productive", ["neutral", "idle"], ("",))
+        assert changed == 12
+        params = self.mock_pool.execute_query_returning.call_args[0][1]
+        assert params == ("productive", "github", ["neutral", "idle"], [""])
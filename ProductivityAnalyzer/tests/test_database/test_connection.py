@@ -0,0 +1,80 @@
+"""Tests for DatabasePool query helpers."""
+
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+
+from database.connection import DatabasePool
+
+
+class TestDatabasePool:
+    def setup_method(self):
+        with patch("database.connection.InstrumentedConnectionPool") as pool_class:
+            self.db = DatabasePool()
+        self.conn = MagicMock()
+        self.conn.closed = 0
+        self.cursor = self.conn.cursor.return_value.__enter__.return_value
+        self.db.pool = pool_class.return_value
+        self.db.pool.getconn.return_value = self.conn
+
+    def test_iter_query_uses_named_cursor(self):
+        self.cursor.__iter__.return_value = iter([(1,), (2,), (3,)])
+
+        rows = list(self.db.iter_query("SELECT id FROM activity_log", itersize=500))
+
+        assert rows == [(1,), (2,), (3,)]
+        assert self.conn.cursor.call_args.kwargs["name"].startswith("stream_")
+        assert self.cursor.itersize == 500
+        self.conn.rollback.assert_called_once()
+        self.db.pool.putconn.assert_called_once_with(self.conn)
+
+    def test_iter_query_returns_connection_when_abandoned(self):
+        self.cursor.__iter__.return_value = iter([(1,), (2,), (3,)])
+
+        stream = self.db.iter_query("SELECT id FROM activity_log")
+        assert next(stream) == (1,)
+        stream.close()
+
+        self.db.pool.putconn.assert_called_once_with(self.conn)
+
+    def test_iter_query_error_is_raised(self):
+        self.cursor.execute.side_effect = psycopg2.Error("boom")
+        with pytest.raises(psycopg2.Error):
+            list(self.db.iter_query("SELECT 1"))
+        self.db.pool.putconn.assert_called_once_with(self.conn)
+
+    def test_iter_query_error_mid_stream_is_raised_after_rollback(self):
+        def rows():
+            yield (1,)
+            raise psycopg2.OperationalError("connection lost")
+
+        self.cursor.__iter__.side_effect = lambda: rows()
+        stream = self.db.iter_query("SELECT id FROM activity_log")
+
+        assert next(stream) == (1,)
+        with pytest.raises(psycopg2.OperationalError):
+            next(stream)
+        self.conn.rollback.assert_called()
+        self.db.pool.putconn.assert_called_once_with(self.conn)
+
+    def test_cached_fetch_skips_database_until_written(self):
+        self.cursor.fetchall.return_value = [("productive", 3, 900)]
+        query = "SELECT category, COUNT(*) FROM activity_log GROUP BY category"
+
+        assert self.db.fetch_all(query, cache_ttl=60) == [("productive", 3, 900)]
+        assert self.db.fetch_all(query, cache_ttl=60) == [("productive", 3, 900)]
+        assert self.cursor.execute.call_count == 1
+
+        self.db.execute_query("INSERT INTO activity_log (window_title) VALUES (%s)", ("x",))
+        self.db.fetch_all(query, cache_ttl=60)
+        assert self.cursor.execute.call_count == 3
+        assert self.db.cache_stats().hits == 1
+
+    def test_failed_fetch_is_not_cached(self):
+        self.cursor.execute.side_effect = psycopg2.Error("boom")
+        assert self.db.fetch_all("SELECT 1 FROM goals", cache_ttl=60) == []
+
+        self.cursor.execute.side_effect = None
+        self.cursor.fetchall.return_value = [(1,)]
+        assert self.db.fetch_all("SELECT 1 FROM goals", cache_ttl=60) == [(1,)]
@@ -0,0 +1,42 @@
+"""Tests for DailySummaryRepository."""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+from database.repositories.daily_summary_repo import DailySummaryRepository
+
+
+class TestDailySummaryRepository:
+    def setup_method(self):
+        self.mock_pool = MagicMock()
+        self.repo = DailySummaryRepository(self.mock_pool)
+
+    def test_get_summaries(self):
+        self.mock_pool.fetch_all.return_value = [
+            (date(2026, 3, 23), 3600, 600, 300, 0, 12),
+            (date(2026, 3, 24), 1800, None, 0, 120, 5),
+        ]
+        summaries = self.repo.get_summaries(date(2026, 3, 23), date(2026, 3, 24))
+        assert len(summaries) == 2
+        assert summaries[0].productive_seconds == 3600
+        assert summaries[0].total_entries == 12
+        assert summaries[1].unproductive_seconds == 0
+        assert summaries[1].total_seconds == 1920
+
+    def test_rebuild_range(self):
+        self.mock_pool.execute_query.return_value = True
+        assert self.repo.rebuild(date(2026, 3, 1), date(2026, 3, 31)) is True
+        query, params = self.mock_pool.execute_query.call_args[0]
+        assert "LOCK TABLE activity_log" in query
+        assert params == (
+            date(2026, 3, 1),
+            date(2026, 3, 31),
+            datetime(2026, 3, 1),
+            datetime(2026, 4, 1),
+        )
+
+    def test_rebuild_all_history(self):
+        self.repo.rebuild()
+        params = self.mock_pool.execute_query.call_args[0][1]
+        assert params[0] == date.min
+        assert params[1] == date.max
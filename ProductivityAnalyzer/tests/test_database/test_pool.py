@@ -0,0 +1,128 @@
+"""Tests for InstrumentedConnectionPool."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+from psycopg2 import extensions
+
+from database.pool import InstrumentedConnectionPool, PoolTimeoutError
+
+
+def _fake_connect(*args, **kwargs):
+    conn = MagicMock()
+    conn.closed = 0
+    conn.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+    def close():
+        conn.closed = 1
+
+    conn.close.side_effect = close
+    return conn
+
+
+@pytest.fixture(autouse=True)
+def fake_psycopg2_connect():
+    with patch("psycopg2.connect", side_effect=_fake_connect) as connect:
+        yield connect
+
+
+class TestInstrumentedConnectionPool:
+    def test_checkout_and_return(self):
+        pool = InstrumentedConnectionPool(1, 2, timeout=1)
+        conn = pool.getconn()
+        assert pool.stats().in_use == 1
+        pool.putconn(conn)
+
+        stats = pool.stats()
+        assert stats.in_use == 0
+        assert stats.idle == 1
+        assert stats.checkouts == 1
+        assert stats.connections_opened == 1
+
+    def test_times_out_when_exhausted(self):
+        pool = InstrumentedConnectionPool(1, 1, timeout=0.05)
+        pool.getconn()
+        with pytest.raises(PoolTimeoutError):
+            pool.getconn()
+        stats = pool.stats()
+        assert stats.timeouts == 1
+        assert stats.saturation == 1.0
+
+    def test_waiter_gets_returned_connection(self):
+        pool = InstrumentedConnectionPool(1, 1, timeout=2)
+        conn = pool.getconn()
+        acquired = []
+
+        def worker():
+            acquired.append(pool.getconn())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        time.sleep(0.05)
+        pool.putconn(conn)
+        thread.join(timeout=2)
+
+        assert acquired == [conn]
+        stats = pool.stats()
+        assert stats.waited_checkouts == 1
+        assert stats.max_wait_seconds > 0
+
+    def test_churn_counts_connections_beyond_minconn(self):
+        pool = InstrumentedConnectionPool(1, 3, timeout=1)
+        first, second = pool.getconn(), pool.getconn()
+        pool.putconn(first)
+        pool.putconn(second)
+
+        stats = pool.stats()
+        assert stats.connections_opened == 2
+        assert stats.connections_closed == 1
+        assert stats.peak_in_use == 2
+        assert stats.avg_hold_seconds >= 0
+
+    def test_closeall_counts_open_connections(self):
+        pool = InstrumentedConnectionPool(2, 2, timeout=1)
+        pool.closeall()
+        assert pool.stats().connections_closed == 2
+
+    def test_slow_connect_does_not_block_other_threads(self, fake_psycopg2_connect):
+        pool = InstrumentedConnectionPool(1, 2, timeout=2)
+        idle = pool.getconn()
+        pool.putconn(idle)
+        held = pool.getconn()
+        release = threading.Event()
+
+        def slow_connect(*args, **kwargs):
+            release.wait(2)
+            return _fake_connect()
+
+        fake_psycopg2_connect.side_effect = slow_connect
+        opened = []
+        thread = threading.Thread(target=lambda: opened.append(pool.getconn()))
+        thread.start()
+        time.sleep(0.05)
+
+        # The connect in progress holds the second slot, not the lock
+        started = time.perf_counter()
+        pool.putconn(held)
+        assert pool.getconn(timeout=0.5) is held
+        assert time.perf_counter() - started < 0.5
+
+        release.set()
+        thread.join(timeout=2)
+        assert len(opened) == 1
+        assert pool.stats().in_use == 2
+
+    def test_failed_connect_gives_the_slot_back(self, fake_psycopg2_connect):
+        pool = InstrumentedConnectionPool(0, 1, timeout=0.5)
+        fake_psycopg2_connect.side_effect = psycopg2.OperationalError("server down")
+        with pytest.raises(psycopg2.OperationalError):
+            pool.getconn()
+
+        fake_psycopg2_connect.side_effect = _fake_connect
+        pool.getconn()
+        stats = pool.stats()
+        assert stats.in_use == 1
+        assert stats.timeouts == 0
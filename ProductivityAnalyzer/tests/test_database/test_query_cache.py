@@ -0,0 +1,91 @@
+"""Tests for the query result cache."""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+from database.query_cache import DEFAULT_TTL, FOREVER, PAST_TTL, QueryCache, range_ttl
+
+SUMMARY = "SELECT category, COUNT(*) FROM activity_log WHERE timestamp >= %s GROUP BY category"
+GOALS = "SELECT id, title FROM goals WHERE is_active = TRUE"
+
+
+class TestQueryCache:
+    def setup_method(self):
+        self.now = [0.0]
+        self.cache = QueryCache(max_entries=3, clock=lambda: self.now[0])
+
+    def _get(self, query, params=None, ttl=60.0, value="rows"):
+        load = MagicMock(return_value=value)
+        return self.cache.get_or_load(query, params, ttl, load), load.called
+
+    def test_hit_after_first_load(self):
+        assert self._get(SUMMARY, (1,)) == ("rows", True)
+        assert self._get(SUMMARY, (1,)) == ("rows", False)
+        assert self._get(SUMMARY, (2,)) == ("rows", True)
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+        assert stats.hit_rate == 1 / 3
+
+    def test_write_invalidates_only_tables_read(self):
+        self._get(SUMMARY)
+        self._get(GOALS)
+        self.cache.record_write("INSERT INTO goals (title) VALUES (%s)")
+        assert self._get(SUMMARY)[1] is False
+        assert self._get(GOALS)[1] is True
+
+    def test_partition_and_trigger_writes_count(self):
+        rollup = "SELECT * FROM daily_summary WHERE summary_date BETWEEN %s AND %s"
+        self._get(rollup)
+        self._get(SUMMARY)
+        self.cache.record_write("UPDATE activity_log_p2026_03 SET category = 'idle'")
+        # The rollup triggers on activity_log rewrite daily_summary too
+        assert self._get(rollup)[1] is True
+        assert self._get(SUMMARY)[1] is True
+
+    def test_unknown_write_invalidates_everything(self):
+        self._get(GOALS)
+        self.cache.record_write("SELECT ensure_activity_partitions(%s, %s)")
+        assert self._get(GOALS)[1] is True
+
+    def test_ttl_expiry(self):
+        self._get(GOALS, ttl=30)
+        self.now[0] = 29
+        assert self._get(GOALS)[1] is False
+        self.now[0] = 31
+        assert self._get(GOALS)[1] is True
+
+    def test_forever_never_expires(self):
+        self._get(SUMMARY, ttl=FOREVER)
+        self.now[0] = 10**9
+        assert self._get(SUMMARY)[1] is False
+
+    def test_lru_eviction(self):
+        for i in range(3):
+            self._get(GOALS, (i,))
+        self._get(GOALS, (0,))  # most recently used now
+        self._get(GOALS, (3,))
+        assert self.cache.stats().evictions == 1
+        assert self._get(GOALS, (0,))[1] is False
+        assert self._get(GOALS, (1,))[1] is True
+
+    def test_failures_and_unhashable_params_bypass(self):
+        assert self._get(GOALS, value=None) == (None, True)
+        assert self._get(GOALS, value=None) == (None, True)
+        assert self._get(GOALS, (["a"],))[1] is True
+        assert self._get(GOALS, (["a"],))[1] is True
+        assert self.cache.stats().size == 0
+
+    def test_write_during_load_stales_result(self):
+        def load():
+            self.cache.record_write("INSERT INTO goals (title) VALUES ('x')")
+            return "old rows"
+
+        self.cache.get_or_load(GOALS, None, 60, load)
+        assert self._get(GOALS, value="new rows") == ("new rows", True)
+
+
+def test_range_ttl():
+    # Finite, so writes from other processes (recategorizer, rebuild_summaries) eventually show up
+    assert range_ttl(date.today() - timedelta(days=1)) == PAST_TTL
+    assert PAST_TTL < FOREVER
+    assert range_ttl(date.today()) == DEFAULT_TTL
@@ -0,0 +1,219 @@
+"""
+EXPLAIN checks for the activity_log range queries.
+
+These run against a real PostgreSQL server and are skipped unless
+TEST_DATABASE_URL is set. Each run works in a throwaway schema.
+"""
+
+import io
+import json
+import os
+import uuid
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from config.constants import AppCategory
+from database.migrations import (
+    migration_001_initial_schema,
+    migration_002_soft_deletes,
+    migration_003_daily_summary_rollup,
+    migration_004_covering_indexes,
+    migration_005_partition_activity_log,
+    migration_006_activity_row_keys,
+)
+from database.models import ActivityLog
+from database.repositories.activity_repo import ActivityRepository
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+START = date(2026, 1, 1)
+DAYS = 120
+ROWS_PER_DAY = 200
+
+MIGRATIONS = (
+    migration_001_initial_schema,
+    migration_002_soft_deletes,
+    migration_003_daily_summary_rollup,
+    migration_004_covering_indexes,
+    migration_005_partition_activity_log,
+    migration_006_activity_row_keys,
+)
+
+
+@pytest.fixture(scope="module")
+def pg_conn():
+    psycopg2 = pytest.importorskip("psycopg2")
+    conn = psycopg2.connect(TEST_DATABASE_URL)
+    schema = f"plan_test_{uuid.uuid4().hex[:8]}"
+    with conn.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+        cursor.execute(f"SET search_path TO {schema}")
+        for migration in MIGRATIONS:
+            for sql in migration.SQL_STATEMENTS:
+                cursor.execute(sql)
+
+        categories = ("productive", "unproductive", "neutral", "idle")
+        buf = io.StringIO()
+        for day in range(DAYS):
+            for i in range(ROWS_PER_DAY):
+                ts = datetime.combine(START + timedelta(days=day), datetime.min.time()) + timedelta(
+                    minutes=i * 7
+                )
+                buf.write(f"{ts.isoformat()}\twindow {i % 40}\t{categories[i % 4]}\t60\n")
+        buf.seek(0)
+        cursor.copy_expert(
+            "COPY activity_log (timestamp, window_title, category, duration_seconds) FROM STDIN",
+            buf,
+        )
+        # Rows were parked in the default partition; this moves them into monthly partitions
+        cursor.execute("SELECT ensure_activity_partitions(%s, %s)", (START, START + timedelta(days=DAYS)))
+        conn.commit()
+
+        conn.autocommit = True
+        cursor.execute("VACUUM ANALYZE activity_log")
+    try:
+        yield conn
+    finally:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        conn.close()
+
+
+def _captured_query(call):
+    """Run a repository method against a mock pool and return the SQL it issued."""
+    pool = MagicMock()
+    pool.fetch_all.return_value = []
+    call(ActivityRepository(pool))
+    return pool.fetch_all.call_args[0]
+
+
+def _plan_nodes(conn, query, params):
+    with conn.cursor() as cursor:
+        cursor.execute("SET enable_seqscan = off")
+        try:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {query}", params)
+            plan = cursor.fetchone()[0]
+        finally:
+            cursor.execute("RESET enable_seqscan")
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    nodes, stack = [], [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get("Plans", []))
+    return nodes
+
+
+def _covering_index_names(conn):
+    """idx_activity_ts_covering plus the per-partition indexes attached to it."""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT c.relname FROM pg_class c
+            WHERE c.oid = 'idx_activity_ts_covering'::regclass
+               OR c.oid IN (SELECT inhrelid FROM pg_inherits
+                            WHERE inhparent = 'idx_activity_ts_covering'::regclass)
+            """)
+        return {row[0] for row in cursor.fetchall()}
+
+
+def _uses_covering_index(conn, nodes, index_only=True):
+    scan_types = (
+        ("Index Only Scan",) if index_only else ("Index Only Scan", "Index Scan", "Bitmap Index Scan")
+    )
+    names = _covering_index_names(conn)
+    return any(node["Node Type"] in scan_types and node.get("Index Name") in names for node in nodes)
+
+
+def _scanned_relations(nodes):
+    return {node["Relation Name"] for node in nodes if "Relation Name" in node}
+
+
+class TestActivityQueryPlans:
+    def test_productivity_summary_is_index_only(self, pg_conn):
+        query, params = _captured_query(
+            lambda repo: repo.get_productivity_summary(date(2026, 2, 1), date(2026, 2, 7))
+        )
+        assert _uses_covering_index(pg_conn, _plan_nodes(pg_conn, query, params))
+
+    def test_top_apps_uses_timestamp_range(self, pg_conn):
+        query, params = _captured_query(lambda repo: repo.get_top_apps(date(2026, 2, 3)))
+        assert _uses_covering_index(pg_conn, _plan_nodes(pg_conn, query, params), index_only=False)
+
+    def test_week_query_prunes_to_one_partition(self, pg_conn):
+        query, params = _captured_query(
+            lambda repo: repo.get_productivity_summary(date(2026, 2, 9), date(2026, 2, 15))
+        )
+        assert _scanned_relations(_plan_nodes(pg_conn, query, params)) == {"activity_log_p2026_02"}
+
+    def test_activity_page_reads_only_one_page(self, pg_conn):
+        query, params = _captured_query(
+            lambda repo: repo.get_activities_page(
+                date(2026, 3, 10), "idle", after=(datetime(2026, 3, 10, 12, 0), 10**9), limit=50
+            )
+        )
+        nodes = _plan_nodes(pg_conn, query, params)
+        assert nodes[0]["Node Type"] == "Limit"
+        # Rows come out of the timestamp index already ordered; no full sort of the day
+        assert "Sort" not in {node["Node Type"] for node in nodes}
+        assert _scanned_relations(nodes) == {"activity_log_p2026_03"}
+
+    def test_day_query_prunes_to_one_partition(self, pg_conn):
+        query, params = _captured_query(lambda repo: repo.get_top_apps(date(2026, 3, 31)))
+        assert _scanned_relations(_plan_nodes(pg_conn, query, params)) == {"activity_log_p2026_03"}
+
+
+class _ConnPool:
+    """Just enough of DatabasePool to run ActivityRepository writes on one connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def copy_from(self, copy_sql, stream, prologue=(), epilogue=()):
+        self.conn.autocommit = False
+        try:
+            with self.conn.cursor() as cursor:
+                for statement in prologue:
+                    cursor.execute(statement)
+                cursor.copy_expert(copy_sql, stream)
+                rowcount = cursor.rowcount
+                for statement in epilogue:
+                    cursor.execute(statement)
+            self.conn.commit()
+            return rowcount
+        finally:
+            self.conn.autocommit = True
+
+
+class TestIdempotentReplay:
+    def test_replayed_rows_are_inserted_once(self, pg_conn):
+        day = datetime(2026, 6, 15, 9, 0)  # after the seeded range
+        activities = [
+            ActivityLog(
+                timestamp=day + timedelta(minutes=i),
+                window_title="replay test",
+                category=AppCategory.PRODUCTIVE,
+                duration_seconds=60,
+                row_key=str(uuid.uuid4()),
+            )
+            for i in range(5)
+        ]
+        repo = ActivityRepository(_ConnPool(pg_conn))
+
+        assert repo.bulk_load_activities(activities[:3]).success
+        # The whole batch is replayed after the first part was already committed
+        assert repo.bulk_load_activities(activities).success
+
+        with pg_conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM activity_log WHERE window_title = 'replay test'")
+            assert cursor.fetchone()[0] == 5
+            cursor.execute(
+                "SELECT productive_seconds, total_entries FROM daily_summary WHERE summary_date = %s",
+                (day.date(),),
+            )
+            assert cursor.fetchone() == (300, 5)
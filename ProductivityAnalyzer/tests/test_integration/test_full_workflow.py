@@ -3,7 +3,7 @@
 Integration tests - test real component interactions (with mocked DB).
 """
 
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import MagicMock
 
 from config.constants import AppCategory
@@ -11,6 +11,28 @@ from database.models import ActivityLog, DailySummary, ProductivityGoal
 from reporting.report_generator import ReportGenerator
 from services.suggestion_engine import SuggestionEngine
 from tracking.categorizer import AppCategorizer
+from tracking.live_aggregator import LiveAggregator
+
+
+def _fetch_all_for(category_rows):
+    """Serve (category, count, total) rows, or today's daily_summary rollup row built from them."""
+
+    def fetch_all(query, params=None, cache_ttl=None):
+        if "FROM daily_summary" in query:
+            seconds = {row[0]: row[2] for row in category_rows}
+            return [
+                (
+                    date.today(),
+                    seconds.get("productive", 0),
+                    seconds.get("unproductive", 0),
+                    seconds.get("neutral", 0),
+                    seconds.get("idle", 0),
+                    sum(row[1] for row in category_rows),
+                )
+            ]
+        return category_rows
+
+    return fetch_all
 
 
 class TestCategorizerToReportingPipeline:
@@ -70,11 +92,13 @@ class TestSuggestionEngineIntegration:
     def test_high_distraction_produces_critical_suggestion(self):
         """High unproductive time triggers critical alert."""
         mock_pool = MagicMock()
-        mock_pool.fetch_all.return_value = [
-            ("productive", 5, 1000),
-            ("unproductive", 20, 5000),
-            ("neutral", 2, 500),
-        ]
+        mock_pool.fetch_all.side_effect = _fetch_all_for(
+            [
+                ("productive", 5, 1000),
+                ("unproductive", 20, 5000),
+                ("neutral", 2, 500),
+            ]
+        )
 
         engine = SuggestionEngine(mock_pool)
         suggestions = engine.get_suggestions()
@@ -85,11 +109,13 @@ class TestSuggestionEngineIntegration:
     def test_great_productivity_produces_positive_suggestion(self):
         """High productive time triggers positive feedback."""
         mock_pool = MagicMock()
-        mock_pool.fetch_all.return_value = [
-            ("productive", 50, 14400),
-            ("unproductive", 2, 300),
-            ("neutral", 5, 900),
-        ]
+        mock_pool.fetch_all.side_effect = _fetch_all_for(
+            [
+                ("productive", 50, 14400),
+                ("unproductive", 2, 300),
+                ("neutral", 5, 900),
+            ]
+        )
 
         engine = SuggestionEngine(mock_pool)
         suggestions = engine.get_suggestions()
@@ -107,6 +133,28 @@ class TestSuggestionEngineIntegration:
 
         assert len(suggestions) >= 1
 
+    def test_today_comes_from_live_totals(self):
+        """With live totals, today's numbers and meeting time never hit activity_log."""
+        mock_pool = MagicMock()
+        mock_pool.fetch_all.return_value = []
+        live = LiveAggregator()
+        live.reconcile(MagicMock(**{"get_productivity_summary.return_value": {}}), today=date.today())
+        live.record(
+            ActivityLog(
+                timestamp=datetime.combine(date.today(), datetime.min.time()),
+                window_title="Zoom Meeting",
+                category=AppCategory.NEUTRAL,
+                duration_seconds=6 * 3600,
+            )
+        )
+
+        engine = SuggestionEngine(mock_pool, live=live)
+        suggestions = engine.get_suggestions()
+
+        assert "Meeting Overload!" in [s.title for s in suggestions]
+        queries = [c.args[0] for c in mock_pool.fetch_all.call_args_list]
+        assert not any("FROM activity_log" in q for q in queries)
+
 
 class TestGoalProgressIntegration:
     """Test goal model calculations."""
@@ -0,0 +1,49 @@
+# tests/test_reporting/test_activity_counts.py
+"""Tests for pivoting activity counts into the bar chart's matrix."""
+
+from datetime import date, timedelta
+
+from reporting.charts.activity_counts import CATEGORIES, DailyCountMatrix
+from reporting.charts.renderer import content_key
+
+D1, D2 = date(2026, 3, 1), date(2026, 3, 2)
+
+
+class TestDailyCountMatrix:
+    def test_pivot_fills_missing_pairs_with_zero(self):
+        matrix = DailyCountMatrix.from_rows(
+            [
+                {"date": D2, "category": "idle", "count": 4},
+                {"date": D1, "category": "productive", "count": 10},
+                {"date": D2, "category": "productive", "count": 7},
+            ]
+        )
+
+        assert matrix.dates == (D1, D2)
+        assert matrix.counts.shape == (len(CATEGORIES), 2)
+        assert matrix.counts.tolist() == [[10, 7], [0, 0], [0, 0], [0, 4]]
+
+    def test_unknown_categories_are_ignored(self):
+        matrix = DailyCountMatrix.from_rows([{"date": D1, "category": "meetings", "count": 3}])
+        assert matrix.dates == (D1,)
+        assert matrix.counts.sum() == 0
+
+    def test_empty(self):
+        matrix = DailyCountMatrix.from_rows([])
+        assert len(matrix) == 0
+        assert matrix.counts.shape == (len(CATEGORIES), 0)
+
+    def test_cache_key_sees_every_value_of_a_large_matrix(self):
+        rows = [
+            {"date": D1 + timedelta(days=i), "category": category.value, "count": i}
+            for i in range(365)
+            for category in CATEGORIES
+        ]
+        changed = [dict(row) for row in rows]
+        changed[700]["count"] += 1
+
+        original = DailyCountMatrix.from_rows(rows)
+        assert "..." not in repr(original)
+        assert content_key("bars", original, 9, 5, {}) != content_key(
+            "bars", DailyCountMatrix.from_rows(changed), 9, 5, {}
+        )
@@ -0,0 +1,85 @@
+# tests/test_reporting/test_chart_renderer.py
+"""Tests for the off-thread chart renderer and its image cache."""
+
+import threading
+from datetime import date, timedelta
+
+from database.models import DailySummary
+from reporting.charts.renderer import ChartRenderer, content_key
+
+
+def _week(productive: int = 3600) -> list[DailySummary]:
+    start = date(2026, 3, 1)
+    return [
+        DailySummary(date=start + timedelta(days=i), productive_seconds=productive, score=60)
+        for i in range(7)
+    ]
+
+
+class TestChartRenderer:
+    def test_same_data_is_served_from_cache(self):
+        renderer = ChartRenderer()
+        first = renderer.render("trend", _week(), width=6, height=3.5)
+        again = renderer.render("trend", _week(), width=6, height=3.5)
+
+        assert again is first
+        assert (first.width, first.height) == (600, 350)
+        stats = renderer.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.cached_bytes == first.nbytes
+
+    def test_new_data_reuses_the_live_figure(self):
+        renderer = ChartRenderer()
+        first = renderer.render("trend", _week(), width=6, height=3.5)
+        second = renderer.render("trend", _week(productive=7200), width=6, height=3.5)
+
+        assert second.key != first.key
+        assert second.rgba != first.rgba
+        assert len(renderer._charts) == 1
+
+    def test_options_and_size_are_part_of_the_key(self):
+        renderer = ChartRenderer()
+        weekly = renderer.render("trend", _week(), width=6, height=3.5)
+        titled = renderer.render("trend", _week(), width=6, height=3.5, title="Last 30 Days")
+        larger = renderer.render("trend", _week(), width=9, height=5)
+
+        assert len({weekly.key, titled.key, larger.key}) == 3
+        assert len(renderer._charts) == 3
+
+    def test_least_recently_used_images_are_evicted(self):
+        renderer = ChartRenderer(max_images=2)
+        a = renderer.render("pie", DailySummary(date=date(2026, 3, 1), productive_seconds=60), 2, 2)
+        renderer.render("pie", DailySummary(date=date(2026, 3, 2), productive_seconds=60), 2, 2)
+        # Touching the first image again makes the second one the least recently used
+        renderer.render("pie", DailySummary(date=date(2026, 3, 1), productive_seconds=60), 2, 2)
+        renderer.render("pie", DailySummary(date=date(2026, 3, 3), productive_seconds=60), 2, 2)
+
+        assert renderer.stats().size == 2
+        assert a.key in renderer._images
+
+    def test_content_key_depends_on_values_not_identity(self):
+        assert content_key("trend", _week(), 6, 3.5, {}) == content_key("trend", _week(), 6, 3.5, {})
+        assert content_key("trend", _week(), 6, 3.5, {}) != content_key("trend", _week(60), 6, 3.5, {})
+
+    def test_concurrent_renders_from_worker_threads(self):
+        renderer = ChartRenderer()
+        errors, images = [], []
+
+        def work(productive: int) -> None:
+            try:
+                images.append(renderer.render("trend", _week(productive), width=4, height=3))
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(600 * i,)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+
+        assert errors == []
+        assert len({image.key for image in images}) == 6
+
+    def test_png_export(self):
+        image = ChartRenderer().render("bars", [], width=2, height=2)
+        assert image.to_png().startswith(b"\x89PNG")
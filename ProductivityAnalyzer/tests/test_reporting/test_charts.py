@@ -0,0 +1,152 @@
+# tests/test_reporting/test_charts.py
+"""Tests for the matplotlib charts' in-place updates (headless, no Qt needed)."""
+
+import os
+from datetime import date, timedelta
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from database.models import DailySummary
+from reporting.charts.activity_chart import MAX_DATE_LABELS, ActivityBarChart
+from reporting.charts.activity_counts import DailyCountMatrix
+from reporting.charts.base import BaseChart
+from reporting.charts.productivity_pie import ProductivityPieChart
+from reporting.charts.trend_line import ProductivityTrendChart
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def _week(start: date, productive: int = 3600) -> list[DailySummary]:
+    return [
+        DailySummary(date=start + timedelta(days=i), productive_seconds=productive + i * 60, score=50 + i)
+        for i in range(7)
+    ]
+
+
+def _counts(days: int, count: int = 5) -> list[dict]:
+    start = date(2026, 3, 1)
+    return [
+        {"date": start + timedelta(days=i), "category": category, "count": count + i}
+        for i in range(days)
+        for category in ("productive", "idle")
+    ]
+
+
+def test_chart_without_plot_cannot_be_created():
+    class NoPlot(BaseChart[list]):
+        pass
+
+    with pytest.raises(TypeError):
+        NoPlot([])
+
+
+class TestProductivityTrendChart:
+    def test_same_length_update_reuses_artists(self):
+        chart = ProductivityTrendChart(_week(date(2026, 3, 1)))
+        fig, canvas, line = chart.fig, chart.canvas, chart._score_line
+        first_bar = chart._productive_bars[0]
+
+        chart.update(_week(date(2026, 3, 8), productive=7200))
+        image = chart.image()
+
+        assert (image.width, image.height) == (800, 400)
+        assert image.nbytes == 800 * 400 * 4
+        assert chart.fig is fig and chart.canvas is canvas
+        assert chart._score_line is line
+        assert chart._productive_bars[0] is first_bar
+        assert first_bar.get_height() == 120
+        assert chart.ax.get_xticklabels()[0].get_text() == "03/08"
+
+    def test_length_change_replots_on_same_figure(self):
+        chart = ProductivityTrendChart(_week(date(2026, 3, 1)))
+        fig, twin = chart.fig, chart.ax2
+
+        chart.update(_week(date(2026, 3, 1)) + _week(date(2026, 3, 8)))
+
+        assert chart.fig is fig and chart.ax2 is twin
+        assert len(chart._score_line.get_xdata()) == 14
+        assert len(fig.axes) == 2
+
+    def test_empty_and_back(self):
+        chart = ProductivityTrendChart([])
+        assert not chart.ax.axison
+        chart.update(_week(date(2026, 3, 1)))
+        assert chart.ax.axison and len(chart._productive_bars) == 7
+        chart.update([])
+        assert not chart.ax.axison and not chart.ax2.axison
+        chart.canvas.draw()
+
+
+class TestProductivityPieChart:
+    def test_same_slices_update_in_place(self):
+        chart = ProductivityPieChart(
+            DailySummary(date=date(2026, 3, 1), productive_seconds=3600, idle_seconds=3600)
+        )
+        wedges = list(chart._wedges)
+
+        chart.update(DailySummary(date=date(2026, 3, 2), productive_seconds=5400, idle_seconds=1800))
+        chart.canvas.draw()
+
+        assert chart._wedges == wedges
+        assert wedges[0].theta2 - wedges[0].theta1 == pytest.approx(270)
+        assert chart._autotexts[0].get_text() == "75.0%"
+
+    def test_new_category_replots(self):
+        chart = ProductivityPieChart(DailySummary(date=date(2026, 3, 1), productive_seconds=3600))
+        chart.update(DailySummary(date=date(2026, 3, 1), productive_seconds=3600, neutral_seconds=600))
+        assert len(chart._wedges) == 2
+        assert len(chart.fig.axes) == 1
+
+    def test_no_data(self):
+        chart = ProductivityPieChart(DailySummary(date=date(2026, 3, 1)))
+        assert not chart.ax.axison
+        chart.canvas.draw()
+
+
+def _heights(bars) -> list[float]:
+    """Bar heights of one category's PolyCollection."""
+    return [path.vertices[1, 1] for path in bars.get_paths()]
+
+
+class TestActivityBarChart:
+    def test_update_sets_bar_heights_in_place(self):
+        chart = ActivityBarChart(_counts(3))
+        bars = chart._bars[0]
+
+        chart.update(_counts(3, count=40))
+        chart.image()
+
+        assert chart._bars[0] is bars
+        assert _heights(bars) == [40, 41, 42]
+        # Categories without rows get zero-height bars
+        assert _heights(chart._bars[1]) == [0, 0, 0]
+        assert chart.ax.get_ylim()[1] >= 42
+
+    def test_range_change_reuses_collections(self):
+        chart = ActivityBarChart(_counts(3))
+        bars = chart._bars[0]
+        chart.update(_counts(5))
+        assert chart._bars[0] is bars
+        assert len(_heights(bars)) == 5
+        assert len(chart.ax.get_xticklabels()) == 5
+
+    def test_long_range_from_matrix_thins_date_labels(self):
+        chart = ActivityBarChart(DailyCountMatrix.from_rows(_counts(90)), width=9, height=5)
+        chart.image()
+
+        assert len(_heights(chart._bars[0])) == 90
+        assert _heights(chart._bars[3])[89] == 5 + 89
+        assert len(chart.ax.get_xticklabels()) <= MAX_DATE_LABELS
+
+    def test_empty_and_back(self):
+        chart = ActivityBarChart([])
+        assert not chart.ax.axison
+        chart.update(_counts(2))
+        assert chart.ax.axison and len(chart._bars) == 4
@@ -1,9 +1,10 @@
 # tests/test_reporting/test_report_generator.py
 """Tests for ReportGenerator."""
 
-from datetime import date
+from datetime import date, timedelta
 from unittest.mock import MagicMock, patch
 
+from database.models import DailySummary
 from reporting.report_generator import ReportGenerator
 
 
@@ -36,11 +37,93 @@ class TestReportGenerator:
         assert summary.unproductive_seconds == 1800
         assert summary.score > 0
 
-    @patch("reporting.report_generator.ActivityRepository")
-    def test_get_weekly_summaries(self, mock_repo_class):
+    def test_get_weekly_summaries(self):
         mock_repo = MagicMock()
-        mock_repo.get_productivity_summary.return_value = {}
-        self.gen.activity_repo = mock_repo
+        mock_repo.get_summaries.return_value = []
+        self.gen.summary_repo = mock_repo
+        self.gen.activity_repo = MagicMock()
 
         summaries = self.gen.get_weekly_summaries()
         assert len(summaries) == 7
+        mock_repo.get_summaries.assert_called_once()
+        self.gen.activity_repo.get_productivity_summary.assert_not_called()
+
+    def test_get_monthly_summaries_fills_missing_days(self):
+        today = date.today()
+        mock_repo = MagicMock()
+        mock_repo.get_summaries.return_value = [DailySummary(date=today, productive_seconds=3600)]
+        self.gen.summary_repo = mock_repo
+
+        summaries = self.gen.get_monthly_summaries()
+        assert len(summaries) == 30
+        assert summaries[0].date == today - timedelta(days=29)
+        assert summaries[-1].productive_seconds == 3600
+        assert summaries[-1].score > 0
+        assert all(s.total_seconds == 0 for s in summaries[:-1])
+
+    def test_get_quarterly_summaries_folds_days_into_weeks(self):
+        today = date.today()
+        mock_repo = MagicMock()
+        mock_repo.get_summaries.return_value = [
+            DailySummary(date=today - timedelta(days=13), productive_seconds=600, total_entries=1),
+            DailySummary(date=today - timedelta(days=8), productive_seconds=900, total_entries=2),
+            DailySummary(date=today, idle_seconds=60, total_entries=1),
+        ]
+        self.gen.summary_repo = mock_repo
+
+        summaries = self.gen.get_quarterly_summaries()
+        assert len(summaries) == 13
+        mock_repo.get_summaries.assert_called_once()
+        assert summaries[-3].date == today - timedelta(weeks=2)
+        assert summaries[-3].productive_seconds == 1500
+        assert summaries[-3].total_entries == 3
+        assert summaries[-2].total_seconds == 0
+        assert summaries[-1].idle_seconds == 60
+
+
+class TestReportGeneratorLiveTotals:
+    def setup_method(self):
+        self.live = MagicMock()
+        self.gen = ReportGenerator(MagicMock(), live=self.live)
+        self.gen.activity_repo = MagicMock()
+
+    def test_today_is_served_from_live_totals(self):
+        self.live.covers.return_value = True
+        self.live.summary.return_value = {"productive": {"count": 2, "total_seconds": 3600}}
+        self.live.top_apps.return_value = [{"window_title": "Editor", "count": 2, "total_seconds": 3600}]
+
+        summary = self.gen.get_daily_summary()
+        assert summary.productive_seconds == 3600
+        assert summary.total_entries == 2
+        assert self.gen.get_top_apps_today(limit=5)[0]["window_title"] == "Editor"
+        self.live.top_apps.assert_called_once_with(5)
+        self.gen.activity_repo.get_productivity_summary.assert_not_called()
+        self.gen.activity_repo.get_top_apps.assert_not_called()
+
+    def test_other_days_fall_back_to_database(self):
+        self.live.covers.return_value = False
+        self.gen.activity_repo.get_productivity_summary.return_value = {}
+        self.gen.get_daily_summary(date(2026, 3, 24))
+        self.gen.activity_repo.get_productivity_summary.assert_called_once()
+        self.live.summary.assert_not_called()
+
+    def test_trend_point_for_today_matches_daily_summary(self):
+        today = date.today()
+        self.live.covers.side_effect = lambda day: day == today
+        # The open window is in the live totals but not yet in the rollup
+        self.live.summary.return_value = {
+            "productive": {"count": 3, "total_seconds": 5400},
+            "idle": {"count": 1, "total_seconds": 300},
+        }
+        self.gen.summary_repo = MagicMock()
+        self.gen.summary_repo.get_summaries.return_value = [
+            DailySummary(date=today - timedelta(days=1), productive_seconds=1800, total_entries=1),
+            DailySummary(date=today, productive_seconds=3600, total_entries=2),
+        ]
+
+        trend = self.gen.get_weekly_summaries()
+        daily = self.gen.get_daily_summary()
+
+        assert trend[-1] == daily
+        assert trend[-1].productive_seconds == 5400
+        assert trend[-2].productive_seconds == 1800
@@ -0,0 +1 @@
+# tests/test_services/__init__.py
@@ -0,0 +1,93 @@
+"""Tests for Recategorizer."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import psycopg2
+import pytest
+
+from config.constants import AppCategory
+from services.recategorizer import Recategorizer
+from tracking.categorizer import AppCategorizer
+
+
+def _rows(count, title="GitHub - Firefox", category="neutral"):
+    start = datetime(2026, 3, 1, 9)
+    return [(i, start + timedelta(minutes=i), title, category) for i in range(count)]
+
+
+class TestRecategorizer:
+    def setup_method(self):
+        self.mock_pool = MagicMock()
+        self.mock_pool.execute_values.return_value = True
+        self.categorizer = AppCategorizer(db_pool=None)
+
+    def _written(self):
+        return [row for call in self.mock_pool.execute_values.call_args_list for row in call[0][1]]
+
+    def test_writes_only_changed_rows(self):
+        rows = [*_rows(3), (9, datetime(2026, 3, 2), "YouTube", "unproductive")]
+        self.mock_pool.iter_query.return_value = iter(rows)
+        progress = []
+
+        stats = Recategorizer(self.mock_pool, self.categorizer, workers=0).run(progress=progress.append)
+
+        assert stats.scanned == 4
+        assert stats.changed == 3
+        assert {row[2] for row in self._written()} == {"productive"}
+        assert progress[-1].scanned == 4
+
+    def test_failed_batch_is_counted(self):
+        self.mock_pool.iter_query.return_value = iter(_rows(2))
+        self.mock_pool.execute_values.return_value = False
+        stats = Recategorizer(self.mock_pool, self.categorizer, workers=0).run()
+        assert stats.failed == 2
+        assert stats.changed == 0
+
+    def test_stream_error_is_raised(self):
+        def rows():
+            yield from _rows(2)
+            raise psycopg2.OperationalError("connection lost")
+
+        self.mock_pool.iter_query.return_value = rows()
+        with pytest.raises(psycopg2.OperationalError):
+            Recategorizer(self.mock_pool, self.categorizer, workers=0).run()
+
+    def test_process_pool_matches_in_process(self):
+        rows = _rows(25) + _rows(25, title="Reddit - Chrome")
+        self.mock_pool.iter_query.return_value = iter(rows)
+
+        stats = Recategorizer(self.mock_pool, self.categorizer, chunk_size=10, workers=2).run()
+
+        assert stats.scanned == 50
+        assert stats.changed == 50
+        assert sorted(self._written()) == sorted(
+            (i, ts, self.categorizer.categorize(title).value) for i, ts, title, _ in rows
+        )
+
+    def test_new_keyword_is_pushed_down(self):
+        self.mock_pool.execute_query_returning.return_value = 7
+        self.categorizer.add_rule("dashboard", AppCategory.UNPRODUCTIVE)
+
+        stats = Recategorizer(self.mock_pool, self.categorizer).apply_rule_change(
+            "Dashboard", AppCategory.UNPRODUCTIVE
+        )
+
+        assert stats.pushed_down is True
+        assert stats.changed == 7
+        params = self.mock_pool.execute_query_returning.call_args[0][1]
+        assert params[:3] == ("unproductive", "dashboard", ["neutral", "idle"])
+        self.mock_pool.iter_query.assert_not_called()
+
+    def test_removed_keyword_rescans_matching_titles(self):
+        self.categorizer.add_rule("dashboard", AppCategory.PRODUCTIVE)
+        self.categorizer.remove_rule("dashboard")
+        self.mock_pool.iter_query.return_value = iter(_rows(2, "Dashboard - Chrome", "productive"))
+
+        stats = Recategorizer(self.mock_pool, self.categorizer, workers=0).apply_rule_change(
+            "dashboard", None
+        )
+
+        assert stats.pushed_down is False
+        assert stats.changed == 2
+        assert self.mock_pool.iter_query.call_args[0][1][-2] == "dashboard"
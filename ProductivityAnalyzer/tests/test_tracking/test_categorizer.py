@@ -44,3 +44,66 @@ class TestAppCategorizer:
     def test_case_insensitivity(self):
         assert self.categorizer.categorize("YOUTUBE - Video") == AppCategory.UNPRODUCTIVE
         assert self.categorizer.categorize("visual studio CODE") == AppCategory.PRODUCTIVE
+
+    def test_productive_keyword_beats_browser(self):
+        assert self.categorizer.categorize("GitHub - Mozilla Firefox") == AppCategory.PRODUCTIVE
+        assert self.categorizer.categorize("Reddit - Google Chrome") == AppCategory.UNPRODUCTIVE
+
+    def test_custom_rule_beats_neutral_default(self):
+        self.categorizer.add_rule("Team Dashboard", AppCategory.PRODUCTIVE)
+        assert self.categorizer.categorize("Team Dashboard - Google Chrome") == AppCategory.PRODUCTIVE
+        assert self.categorizer.match("Team Dashboard - Google Chrome") == "team dashboard"
+
+    def test_updated_rule_changes_category(self):
+        self.categorizer.add_rule("slack", AppCategory.PRODUCTIVE)
+        assert self.categorizer.categorize("Slack - Messages") == AppCategory.PRODUCTIVE
+
+
+class TestCategorizerCache:
+    def setup_method(self):
+        self.categorizer = AppCategorizer(db_pool=None, cache_size=3)
+
+    def test_repeat_titles_hit_cache(self):
+        self.categorizer.categorize("YouTube - Video")
+        self.categorizer.categorize("youtube - video")
+        stats = self.categorizer.cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_least_recently_used_is_evicted(self):
+        for title in ("a", "b", "c"):
+            self.categorizer.categorize(title)
+        self.categorizer.categorize("a")
+        self.categorizer.categorize("d")
+        self.categorizer.categorize("a")
+        self.categorizer.categorize("b")
+        stats = self.categorizer.cache_stats()
+        assert stats.size == 3
+        assert stats.hits == 2
+        assert stats.misses == 5
+
+    def test_add_rule_evicts_only_matching_titles(self):
+        self.categorizer.categorize("Team Dashboard - Chrome")
+        self.categorizer.categorize("YouTube - Video")
+        self.categorizer.add_rule("dashboard", AppCategory.PRODUCTIVE)
+
+        assert self.categorizer.cache_stats().invalidations == 1
+        assert self.categorizer.categorize("Team Dashboard - Chrome") == AppCategory.PRODUCTIVE
+        assert self.categorizer.categorize("YouTube - Video") == AppCategory.UNPRODUCTIVE
+        assert self.categorizer.cache_stats().hits == 1
+
+    def test_remove_rule_evicts_titles_it_decided(self):
+        self.categorizer.add_rule("temp_app", AppCategory.UNPRODUCTIVE)
+        self.categorizer.categorize("temp_app - Chrome")
+        self.categorizer.categorize("Slack - Chrome")
+        self.categorizer.remove_rule("temp_app")
+
+        assert self.categorizer.cache_stats().invalidations == 1
+        assert self.categorizer.categorize("temp_app - Chrome") == AppCategory.NEUTRAL
+
+    def test_cache_can_be_disabled(self):
+        categorizer = AppCategorizer(db_pool=None, cache_size=0)
+        categorizer.categorize("YouTube")
+        categorizer.categorize("YouTube")
+        assert categorizer.cache_stats().hits == 0
+        assert categorizer.cache_stats().size == 0
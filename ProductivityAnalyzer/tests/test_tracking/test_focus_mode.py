@@ -0,0 +1,18 @@
+"""Tests for AppBlockerWorker matching."""
+
+from tracking.focus_mode import AppBlockerWorker
+
+
+class TestAppBlockerWorker:
+    def test_first_listed_app_wins(self):
+        worker = AppBlockerWorker(["YouTube", " steam ", ""])
+        assert worker.blocked_apps == ["youtube", "steam"]
+        assert worker._blocked_app_for("Steam - YouTube trailer") == "youtube"
+        assert worker._blocked_app_for("Visual Studio Code") is None
+
+    def test_verdict_reused_for_unchanged_title(self):
+        worker = AppBlockerWorker(["reddit"])
+        assert worker._blocked_app_for("Reddit - r/python") == "reddit"
+        worker._matcher.clear()
+        assert worker._blocked_app_for("Reddit - r/python") == "reddit"
+        assert worker._blocked_app_for("Reddit - r/rust") is None
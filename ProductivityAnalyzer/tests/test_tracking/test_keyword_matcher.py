@@ -0,0 +1,50 @@
+"""Tests for KeywordMatcher."""
+
+from tracking.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    def setup_method(self):
+        self.matcher: KeywordMatcher[str] = KeywordMatcher()
+
+    def test_finds_keyword_anywhere(self):
+        self.matcher.add("code", "a")
+        assert self.matcher.find("visual studio code - main.py") == ("code", "a")
+        assert self.matcher.find("nothing here") is None
+
+    def test_priority_beats_length(self):
+        self.matcher.add("stack", "low", priority=1)
+        self.matcher.add("stackoverflow", "lower", priority=2)
+        assert self.matcher.find("stackoverflow - question") == ("stack", "low")
+
+    def test_longest_wins_within_priority(self):
+        self.matcher.add("tube", "short")
+        self.matcher.add("youtube music", "long")
+        assert self.matcher.find("youtube music - playlist") == ("youtube music", "long")
+
+    def test_overlapping_suffixes(self):
+        for keyword in ("he", "she", "his", "hers"):
+            self.matcher.add(keyword, keyword, priority=len(keyword))
+        assert self.matcher.find("ushers") == ("he", "he")
+        assert self.matcher.find("ahis") == ("his", "his")
+
+    def test_add_and_remove_relink_lazily(self):
+        self.matcher.add("slack", "neutral")
+        assert self.matcher.find("slack - general")[0] == "slack"
+        self.matcher.add("general", "work", priority=-1)
+        assert self.matcher.find("slack - general")[0] == "general"
+        assert self.matcher.remove("general") is True
+        assert self.matcher.remove("general") is False
+        assert self.matcher.find("slack - general")[0] == "slack"
+
+    def test_replacing_keyword_updates_value(self):
+        self.matcher.add("zoom", "neutral")
+        self.matcher.add("zoom", "productive")
+        assert len(self.matcher) == 1
+        assert self.matcher.find("zoom meeting") == ("zoom", "productive")
+
+    def test_clear(self):
+        self.matcher.add("zoom", "neutral")
+        self.matcher.clear()
+        assert "zoom" not in self.matcher
+        assert self.matcher.find("zoom meeting") is None
@@ -0,0 +1,118 @@
+"""Tests for LiveAggregator."""
+
+import threading
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+from config.constants import AppCategory
+from database.models import ActivityLog
+from tracking.live_aggregator import LiveAggregator
+from tracking.write_buffer import ActivityWriteBuffer
+
+TODAY = date.today()
+NINE = datetime.combine(TODAY, datetime.min.time()).replace(hour=9)
+
+
+def _activity(title, minutes, seconds, category=AppCategory.PRODUCTIVE):
+    return ActivityLog(
+        timestamp=NINE + timedelta(minutes=minutes),
+        window_title=title,
+        category=category,
+        duration_seconds=seconds,
+    )
+
+
+def _reconciled(summary=None, apps=None, pending=()):
+    repo = MagicMock()
+    repo.get_productivity_summary.return_value = summary or {}
+    repo.get_top_apps.return_value = apps or []
+    live = LiveAggregator()
+    assert live.reconcile(repo, lambda: list(pending), today=TODAY)
+    return live
+
+
+class TestLiveAggregator:
+    def test_not_served_until_reconciled(self):
+        live = LiveAggregator()
+        assert not live.covers(TODAY)
+        live = _reconciled()
+        assert live.covers(TODAY)
+        assert not live.covers(TODAY - timedelta(days=1))
+
+    def test_running_totals(self):
+        live = _reconciled()
+        live.record(_activity("main.py - VS Code", 0, 600))
+        live.record(_activity("YouTube", 10, 300, AppCategory.UNPRODUCTIVE))
+        live.record(_activity("main.py - VS Code", 15, 120))
+
+        assert live.summary(now=NINE + timedelta(minutes=17)) == {
+            "productive": {"count": 2, "total_seconds": 720},
+            "unproductive": {"count": 1, "total_seconds": 300},
+        }
+        assert live.top_apps(limit=1, now=NINE) == [
+            {"window_title": "main.py - VS Code", "count": 2, "total_seconds": 720}
+        ]
+
+    def test_open_window_is_included(self):
+        live = _reconciled()
+        live.record(_activity("Editor", 0, 60))
+        live.open("Editor", AppCategory.PRODUCTIVE, NINE + timedelta(minutes=1))
+        live.open("Slack", AppCategory.NEUTRAL, NINE + timedelta(minutes=2))
+
+        now = NINE + timedelta(minutes=7)
+        assert live.summary(now=now)["neutral"] == {"count": 1, "total_seconds": 300}
+        assert live.top_apps(limit=None, now=now)[0] == {
+            "window_title": "Slack",
+            "count": 1,
+            "total_seconds": 300,
+        }
+
+    def test_reconcile_seeds_from_database_and_pending_rows(self):
+        repo_summary = {"productive": {"count": 3, "total_seconds": 900}}
+        repo_apps = [{"window_title": "Editor", "count": 3, "total_seconds": 900}]
+        pending = [_activity("Editor", 30, 100)]
+        live = _reconciled(repo_summary, repo_apps, pending)
+
+        assert live.summary(now=NINE)["productive"] == {"count": 4, "total_seconds": 1000}
+        assert live.top_apps(now=NINE) == [{"window_title": "Editor", "count": 4, "total_seconds": 1000}]
+
+    def test_failed_reconcile_keeps_database_fallback(self):
+        repo = MagicMock()
+        repo.get_productivity_summary.side_effect = Exception("connection refused")
+        live = LiveAggregator()
+        assert live.reconcile(repo) is False
+        assert not live.covers(TODAY)
+
+    def test_midnight_starts_a_new_day(self):
+        live = _reconciled()
+        live.record(_activity("Editor", 0, 600))
+        live.open("Terminal", AppCategory.PRODUCTIVE, NINE + timedelta(hours=14))
+
+        tomorrow = NINE + timedelta(days=1)
+        # The open window started yesterday, so it belongs to yesterday's totals
+        assert live.summary(now=tomorrow) == {}
+        assert live.day == TODAY + timedelta(days=1)
+        live.record(_activity("Terminal", 14 * 60, 40_000))
+        assert live.summary(now=tomorrow) == {}
+
+    def test_reconcile_counts_concurrently_buffered_rows_once(self):
+        buffer = ActivityWriteBuffer(MagicMock(), batch_size=1000, flush_interval=60)
+        repo = MagicMock()
+        repo.get_productivity_summary.return_value = {}
+        repo.get_top_apps.return_value = []
+        live = LiveAggregator()
+
+        def track():
+            for i in range(500):
+                activity = _activity(f"window {i % 7}", i, 1)
+                with live.lock:
+                    buffer.add(activity)
+                    live.record(activity)
+
+        tracker = threading.Thread(target=track)
+        tracker.start()
+        with buffer.hold_flushes():
+            live.reconcile(repo, buffer.pending, today=TODAY)
+        tracker.join()
+
+        assert live.summary(now=NINE)["productive"]["count"] == 500
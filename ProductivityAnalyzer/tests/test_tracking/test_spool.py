@@ -0,0 +1,104 @@
+"""Tests for the memory-mapped activity spool."""
+
+from datetime import datetime, timedelta
+
+from config.constants import AppCategory
+from database.models import ActivityLog
+from tracking.spool import HEADER_SIZE, RECORD, ActivitySpool
+
+
+def _activity(i: int) -> ActivityLog:
+    return ActivityLog(
+        timestamp=datetime(2026, 3, 24, 9, 0) + timedelta(minutes=i),
+        window_title=f"Editor – file {i}.py",
+        category=AppCategory.PRODUCTIVE,
+        duration_seconds=60,
+        row_key=f"00000000-0000-0000-0000-{i:012d}",
+    )
+
+
+class TestActivitySpool:
+    def test_pending_survives_reopen(self, tmp_path):
+        path = str(tmp_path / "activity.spool")
+        spool = ActivitySpool(path)
+        for i in range(3):
+            spool.append(_activity(i))
+        spool.close()
+
+        reopened = ActivitySpool(path)
+        pending = reopened.pending()
+        assert [a.row_key for a in pending] == [_activity(i).row_key for i in range(3)]
+        assert pending[1].window_title == "Editor – file 1.py"
+        assert pending[1].category == AppCategory.PRODUCTIVE
+        assert reopened.stats().pending_records == 3
+
+    def test_partial_commit_keeps_later_rows(self, tmp_path):
+        path = str(tmp_path / "activity.spool")
+        spool = ActivitySpool(path)
+        first = spool.append(_activity(0))
+        spool.append(_activity(1))
+        spool.commit(first)
+        spool.close()
+
+        reopened = ActivitySpool(path)
+        assert [a.row_key for a in reopened.pending()] == [_activity(1).row_key]
+        assert reopened.stats().pending_records == 1
+
+    def test_full_commit_starts_over(self, tmp_path):
+        path = str(tmp_path / "activity.spool")
+        spool = ActivitySpool(path)
+        end = 0
+        for i in range(3):
+            end = spool.append(_activity(i))
+        spool.commit(end)
+
+        stats = spool.stats()
+        assert spool.tail == HEADER_SIZE
+        assert stats.pending_bytes == 0
+        assert stats.replay_lag_seconds == 0.0
+        # Records of the old generation are not resurrected by a shorter new one
+        spool.append(_activity(9))
+        spool.close()
+        assert [a.row_key for a in ActivitySpool(path).pending()] == [_activity(9).row_key]
+
+    def test_torn_record_is_ignored(self, tmp_path):
+        path = str(tmp_path / "activity.spool")
+        spool = ActivitySpool(path)
+        spool.append(_activity(0))
+        end = spool.append(_activity(1))
+        spool.close()
+
+        with open(path, "r+b") as f:
+            f.seek(end - 3)
+            f.write(b"\xff")
+
+        reopened = ActivitySpool(path)
+        assert [a.row_key for a in reopened.pending()] == [_activity(0).row_key]
+        # New rows overwrite the torn one
+        reopened.append(_activity(2))
+        assert len(reopened.pending()) == 2
+
+    def test_grows_and_shrinks_back(self, tmp_path):
+        spool = ActivitySpool(str(tmp_path / "activity.spool"), initial_size=256)
+        end = 0
+        for i in range(20):
+            end = spool.append(_activity(i))
+        assert spool.stats().file_bytes > 256
+        assert len(spool.pending()) == 20
+
+        spool.commit(end)
+        assert spool.stats().file_bytes == 256
+
+    def test_replay_lag_tracks_oldest_pending(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("tracking.spool.time.time", lambda: now[0])
+        spool = ActivitySpool(str(tmp_path / "activity.spool"))
+        first = spool.append(_activity(0))
+        now[0] = 1030.0
+        spool.append(_activity(1))
+        now[0] = 1100.0
+        assert spool.stats().replay_lag_seconds == 100.0
+        assert spool.stats().pending_bytes == spool.tail - HEADER_SIZE > 2 * RECORD.size
+
+        spool.commit(first)
+        assert spool.stats().replay_lag_seconds == 70.0
@@ -0,0 +1,311 @@
+"""Tests for the shared window-change event bus."""
+
+import datetime
+import threading
+import time
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+from PyQt5.QtCore import Qt
+
+from config.constants import AppCategory
+from tracking.activity_tracker import ActivityTracker
+from tracking.categorizer import AWAY_TITLE
+from tracking.focus_mode import AppBlockerWorker
+from tracking.window_events import MIN_POLL_INTERVAL, WindowChangeEvent, WindowEventBus
+
+
+class ScriptedTitles:
+    """Title source that returns the current `title` and counts samples."""
+
+    def __init__(self, title="Editor"):
+        self.title = title
+        self.calls = 0
+        self.sampled = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.sampled.set()
+        return self.title
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestWindowEventBus:
+    def test_publish_only_on_change(self):
+        bus = WindowEventBus(title_source=lambda: "Editor")
+        sub = bus.subscribe("consumer", poll_interval=60)
+        try:
+            assert sub.get(timeout=2).title == "Editor"
+            assert bus.publish("Editor") is None
+            assert bus.publish("Browser").sequence == 2
+            assert sub.get(timeout=0).title == "Browser"
+            assert sub.get(timeout=0) is None
+        finally:
+            sub.close()
+
+    def test_every_subscriber_gets_every_change(self):
+        source = ScriptedTitles("Editor")
+        bus = WindowEventBus(title_source=source)
+        first = bus.subscribe("tracker", poll_interval=60)
+        second = bus.subscribe("blocker", poll_interval=60)
+        try:
+            assert first.get(timeout=2).title == "Editor"
+            # A late subscriber is handed the current window
+            assert second.get(timeout=0).title == "Editor"
+            bus.publish("Browser")
+            assert [first.get(timeout=0).title, second.get(timeout=0).title] == ["Browser", "Browser"]
+        finally:
+            first.close()
+            second.close()
+        # One sampler serves both subscribers
+        assert source.calls == 1
+
+    def test_samples_at_shortest_requested_interval(self):
+        source = ScriptedTitles()
+        bus = WindowEventBus(title_source=source)
+        slow = bus.subscribe("slow", poll_interval=60)
+        try:
+            assert source.sampled.wait(2)
+            fast = bus.subscribe("fast", poll_interval=0.05)
+            assert _wait_until(lambda: source.calls >= 4)
+            fast.close()
+            assert bus.poll_interval == 60
+        finally:
+            slow.close()
+
+    def test_full_queue_drops_oldest(self):
+        bus = WindowEventBus(title_source=lambda: "start")
+        sub = bus.subscribe("slow", poll_interval=60, max_queue=2)
+        try:
+            assert _wait_until(lambda: sub.stats().depth == 1)
+            for title in ("one", "two", "three"):
+                bus.publish(title)
+            assert [sub.get(timeout=0).title, sub.get(timeout=0).title] == ["two", "three"]
+            stats = sub.stats()
+            assert stats.dropped == 2
+            assert stats.delivered == 2
+            assert stats.depth == 0
+        finally:
+            sub.close()
+
+    def test_latency_is_measured_per_subscriber(self):
+        bus = WindowEventBus(title_source=lambda: "start")
+        fast = bus.subscribe("fast", poll_interval=60)
+        slow = bus.subscribe("slow", poll_interval=60)
+        try:
+            assert fast.get(timeout=2) is not None
+            time.sleep(0.05)
+            assert slow.get(timeout=0) is not None
+            assert slow.stats().max_latency_seconds >= 0.05
+            assert fast.stats().max_latency_seconds < slow.stats().max_latency_seconds
+            assert slow.stats().avg_latency_seconds == slow.stats().total_latency_seconds
+        finally:
+            fast.close()
+            slow.close()
+
+    def test_close_wakes_blocked_consumer(self):
+        bus = WindowEventBus(title_source=lambda: "start")
+        sub = bus.subscribe("consumer", poll_interval=60)
+        assert sub.get(timeout=2) is not None
+        result = []
+        consumer = threading.Thread(target=lambda: result.append(sub.get()))
+        consumer.start()
+        sub.close()
+        consumer.join(2)
+        assert result == [None]
+        assert sub.closed
+
+    def test_sampler_stops_with_last_subscriber(self):
+        bus = WindowEventBus(title_source=lambda: "start")
+        sub = bus.subscribe("only", poll_interval=60)
+        assert bus.is_running
+        sub.close()
+        assert not bus.is_running
+        assert bus.current() is None
+
+    def test_sampling_errors_are_survived(self):
+        source = MagicMock(side_effect=[RuntimeError("X went away"), "Editor"])
+        bus = WindowEventBus(title_source=source)
+        sub = bus.subscribe("consumer", poll_interval=0.05)
+        try:
+            assert sub.get(timeout=2).title == "Editor"
+        finally:
+            sub.close()
+
+
+class TestAdaptiveSampling:
+    def test_interval_follows_change_rate(self):
+        bus = WindowEventBus(title_source=lambda: "unused")
+        sub = bus.subscribe("tracker", poll_interval=4, max_queue=100)
+        try:
+            assert sub.get(timeout=2) is not None
+            bus._recent_changes.clear()
+            # Stable: back off to the ceiling (twice the nominal interval)
+            assert bus.adaptive_interval() == 8
+            bus.publish("one")
+            assert bus.adaptive_interval() == 4
+            for i in range(10):
+                bus.publish(f"window {i}")
+            # Busy: never faster than a quarter of the nominal interval
+            assert bus.adaptive_interval() == 1
+        finally:
+            sub.close()
+
+    def test_interval_respects_tightest_ceiling_and_floor(self):
+        bus = WindowEventBus(title_source=lambda: "unused")
+        tracker = bus.subscribe("tracker", poll_interval=5)
+        blocker = bus.subscribe("blocker", poll_interval=1, max_interval=1)
+        try:
+            assert blocker.get(timeout=2) is not None
+            bus._recent_changes.clear()
+            assert bus.adaptive_interval() == 1
+            for i in range(20):
+                bus.publish(f"window {i}")
+            assert bus.adaptive_interval() == MIN_POLL_INTERVAL
+        finally:
+            tracker.close()
+            blocker.close()
+
+    def test_old_changes_stop_counting(self):
+        bus = WindowEventBus(title_source=lambda: "unused")
+        sub = bus.subscribe("tracker", poll_interval=4)
+        try:
+            assert sub.get(timeout=2) is not None
+            bus._recent_changes.clear()
+            bus._recent_changes.extend([time.monotonic() - 120] * 5)
+            assert bus.adaptive_interval() == 8
+            assert not bus._recent_changes
+        finally:
+            sub.close()
+
+
+class TestIdleSampling:
+    def test_idle_stretch_is_one_away_event(self):
+        source = ScriptedTitles("Editor")
+        idle = {"seconds": 0.0}
+        bus = WindowEventBus(title_source=source, idle_source=lambda: idle["seconds"], idle_threshold=300)
+        sub = bus.subscribe("tracker", poll_interval=0.05)
+        try:
+            first = sub.get(timeout=2)
+            assert first.title == "Editor"
+
+            idle["seconds"] = 600
+            away = sub.get(timeout=2)
+            assert away.idle and away.title == AWAY_TITLE
+            # Backdated to the last input, but never before the window it replaces
+            assert away.timestamp == first.timestamp
+            assert bus.is_idle
+
+            # No titles are sampled while idle, and no further events arrive
+            calls = source.calls
+            assert sub.get(timeout=0.3) is None
+            assert source.calls == calls
+
+            idle["seconds"] = 0
+            resumed = sub.get(timeout=2)
+            # The same window is reported again so the away stretch ends
+            assert resumed.title == "Editor" and not resumed.idle
+            assert not bus.is_idle
+        finally:
+            sub.close()
+
+    def test_away_event_starts_at_last_input(self):
+        bus = WindowEventBus(title_source=lambda: "Editor", idle_source=lambda: None)
+        sub = bus.subscribe("tracker", poll_interval=60)
+        try:
+            first = sub.get(timeout=2)
+            bus._current = replace(first, timestamp=first.timestamp - datetime.timedelta(hours=1))
+            bus._enter_idle(600)
+            away = sub.get(timeout=0)
+            expected = datetime.datetime.now() - datetime.timedelta(seconds=600)
+            assert abs((away.timestamp - expected).total_seconds()) < 1
+        finally:
+            sub.close()
+
+    def test_zero_threshold_disables_idle_detection(self):
+        bus = WindowEventBus(title_source=lambda: "Editor", idle_source=lambda: 10_000, idle_threshold=0)
+        sub = bus.subscribe("tracker", poll_interval=0.05)
+        try:
+            assert sub.get(timeout=2).title == "Editor"
+            assert sub.get(timeout=0.2) is None
+            assert not bus.is_idle
+        finally:
+            sub.close()
+
+    def test_explicit_title_source_ignores_platform_idle(self):
+        assert WindowEventBus(title_source=lambda: "Editor")._idle_source is None
+
+
+class TestWindowEventConsumers:
+    def test_tracker_logs_previous_window_on_change(self, mock_db_pool, tmp_path):
+        bus = WindowEventBus(title_source=lambda: "Editor")
+        tracker = ActivityTracker(mock_db_pool, event_bus=bus, spool_path=str(tmp_path / "spool"))
+        tracker.write_buffer = MagicMock()
+        logged = []
+        tracker.activity_logged.connect(logged.append, Qt.DirectConnection)
+
+        tracker.start()
+        try:
+            assert _wait_until(lambda: tracker._last_window_title == "Editor")
+            bus.publish("Browser")
+            assert _wait_until(lambda: tracker.write_buffer.add.called)
+        finally:
+            tracker.stop_tracking()
+            assert tracker.wait(2000)
+
+        activity = tracker.write_buffer.add.call_args.args[0]
+        assert activity.window_title == "Editor"
+        assert "Editor" in logged[0]
+        assert tracker.event_stats().delivered == 2
+        assert not bus.is_running
+
+    def test_tracker_records_idle_stretch_once(self, mock_db_pool, tmp_path):
+        tracker = ActivityTracker(
+            mock_db_pool,
+            event_bus=WindowEventBus(title_source=lambda: ""),
+            spool_path=str(tmp_path / "spool"),
+        )
+        tracker.write_buffer = MagicMock()
+        start = datetime.datetime(2026, 3, 2, 9, 0, 0)
+
+        def event(title, minutes, idle=False):
+            return WindowChangeEvent(
+                title=title,
+                timestamp=start + datetime.timedelta(minutes=minutes),
+                sequence=0,
+                published=time.perf_counter(),
+                idle=idle,
+            )
+
+        tracker._record_change(event("Editor", 0))
+        tracker._record_change(event(AWAY_TITLE, 10, idle=True))
+        tracker.write_buffer.flush.assert_called_once()
+        tracker._record_change(event("Editor", 55))
+
+        logged = [c.args[0] for c in tracker.write_buffer.add.call_args_list]
+        assert [(a.window_title, a.duration_seconds) for a in logged] == [
+            ("Editor", 600),
+            (AWAY_TITLE, 2700),
+        ]
+        assert logged[1].category == AppCategory.IDLE
+
+    def test_blocker_reacts_to_focus_changes(self):
+        bus = WindowEventBus(title_source=lambda: "Visual Studio Code")
+        worker = AppBlockerWorker(["youtube"], event_bus=bus)
+        blocked = []
+        worker.app_blocked.connect(blocked.append, Qt.DirectConnection)
+
+        worker.start()
+        try:
+            assert _wait_until(lambda: bus.current() is not None)
+            bus.publish("YouTube - Firefox")
+            assert _wait_until(lambda: blocked == ["youtube"])
+        finally:
+            worker.stop()
+            assert worker.wait(2000)
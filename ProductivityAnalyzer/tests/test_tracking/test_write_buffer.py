@@ -0,0 +1,229 @@
+"""Tests for ActivityWriteBuffer."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from database.models import ActivityLog
+from tracking.spool import ActivitySpool
+from tracking.write_buffer import COPY_THRESHOLD, ActivityWriteBuffer
+
+
+class TestActivityWriteBuffer:
+    def setup_method(self):
+        self.mock_repo = MagicMock()
+        self.mock_repo.log_activities.return_value = True
+
+    def test_add_does_not_write_immediately(self):
+        buffer = ActivityWriteBuffer(self.mock_repo, batch_size=10)
+        buffer.add(ActivityLog(window_title="VS Code"))
+        assert buffer.depth == 1
+        self.mock_repo.log_activities.assert_not_called()
+
+    def test_flush_writes_single_batch(self, sample_activities):
+        buffer = ActivityWriteBuffer(self.mock_repo, batch_size=10)
+        for activity in sample_activities:
+            buffer.add(activity)
+
+        assert buffer.flush() is True
+        self.mock_repo.log_activities.assert_called_once_with(sample_activities)
+        stats = buffer.stats()
+        assert stats.depth == 0
+        assert stats.flushed_rows == 4
+        assert stats.flushes == 1
+
+    def test_failed_flush_keeps_rows(self, sample_activities):
+        self.mock_repo.log_activities.return_value = False
+        buffer = ActivityWriteBuffer(self.mock_repo, batch_size=10)
+        for activity in sample_activities:
+            buffer.add(activity)
+
+        assert buffer.flush() is False
+        assert buffer.depth == 4
+        assert buffer.stats().failed_flushes == 1
+
+    def test_exception_during_flush_keeps_rows(self, sample_activity):
+        self.mock_repo.log_activities.side_effect = Exception("pool timeout")
+        buffer = ActivityWriteBuffer(self.mock_repo)
+        buffer.add(sample_activity)
+        assert buffer.flush() is False
+        assert buffer.depth == 1
+
+    def test_large_backlog_uses_copy(self):
+        self.mock_repo.bulk_load_activities.return_value.success = True
+        buffer = ActivityWriteBuffer(self.mock_repo, batch_size=10)
+        for i in range(COPY_THRESHOLD):
+            buffer.add(ActivityLog(window_title=f"window {i}"))
+
+        assert buffer.flush() is True
+        self.mock_repo.bulk_load_activities.assert_called_once()
+        self.mock_repo.log_activities.assert_not_called()
+
+    def test_overflow_drops_oldest(self):
+        buffer = ActivityWriteBuffer(self.mock_repo, batch_size=2, max_pending=3)
+        for i in range(5):
+            buffer.add(ActivityLog(window_title=f"window {i}"))
+        assert buffer.depth == 3
+        assert buffer.stats().dropped_rows == 2
+
+    def test_full_batch_flushes_in_background(self, sample_activities):
+        buffer = ActivityWriteBuffer(self.mock_repo, batch_size=4, flush_interval=60)
+        buffer.start()
+        try:
+            for activity in sample_activities:
+                buffer.add(activity)
+            deadline = time.time() + 2
+            while buffer.depth and time.time() < deadline:
+                time.sleep(0.01)
+            assert buffer.depth == 0
+        finally:
+            buffer.stop()
+        self.mock_repo.log_activities.assert_called_once()
+
+    def test_stop_flushes_pending(self, sample_activity):
+        buffer = ActivityWriteBuffer(self.mock_repo, batch_size=10, flush_interval=60)
+        buffer.start()
+        buffer.add(sample_activity)
+        buffer.stop()
+        self.mock_repo.log_activities.assert_called_once_with([sample_activity])
+
+    def test_failed_flush_backs_off_despite_new_rows(self):
+        self.mock_repo.log_activities.return_value = False
+        buffer = ActivityWriteBuffer(self.mock_repo, batch_size=2, flush_interval=0.3)
+        buffer.start()
+        try:
+            buffer.add(ActivityLog(window_title="window 0"))
+            buffer.add(ActivityLog(window_title="window 1"))
+            deadline = time.time() + 2
+            while not self.mock_repo.log_activities.called and time.time() < deadline:
+                time.sleep(0.01)
+            for i in range(2, 20):
+                buffer.add(ActivityLog(window_title=f"window {i}"))
+            time.sleep(0.1)
+            assert self.mock_repo.log_activities.call_count == 1
+
+            deadline = time.time() + 2
+            while self.mock_repo.log_activities.call_count < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            assert self.mock_repo.log_activities.call_count == 2
+        finally:
+            buffer.stop(timeout=0.5)
+
+    def test_stop_is_bounded_when_database_hangs(self, sample_activity):
+        release = threading.Event()
+        self.mock_repo.log_activities.side_effect = lambda rows: release.wait(5)
+        buffer = ActivityWriteBuffer(self.mock_repo, batch_size=10, flush_interval=60)
+        buffer.start()
+        buffer.add(sample_activity)
+
+        started = time.perf_counter()
+        buffer.stop(timeout=0.1)
+        assert time.perf_counter() - started < 1
+        release.set()
+
+
+class TestSpooledWriteBuffer:
+    def setup_method(self):
+        self.mock_repo = MagicMock()
+
+    def test_rows_get_row_keys(self, tmp_path, sample_activity):
+        buffer = ActivityWriteBuffer(self.mock_repo, spool=ActivitySpool(str(tmp_path / "spool")))
+        buffer.add(sample_activity)
+        assert sample_activity.row_key is not None
+
+    def test_unwritten_rows_are_replayed_after_restart(self, tmp_path, sample_activities):
+        path = str(tmp_path / "spool")
+        self.mock_repo.log_activities.return_value = False
+        buffer = ActivityWriteBuffer(self.mock_repo, max_pending=10, spool=ActivitySpool(path))
+        for activity in sample_activities:
+            buffer.add(activity)
+        assert buffer.flush() is False
+        assert buffer.stats().journal_bytes > 0
+        buffer.spool.close()
+
+        # The database is back and the app restarted
+        self.mock_repo.log_activities.return_value = True
+        restarted = ActivityWriteBuffer(self.mock_repo, flush_interval=60, spool=ActivitySpool(path))
+        restarted.start()
+        restarted.stop()
+
+        replayed = self.mock_repo.log_activities.call_args.args[0]
+        assert [a.row_key for a in replayed] == [a.row_key for a in sample_activities]
+        stats = restarted.stats()
+        assert stats.journal_bytes == 0
+        assert stats.replay_lag_seconds == 0.0
+        assert restarted.spool.pending() == []
+
+    def test_spooled_rows_are_never_dropped(self, tmp_path):
+        self.mock_repo.log_activities.return_value = False
+        buffer = ActivityWriteBuffer(
+            self.mock_repo, batch_size=2, max_pending=3, spool=ActivitySpool(str(tmp_path / "spool"))
+        )
+        for i in range(5):
+            buffer.add(ActivityLog(window_title=f"window {i}"))
+        buffer.flush()
+        assert buffer.depth == 5
+        assert buffer.stats().dropped_rows == 0
+
+    def test_long_outage_keeps_only_max_pending_in_memory(self, tmp_path):
+        self.mock_repo.log_activities.return_value = False
+        buffer = ActivityWriteBuffer(
+            self.mock_repo, batch_size=2, max_pending=3, spool=ActivitySpool(str(tmp_path / "spool"))
+        )
+        added = [ActivityLog(window_title=f"window {i}") for i in range(8)]
+        for activity in added[:4]:
+            buffer.add(activity)
+        buffer.flush()
+        for activity in added[4:]:
+            buffer.add(activity)
+
+        assert buffer.depth == 8
+        stats = buffer.stats()
+        assert stats.depth == 8
+        assert stats.spilled_rows == 5  # only 3 held in memory
+        # Live totals still see every unwritten row
+        assert [a.row_key for a in buffer.pending()] == [a.row_key for a in added]
+
+        # The database is back: the spilled rows are read back in order as the backlog drains
+        written = []
+        self.mock_repo.log_activities.side_effect = lambda batch: written.extend(batch) or True
+        while buffer.depth:
+            assert buffer.flush() is True
+            assert buffer.depth - buffer.stats().spilled_rows <= 3
+        assert [a.row_key for a in written] == [a.row_key for a in added]
+        assert buffer.spool.pending() == []
+
+    def test_restart_reloads_at_most_max_pending(self, tmp_path):
+        path = str(tmp_path / "spool")
+        spool = ActivitySpool(path)
+        for i in range(5):
+            spool.append(ActivityLog(window_title=f"window {i}", row_key=f"key {i}"))
+        spool.close()
+
+        self.mock_repo.log_activities.return_value = False
+        buffer = ActivityWriteBuffer(
+            self.mock_repo, batch_size=2, max_pending=2, flush_interval=60, spool=ActivitySpool(path)
+        )
+        buffer.start()
+        try:
+            # The first batch is due at once; after it fails the flusher backs off for a minute
+            deadline = time.time() + 2
+            while not buffer.stats().failed_flushes and time.time() < deadline:
+                time.sleep(0.01)
+            assert buffer.depth == 5
+            assert buffer.stats().spilled_rows == 3
+            assert [a.row_key for a in buffer.pending()] == [f"key {i}" for i in range(5)]
+        finally:
+            buffer.stop(timeout=1)
+
+    def test_rows_added_during_flush_stay_spooled(self, tmp_path, sample_activities):
+        buffer = ActivityWriteBuffer(self.mock_repo, spool=ActivitySpool(str(tmp_path / "spool")))
+        buffer.add(sample_activities[0])
+
+        def write(batch):
+            buffer.add(sample_activities[1])
+            return True
+
+        self.mock_repo.log_activities.side_effect = write
+        assert buffer.flush() is True
+        assert [a.row_key for a in buffer.spool.pending()] == [sample_activities[1].row_key]
@@ -0,0 +1,129 @@
+"""Tests for the paged Activity Log table model."""
+
+import os
+import time
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt5.QtCore import QCoreApplication, Qt, QThreadPool
+from PyQt5.QtWidgets import QApplication
+
+from config.constants import AppCategory
+from database.models import ActivityLog
+from ui.activity_table_model import ActivityTableModel
+from ui.data_loader import DataLoader
+
+DAY = date(2026, 3, 24)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    # A QApplication, so widget tests running later in the session can still create widgets
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QCoreApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def pool():
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    yield pool
+    pool.waitForDone(2000)
+
+
+def _process_until(condition, timeout: float = 2.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        QCoreApplication.processEvents()
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def _activities(count: int) -> list[ActivityLog]:
+    start = datetime(2026, 3, 24, 18, 0)
+    return [
+        ActivityLog(
+            id=count - i,
+            timestamp=start - timedelta(minutes=i),
+            window_title=f"Window {i}",
+            category=AppCategory.PRODUCTIVE,
+            duration_seconds=60,
+        )
+        for i in range(count)
+    ]
+
+
+def _repo(activities: list[ActivityLog]) -> MagicMock:
+    """A repository that pages `activities` (newest first) by keyset, like the SQL does."""
+    repo = MagicMock()
+
+    def page(target_date, category=None, after=None, limit=200):
+        rows = [a for a in activities if after is None or (a.timestamp, a.id) < after]
+        return rows[:limit]
+
+    repo.get_activities_page.side_effect = page
+    repo.count_activities.return_value = len(activities)
+    return repo
+
+
+class TestActivityTableModel:
+    def test_first_page_and_total(self, qapp, pool):
+        repo = _repo(_activities(25))
+        model = ActivityTableModel(repo, DataLoader("test", pool=pool), page_size=10)
+        totals = []
+        model.total_changed.connect(totals.append)
+
+        model.set_filter(DAY, "productive")
+
+        assert _process_until(lambda: model.rowCount() == 10)
+        assert totals == [25]
+        assert model.canFetchMore()
+        repo.get_activities_page.assert_called_once_with(DAY, "productive", None, 10)
+
+    def test_fetch_more_continues_after_last_row(self, qapp, pool):
+        activities = _activities(25)
+        repo = _repo(activities)
+        model = ActivityTableModel(repo, DataLoader("test", pool=pool), page_size=10)
+        model.set_filter(DAY)
+        assert _process_until(lambda: model.rowCount() == 10)
+
+        model.fetchMore()
+        assert _process_until(lambda: model.rowCount() == 20)
+        model.fetchMore()
+        assert _process_until(lambda: model.rowCount() == 25)
+
+        assert not model.canFetchMore()
+        assert [model.activity(row).id for row in range(25)] == [a.id for a in activities]
+        # Only the first page after a filter change is counted
+        repo.count_activities.assert_called_once()
+        last = activities[9]
+        assert repo.get_activities_page.call_args_list[1][0][2] == (last.timestamp, last.id)
+
+    def test_set_filter_resets_rows(self, qapp, pool):
+        repo = _repo(_activities(5))
+        model = ActivityTableModel(repo, DataLoader("test", pool=pool), page_size=10)
+        model.set_filter(DAY)
+        assert _process_until(lambda: model.rowCount() == 5)
+
+        repo.get_activities_page.side_effect = None
+        repo.get_activities_page.return_value = []
+        repo.count_activities.return_value = 0
+        model.set_filter(DAY, "idle")
+
+        assert model.rowCount() == 0
+        assert _process_until(lambda: model.total == 0)
+        assert not model.canFetchMore()
+
+    def test_display_data(self, qapp, pool):
+        model = ActivityTableModel(_repo(_activities(1)), DataLoader("test", pool=pool))
+        model.set_filter(DAY)
+        assert _process_until(lambda: model.rowCount() == 1)
+
+        assert model.data(model.index(0, model.COL_TIMESTAMP)) == "18:00:00"
+        assert model.data(model.index(0, model.COL_CATEGORY)) == "Productive"
+        assert model.data(model.index(0, model.COL_DURATION)) == "60s"
+        assert model.data(model.index(0, model.COL_TITLE), Qt.ToolTipRole) == "Window 0"
+        assert model.headerData(0, Qt.Horizontal) == "ID"
@@ -0,0 +1,119 @@
+"""Tests for the background page-data loader."""
+
+import os
+import threading
+import time
+
+import pytest
+from PyQt5.QtCore import QCoreApplication, QThreadPool
+from PyQt5.QtWidgets import QApplication
+
+from ui.data_loader import DataLoader
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    # A QApplication, so widget tests running later in the session can still create widgets
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QCoreApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def pool():
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    yield pool
+    pool.waitForDone(2000)
+
+
+def _process_until(condition, timeout: float = 2.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        QCoreApplication.processEvents()
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class TestDataLoader:
+    def test_result_delivered_on_gui_thread(self, qapp, pool):
+        loader = DataLoader("test", pool=pool)
+        states, results = [], []
+        loader.loading_changed.connect(states.append)
+        fetch_threads = []
+
+        def fetch():
+            fetch_threads.append(threading.current_thread())
+            return 42
+
+        loader.load(fetch, lambda result: results.append((result, threading.current_thread())))
+
+        assert _process_until(lambda: results)
+        assert results == [(42, threading.main_thread())]
+        assert fetch_threads[0] is not threading.main_thread()
+        assert states == [True, False]
+        assert not loader.is_loading
+
+    def test_newer_request_supersedes_older(self, qapp, pool):
+        loader = DataLoader("test", pool=pool)
+        release = threading.Event()
+        results = []
+
+        loader.load(lambda: release.wait(2) and "old", results.append)
+        loader.load(lambda: "new", results.append)
+        release.set()
+
+        assert _process_until(lambda: results)
+        pool.waitForDone(2000)
+        QCoreApplication.processEvents()
+        assert results == ["new"]
+
+    def test_cancel_drops_result(self, qapp, pool):
+        loader = DataLoader("test", pool=pool)
+        started, release = threading.Event(), threading.Event()
+        states, results = [], []
+        loader.loading_changed.connect(states.append)
+
+        def fetch():
+            started.set()
+            release.wait(2)
+            return "late"
+
+        loader.load(fetch, results.append)
+        assert started.wait(2)
+        loader.cancel()
+        release.set()
+        pool.waitForDone(2000)
+        _process_until(lambda: False, timeout=0.05)
+
+        assert results == []
+        assert states == [True, False]
+        assert not loader._tasks
+
+    def test_queued_request_is_never_run(self, qapp, pool):
+        loader = DataLoader("test", pool=pool)
+        blocker = DataLoader("blocker", pool=pool)
+        release = threading.Event()
+        ran = []
+
+        blocker.load(lambda: release.wait(2), lambda _: None)
+        loader.load(lambda: ran.append(True), lambda _: None)
+        loader.cancel()
+        release.set()
+        pool.waitForDone(2000)
+
+        assert ran == []
+        assert not loader._tasks
+
+    def test_errors_go_to_error_callback(self, qapp, pool):
+        loader = DataLoader("test", pool=pool)
+        errors = []
+
+        def fetch():
+            raise RuntimeError("connection refused")
+
+        loader.load(fetch, lambda _: None, errors.append)
+        assert _process_until(lambda: errors)
+        assert str(errors[0]) == "connection refused"
+        assert not loader.is_loading
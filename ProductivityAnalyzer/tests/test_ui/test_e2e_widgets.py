@@ -68,3 +68,22 @@ class TestGoalsWidget:
         card = GoalCard(goal)
         qtbot.addWidget(card)
         assert card is not None
+
+
+class TestActivityLogWidget:
+    """Test the Activity Log live feed."""
+
+    def test_live_feed_coalesces_and_stays_bounded(self, qtbot):
+        from ui.widgets.activity_log_widget import LIVE_FEED_MAX_LINES, ActivityLogWidget
+
+        mock_pool = MagicMock()
+        widget = ActivityLogWidget(db_pool=mock_pool)
+        qtbot.addWidget(widget)
+
+        for i in range(LIVE_FEED_MAX_LINES * 3):
+            widget.append_log(f"line {i}")
+        assert widget.live_log.blockCount() == 1  # nothing written until the flush
+
+        qtbot.waitUntil(lambda: widget.live_log.blockCount() == LIVE_FEED_MAX_LINES)
+        lines = widget.live_log.toPlainText().splitlines()
+        assert lines[-1] == f"line {LIVE_FEED_MAX_LINES * 3 - 1}"
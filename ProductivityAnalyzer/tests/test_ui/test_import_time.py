@@ -0,0 +1,71 @@
+"""
+Cold-start import benchmark: `python -X importtime -c "import ui.main_window"`.
+
+Fails when a heavy dependency lands back on the startup import path, or when
+importing the main window gets slower than the budget.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Generous for slow CI machines; the window imports in a few hundred ms locally
+BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1000"))
+
+# Loaded on first use (first chart, PDF export, LLM call, ...), never at startup
+DEFERRED_MODULES = (
+    "matplotlib",
+    "numpy",
+    "pandas",
+    "reportlab",
+    "openai",
+    "requests",
+    "services.integrations",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module loaded by `import module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)},
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            name = match.group(4)
+            times[name] = max(times.get(name, 0), int(match.group(2)))
+    return times
+
+
+class TestStartupImportTime:
+    def test_heavy_dependencies_are_not_imported_at_startup(self):
+        imported = _import_times("ui.main_window")
+        loaded = sorted(
+            name for name in imported if any(name == m or name.startswith(f"{m}.") for m in DEFERRED_MODULES)
+        )
+        assert loaded == []
+
+    def test_main_window_import_within_budget(self):
+        # Best of three, so one slow run on a busy machine does not fail the build
+        elapsed_ms = min(_import_times("ui.main_window")["ui.main_window"] for _ in range(3)) / 1000
+        assert (
+            elapsed_ms < BUDGET_MS
+        ), f"import ui.main_window took {elapsed_ms:.0f} ms (budget {BUDGET_MS:.0f} ms)"
+
+    def test_importing_one_tracking_module_does_not_load_the_package(self):
+        imported = _import_times("tracking.spool")
+        assert "tracking.activity_tracker" not in imported
+        assert "PyQt5.QtCore" not in imported
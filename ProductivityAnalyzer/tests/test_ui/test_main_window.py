@@ -0,0 +1,96 @@
+# tests/test_ui/test_main_window.py
+"""Tests for MainWindow page building and startup gating."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from ui import main_window
+from ui.main_window import MainWindow
+
+PAGE_FACTORIES = {
+    "_create_dashboard": MainWindow.PAGE_DASHBOARD,
+    "_create_activity_log": MainWindow.PAGE_ACTIVITY_LOG,
+    "_create_focus_mode": MainWindow.PAGE_FOCUS_MODE,
+    "_create_reports": MainWindow.PAGE_REPORTS,
+    "_create_goals": MainWindow.PAGE_GOALS,
+    "_create_settings": MainWindow.PAGE_SETTINGS,
+}
+
+
+class _Page(QWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.refresh_data = MagicMock()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(mock_db_pool, monkeypatch):
+    # The tracker and its window sampler are not needed to exercise navigation
+    monkeypatch.setattr(main_window, "ActivityTracker", MagicMock())
+    monkeypatch.setattr(main_window, "FocusModeManager", MagicMock())
+    monkeypatch.setattr(main_window, "NotificationService", MagicMock())
+    built: dict[int, int] = {}
+
+    def factory(index):
+        def build(self):
+            built[index] = built.get(index, 0) + 1
+            return _Page()
+
+        return build
+
+    # The dashboard is built in __init__, so the factories are patched on the class
+    for name, index in PAGE_FACTORIES.items():
+        monkeypatch.setattr(MainWindow, name, factory(index))
+    win = MainWindow(mock_db_pool)
+    yield win, built
+    win.deleteLater()
+
+
+class TestPageBuilding:
+    def test_only_the_dashboard_is_built_up_front(self, window):
+        win, built = window
+        assert built == {MainWindow.PAGE_DASHBOARD: 1}
+
+    def test_pages_are_built_once_on_first_navigation(self, window):
+        win, built = window
+        win.start()
+
+        win._navigate_to(MainWindow.PAGE_REPORTS)
+        assert built.get(MainWindow.PAGE_REPORTS) == 1
+        assert MainWindow.PAGE_GOALS not in built
+        reports = win.content_stack.currentWidget()
+
+        win._navigate_to(MainWindow.PAGE_DASHBOARD)
+        win._navigate_to(MainWindow.PAGE_REPORTS)
+
+        assert built[MainWindow.PAGE_REPORTS] == 1
+        assert built[MainWindow.PAGE_DASHBOARD] == 1
+        assert win.content_stack.currentWidget() is reports
+        assert reports.refresh_data.call_count == 2
+
+
+class TestStartupGating:
+    def test_navigation_is_disabled_until_start(self, window):
+        win, _ = window
+        assert not any(btn.isEnabled() for btn in win.nav_buttons)
+
+        win.start()
+
+        assert all(btn.isEnabled() for btn in win.nav_buttons)
+        win.content_stack.currentWidget().refresh_data.assert_called_once_with()
+
+    def test_pages_do_not_load_before_start(self, window):
+        win, _ = window
+        win._navigate_to(MainWindow.PAGE_SETTINGS)
+        win.content_stack.currentWidget().refresh_data.assert_not_called()
@@ -0,0 +1,91 @@
+# tests/test_ui/test_settings_widget.py
+"""Tests that category rule changes in Settings reach the running tracker."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QMessageBox
+
+from config.constants import AppCategory
+from services.recategorizer import RecategorizeStats
+from tracking.activity_tracker import ActivityTracker
+from ui.widgets.settings_widget import RecategorizeWorker, SettingsWidget
+
+TITLE = "Zettelkasten - notes"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def settings(mock_db_pool, tmp_path, monkeypatch):
+    monkeypatch.setattr(QMessageBox, "information", MagicMock())
+    tracker = ActivityTracker(
+        mock_db_pool, event_bus=MagicMock(), spool_path=str(tmp_path / "activity.spool")
+    )
+    widget = SettingsWidget(mock_db_pool, tracker)
+    # History rewrites are covered by the recategorizer tests
+    widget._recategorize_history = MagicMock()
+    yield widget, tracker
+    tracker.write_buffer.spool.close()
+    widget.deleteLater()
+
+
+class TestCategoryRules:
+    def test_added_rule_changes_tracker_categorization(self, settings):
+        widget, tracker = settings
+        assert tracker.categorizer.categorize(TITLE) == AppCategory.NEUTRAL  # now cached
+
+        widget.new_keyword_input.setText("zettelkasten")
+        widget.new_category_input.setCurrentText("productive")
+        widget._add_category_rule()
+
+        assert tracker.categorizer.categorize(TITLE) == AppCategory.PRODUCTIVE
+        widget._recategorize_history.assert_called_once_with("zettelkasten", AppCategory.PRODUCTIVE, None)
+
+    def test_removed_rule_changes_tracker_categorization(self, settings):
+        widget, tracker = settings
+        tracker.categorizer.add_rule("zettelkasten", AppCategory.UNPRODUCTIVE)
+        assert tracker.categorizer.categorize(TITLE) == AppCategory.UNPRODUCTIVE
+
+        widget._delete_rule("zettelkasten")
+
+        assert tracker.categorizer.categorize(TITLE) == AppCategory.NEUTRAL
+        widget._recategorize_history.assert_called_once_with("zettelkasten", None, AppCategory.UNPRODUCTIVE)
+
+
+class TestRecategorizeWorker:
+    def _worker(self, mock_db_pool, stats: RecategorizeStats, reconcile: MagicMock) -> RecategorizeWorker:
+        worker = RecategorizeWorker(
+            mock_db_pool, MagicMock(), "zettelkasten", AppCategory.PRODUCTIVE, None, reconcile
+        )
+        worker.recategorizer = MagicMock()
+        worker.recategorizer.apply_rule_change.return_value = stats
+        return worker
+
+    def test_reconciles_live_totals_on_the_worker_thread(self, mock_db_pool):
+        reconcile = MagicMock()
+        worker = self._worker(mock_db_pool, RecategorizeStats(scanned=5, changed=3), reconcile)
+        worker.run()
+        reconcile.assert_called_once_with()
+
+    def test_skips_reconcile_when_nothing_changed(self, mock_db_pool):
+        reconcile = MagicMock()
+        worker = self._worker(mock_db_pool, RecategorizeStats(scanned=5), reconcile)
+        worker.run()
+        reconcile.assert_not_called()
+
+    def test_result_slot_does_not_touch_the_database(self, settings):
+        widget, tracker = settings
+        tracker.reconcile_live = MagicMock()
+        worker = MagicMock()
+        widget._recategorize_workers.append(worker)
+        widget._on_recategorized(worker, RecategorizeStats(scanned=5, changed=3))
+        tracker.reconcile_live.assert_not_called()
+        assert "3 past activities" in widget.recategorize_status.text()
@@ -0,0 +1 @@
+# tests/test_utils/__init__.py
@@ -0,0 +1,52 @@
+"""Tests for the startup timing trace."""
+
+from utils.startup_trace import StartupTrace
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStartupTrace:
+    def test_phase_records_offset_and_duration(self):
+        clock = FakeClock()
+        trace = StartupTrace(clock=clock)
+        clock.now += 0.5
+        with trace.phase("database_pool"):
+            clock.now += 0.25
+
+        phase = trace.get("database_pool")
+        assert phase.started == 0.5
+        assert phase.duration == 0.25
+        assert phase.finished == 0.75
+
+    def test_begin_end_and_marks_in_start_order(self):
+        clock = FakeClock()
+        trace = StartupTrace(clock=clock)
+        trace.begin("migrations")
+        clock.now += 0.1
+        trace.mark("window_shown")
+        clock.now += 0.4
+        trace.end("migrations")
+
+        assert [phase.name for phase in trace.phases()] == ["migrations", "window_shown"]
+        assert trace.get("window_shown").duration == 0
+        assert trace.get("migrations").duration == 0.5
+
+    def test_end_without_begin_is_ignored(self):
+        trace = StartupTrace(clock=FakeClock())
+        assert trace.end("never_started") is None
+        assert trace.phases() == []
+
+    def test_phase_recorded_when_step_raises(self):
+        trace = StartupTrace(clock=FakeClock())
+        try:
+            with trace.phase("main_window"):
+                raise RuntimeError("no display")
+        except RuntimeError:
+            pass
+        assert trace.get("main_window") is not None
@@ -0,0 +1,278 @@
+"""Tests for the X11 active-window watcher.
+
+The Xvfb tests run when DISPLAY points at an X server (e.g. `xvfb-run pytest`).
+Without a window manager, they set _NET_ACTIVE_WINDOW on the root window themselves.
+"""
+
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utils import platform_utils
+from utils.x11_window_watcher import NO_ACTIVE_WINDOW, X11WindowWatcher
+
+Xlib = pytest.importorskip("Xlib")
+from Xlib import X  # noqa: E402
+
+ROOT, ACTIVE_ATOM, NAME_ATOM, WM_NAME_ATOM, UTF8_ATOM = 1, 10, 11, 12, 13
+
+
+def _prop(value):
+    return SimpleNamespace(value=value)
+
+
+def _event(window_id, atom, type_=X.PropertyNotify):
+    return SimpleNamespace(type=type_, window=SimpleNamespace(id=window_id), atom=atom)
+
+
+class TestX11WindowWatcherEvents:
+    """Event handling against a fake display; no X server needed."""
+
+    def setup_method(self):
+        self.active = 0
+        self.titles: dict[int, object] = {}
+        self.windows: dict[int, MagicMock] = {}
+
+        self.watcher = X11WindowWatcher()
+        self.watcher._root = MagicMock(id=ROOT)
+        self.watcher._root.get_full_property.side_effect = lambda atom, _type: _prop([self.active])
+        self.watcher._atoms = {
+            "_NET_ACTIVE_WINDOW": ACTIVE_ATOM,
+            "_NET_WM_NAME": NAME_ATOM,
+            "WM_NAME": WM_NAME_ATOM,
+            "UTF8_STRING": UTF8_ATOM,
+        }
+        self.watcher._display = MagicMock()
+        self.watcher._display.create_resource_object.side_effect = self._window
+        self.seen: list[str] = []
+        self.watcher.subscribe(self.seen.append)
+
+    def _window(self, _kind, window_id):
+        if window_id not in self.windows:
+            window = MagicMock()
+            window.get_full_property.side_effect = lambda atom, _type: (
+                _prop(self.titles[window_id]) if atom == NAME_ATOM and window_id in self.titles else None
+            )
+            self.windows[window_id] = window
+        return self.windows[window_id]
+
+    def _focus(self, window_id):
+        self.active = window_id
+        self.watcher._handle_event(_event(ROOT, ACTIVE_ATOM))
+
+    def test_focus_change_emits_new_title(self):
+        self.titles = {100: b"Visual Studio Code", 200: "YouTube - Firefox"}
+        self._focus(100)
+        self._focus(200)
+        assert self.seen == ["Visual Studio Code", "YouTube - Firefox"]
+        assert self.watcher.current_title() == "YouTube - Firefox"
+        assert self.watcher.changes == 2
+
+    def test_only_focused_window_is_watched(self):
+        self.titles = {100: b"Editor", 200: b"Browser"}
+        self._focus(100)
+        self._focus(200)
+        self.windows[100].change_attributes.assert_called_with(event_mask=X.NoEventMask)
+        self.windows[200].change_attributes.assert_called_once_with(event_mask=X.PropertyChangeMask)
+
+        self.titles[100] = b"Editor - renamed"
+        self.watcher._handle_event(_event(100, NAME_ATOM))
+        assert self.seen == ["Editor", "Browser"]
+
+    def test_title_change_on_focused_window(self):
+        self.titles = {100: b"main.py - Editor"}
+        self._focus(100)
+        self.titles[100] = b"test.py - Editor"
+        self.watcher._handle_event(_event(100, NAME_ATOM))
+        assert self.seen == ["main.py - Editor", "test.py - Editor"]
+
+    def test_repeated_events_without_change_are_silent(self):
+        self.titles = {100: b"Terminal"}
+        self._focus(100)
+        self._focus(100)
+        self.watcher._handle_event(_event(100, NAME_ATOM))
+        self.watcher._handle_event(_event(100, WM_NAME_ATOM))
+        self.watcher._handle_event(_event(ROOT, ACTIVE_ATOM, type_=X.ConfigureNotify))
+        assert self.seen == ["Terminal"]
+
+    def test_untitled_or_closed_window_is_no_active_window(self):
+        self.titles = {100: b"Terminal"}
+        self._focus(100)
+        self._focus(0)
+        self._focus(300)
+        assert self.seen == ["Terminal", NO_ACTIVE_WINDOW]
+
+    def test_destroyed_window_is_no_active_window(self):
+        from Xlib.error import BadWindow
+
+        self.titles = {100: b"Terminal"}
+        self._focus(100)
+        self.windows[100].get_full_property.side_effect = BadWindow(self.watcher._display, bytes(32))
+        self.watcher._handle_event(_event(100, NAME_ATOM))
+        assert self.watcher.current_title() == NO_ACTIVE_WINDOW
+
+    def test_failing_callback_does_not_block_others(self):
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        self.watcher.unsubscribe(self.seen.append)
+        self.watcher.subscribe(failing)
+        self.watcher.subscribe(self.seen.append)
+        self.titles = {100: b"Terminal"}
+        self._focus(100)
+        assert self.seen == ["Terminal"]
+
+
+class TestX11WindowWatcherShutdown:
+    def setup_method(self):
+        self.watcher = X11WindowWatcher()
+        self.display = self.watcher._display = MagicMock()
+        self.watcher._wake_r, self.watcher._wake_w = self.pipe = os.pipe()
+
+    def _fd_is_open(self, fd):
+        try:
+            os.fstat(fd)
+        except OSError:
+            return False
+        return True
+
+    def test_event_thread_error_closes_pipe_and_display(self):
+        self.display.pending_events.side_effect = Xlib.error.ConnectionClosedError("display")
+        self.watcher._running = True
+
+        self.watcher._run()
+
+        assert not self.watcher.is_running
+        assert not any(self._fd_is_open(fd) for fd in self.pipe)
+        self.display.close.assert_called_once_with()
+        # Nothing is left for stop() to do, and doing nothing twice is fine
+        self.watcher.stop()
+        self.display.close.assert_called_once_with()
+
+    def test_stop_closes_whatever_is_still_open(self):
+        self.watcher._running = False
+
+        self.watcher.stop()
+
+        assert not any(self._fd_is_open(fd) for fd in self.pipe)
+        self.display.close.assert_called_once_with()
+        assert self.watcher._wake_r == self.watcher._wake_w == -1
+
+
+class TestPlatformWatcherFallback:
+    def setup_method(self):
+        platform_utils._window_watcher = None
+        platform_utils._watcher_unavailable = False
+
+    teardown_method = setup_method
+
+    @patch.object(platform_utils, "SYSTEM", "Linux")
+    @patch("utils.x11_window_watcher.X11WindowWatcher.start", return_value=False)
+    def test_falls_back_to_xdotool_without_display(self, mock_start):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.stdout = "Terminal\n"
+            assert platform_utils.get_active_window_title() == "Terminal"
+            assert platform_utils.get_active_window_title() == "Terminal"
+        # The failed connection is not retried on every poll
+        mock_start.assert_called_once()
+        assert mock_run.call_count == 2
+
+    @patch.object(platform_utils, "SYSTEM", "Linux")
+    @patch("Xlib.display.Display", side_effect=Exception("Can't connect to display"))
+    def test_idle_time_unknown_without_display(self, mock_display):
+        platform_utils._idle_display = None
+        platform_utils._idle_unavailable = False
+        try:
+            assert platform_utils.get_idle_seconds() is None
+            assert platform_utils.get_idle_seconds() is None
+            mock_display.assert_called_once()
+        finally:
+            platform_utils._idle_unavailable = False
+
+    @patch.object(platform_utils, "SYSTEM", "Linux")
+    def test_uses_watcher_title_without_subprocess(self):
+        watcher = MagicMock(is_running=True)
+        watcher.current_title.return_value = "Editor"
+        platform_utils._window_watcher = watcher
+        with patch("subprocess.run") as mock_run:
+            assert platform_utils.get_active_window_title() == "Editor"
+        mock_run.assert_not_called()
+
+
+@pytest.mark.skipif(not os.environ.get("DISPLAY"), reason="needs an X server (run under Xvfb)")
+class TestX11WindowWatcherXvfb:
+    def setup_method(self):
+        from Xlib import display
+
+        self.display = display.Display()
+        self.root = self.display.screen().root
+        self.active_atom = self.display.intern_atom("_NET_ACTIVE_WINDOW")
+        self.name_atom = self.display.intern_atom("_NET_WM_NAME")
+        self.utf8_atom = self.display.intern_atom("UTF8_STRING")
+        self.windows = []
+
+        self.watcher = X11WindowWatcher()
+        self.changed = threading.Condition()
+        self.seen: list[str] = []
+        self.watcher.subscribe(self._on_change)
+
+    def teardown_method(self):
+        self.watcher.stop()
+        self.root.delete_property(self.active_atom)
+        for window in self.windows:
+            window.destroy()
+        self.display.close()
+
+    def _on_change(self, title):
+        with self.changed:
+            self.seen.append(title)
+            self.changed.notify_all()
+
+    def _wait_for(self, count):
+        with self.changed:
+            return self.changed.wait_for(lambda: len(self.seen) >= count, timeout=2)
+
+    def _create(self, title):
+        window = self.root.create_window(0, 0, 10, 10, 0, X.CopyFromParent)
+        self._rename(window, title)
+        self.windows.append(window)
+        return window
+
+    def _rename(self, window, title):
+        window.change_property(self.name_atom, self.utf8_atom, 8, title.encode())
+        self.display.flush()
+
+    def _focus(self, window):
+        self.root.change_property(self.active_atom, Xlib.Xatom.WINDOW, 32, [window.id])
+        self.display.flush()
+
+    def test_follows_focus_and_title_changes(self):
+        editor = self._create("main.py - Editor")
+        browser = self._create("Docs - Firefox")
+        self._focus(editor)
+        assert self.watcher.start()
+        assert self.watcher.current_title() == "main.py - Editor"
+
+        self._focus(browser)
+        assert self._wait_for(1)
+        self._rename(browser, "YouTube - Firefox")
+        assert self._wait_for(2)
+        assert self.seen == ["Docs - Firefox", "YouTube - Firefox"]
+
+    def test_idle_time_from_screensaver_extension(self):
+        idle = platform_utils.get_idle_seconds()
+        assert idle is not None and idle >= 0
+
+    def test_unchanged_title_is_not_emitted(self):
+        editor = self._create("Editor")
+        other = self._create("Other")
+        self._focus(editor)
+        assert self.watcher.start()
+        self._rename(editor, "Editor")
+        self._focus(editor)
+        # The title of an unfocused window is not followed
+        self._rename(other, "Other - renamed")
+        self._focus(other)
+        assert self._wait_for(1)
+        assert self.seen == ["Other - renamed"]
@@ -1,7 +1,33 @@
 # tracking/__init__.py
-from tracking.activity_tracker import ActivityTracker
-from tracking.categorizer import AppCategorizer
-from tracking.focus_mode import FocusModeManager
-from tracking.website_blocker import WebsiteBlocker
+from typing import TYPE_CHECKING
 
-__all__ = ["ActivityTracker", "AppCategorizer", "FocusModeManager", "WebsiteBlocker"]
+from utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from tracking.activity_tracker import ActivityTracker
+    from tracking.categorizer import AppCategorizer
+    from tracking.focus_mode import FocusModeManager
+    from tracking.website_blocker import WebsiteBlocker
+    from tracking.window_events import WindowEventBus, get_window_event_bus
+
+# Imported on first use, so loading one tracking module does not pull in the rest
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ActivityTracker": "tracking.activity_tracker",
+        "AppCategorizer": "tracking.categorizer",
+        "FocusModeManager": "tracking.focus_mode",
+        "WebsiteBlocker": "tracking.website_blocker",
+        "WindowEventBus": "tracking.window_events",
+        "get_window_event_bus": "tracking.window_events",
+    },
+)
+
+__all__ = [
+    "ActivityTracker",
+    "AppCategorizer",
+    "FocusModeManager",
+    "WebsiteBlocker",
+    "WindowEventBus",
+    "get_window_event_bus",
+]
@@ -13,15 +13,34 @@ from database.connection import DatabasePool
 from database.models import ActivityLog
 from database.repositories.activity_repo import ActivityRepository
 from tracking.categorizer import AppCategorizer
+from tracking.live_aggregator import LiveAggregator
+from tracking.spool import ActivitySpool
+from tracking.window_events import (
+    SubscriberStats,
+    Subscription,
+    WindowChangeEvent,
+    WindowEventBus,
+    get_window_event_bus,
+)
+from tracking.write_buffer import ActivityWriteBuffer, WriteBufferStats
 from utils.logger import setup_logger
-from utils.platform_utils import get_active_window_title
 
 logger = setup_logger("tracking.activity")
 
+# Window changes buffered for the tracker before the oldest are dropped
+TRACKER_QUEUE_SIZE = 1024
+
+# How long the stopping tracker waits for its final flush; MainWindow waits 3 s for the thread
+SHUTDOWN_FLUSH_SECONDS = 2.0
+
 
 class ActivityTracker(QThread):
     """
-    Background thread that tracks the active window at regular intervals.
+    Background thread that logs how long each window stays focused.
+    Window changes come from the shared WindowEventBus, which samples adaptively and
+    reports a stretch without input as a single away event (logged as one IDLE record).
+    Today's running totals, including the open window, are kept in `live`.
+    Finished activities are journaled to a local spool first, so a database outage loses nothing.
 
     Signals:
         activity_logged(str): Emitted when a new activity is logged (formatted string).
@@ -33,11 +52,26 @@ class ActivityTracker(QThread):
     error_occurred = pyqtSignal(str)
     tracking_status_changed = pyqtSignal(bool)
 
-    def __init__(self, db_pool: DatabasePool, parent=None):
+    def __init__(
+        self,
+        db_pool: DatabasePool,
+        parent=None,
+        event_bus: WindowEventBus | None = None,
+        spool_path: str | None = None,
+    ):
         super().__init__(parent)
         self.db_pool = db_pool
+        self.event_bus = event_bus or get_window_event_bus()
+        self._subscription: Subscription | None = None
         self.activity_repo = ActivityRepository(db_pool)
         self.categorizer = AppCategorizer(db_pool)
+        self.write_buffer = ActivityWriteBuffer(
+            self.activity_repo,
+            batch_size=app_config.write_batch_size,
+            flush_interval=app_config.write_flush_seconds,
+            spool=self._open_spool(spool_path or app_config.spool_path),
+        )
+        self.live = LiveAggregator()
         self.is_tracking = False
         self.interval = app_config.tracking_interval  # seconds
         self._last_window_title = ""
@@ -46,31 +80,39 @@ class ActivityTracker(QThread):
     def run(self):
         """Main tracking loop — runs in background thread."""
         self.is_tracking = True
+        self.write_buffer.start()
         self.tracking_status_changed.emit(True)
         logger.info(f"Activity tracking started (interval: {self.interval}s)")
 
-        while self.is_tracking:
-            try:
-                self._track_once()
-            except Exception as e:
-                logger.error(f"Tracking error: {e}", exc_info=True)
-                self.error_occurred.emit(str(e))
-
-            # Sleep in small increments so we can stop quickly
-            for _ in range(self.interval * 10):
-                if not self.is_tracking:
+        self.reconcile_live()
+        self._subscription = self.event_bus.subscribe(
+            "tracker", poll_interval=self.interval, max_queue=TRACKER_QUEUE_SIZE
+        )
+        try:
+            while self.is_tracking:
+                # Blocks until the window changes; stop_tracking() closes the subscription
+                event = self._subscription.get()
+                if event is None:
                     break
-                self.msleep(100)  # 100ms intervals
-
+                try:
+                    self._record_change(event)
+                except Exception as e:
+                    logger.error(f"Tracking error: {e}", exc_info=True)
+                    self.error_occurred.emit(str(e))
+        finally:
+            self._subscription.close()
+
+        # Unwritten rows stay in the spool if the database does not take them in time
+        self.write_buffer.stop(timeout=SHUTDOWN_FLUSH_SECONDS)
         self.tracking_status_changed.emit(False)
         logger.info("Activity tracking stopped")
 
-    def _track_once(self):
-        """Track the current active window once."""
-        current_time = datetime.datetime.now()
-        window_title = get_active_window_title()
+    def _record_change(self, event: WindowChangeEvent):
+        """Log the window that just lost focus and start timing the new one."""
+        current_time = event.timestamp
+        window_title = event.title
 
-        # Skip if same window as before (we'll update duration instead)
+        # The bus only publishes changes, but a resubscribe replays the current window
         if window_title == self._last_window_title:
             return
 
@@ -85,7 +127,9 @@ class ActivityTracker(QThread):
                 category=category,
                 duration_seconds=duration,
             )
-            self.activity_repo.log_activity(activity)
+            with self.live.lock:
+                self.write_buffer.add(activity)
+                self.live.record(activity)
 
             # Emit signal for UI update
             log_msg = (
@@ -99,13 +143,44 @@ class ActivityTracker(QThread):
         # Update tracking state
         self._last_window_title = window_title
         self._last_change_time = current_time
+        self.live.open(window_title, self.categorizer.categorize(window_title), current_time)
+
+        if event.idle:
+            # Nothing is written until input resumes, so don't leave rows waiting meanwhile
+            logger.debug("User idle, flushing pending activity")
+            self.write_buffer.flush()
+
+    @staticmethod
+    def _open_spool(path: str) -> ActivitySpool | None:
+        try:
+            return ActivitySpool(path)
+        except OSError as e:
+            logger.error(f"Cannot open activity spool {path}, rows will only be buffered in memory: {e}")
+            return None
 
     def stop_tracking(self):
-        """Stop the tracking loop gracefully."""
+        """Stop the tracking loop gracefully; the tracker thread then flushes pending rows."""
         logger.info("Stopping activity tracker...")
         self.is_tracking = False
+        if self._subscription is not None:
+            self._subscription.close()
+
+    def reconcile_live(self) -> bool:
+        """Re-seed today's live totals from the database plus the rows still buffered."""
+        with self.write_buffer.hold_flushes():
+            return self.live.reconcile(self.activity_repo, self.write_buffer.pending)
+
+    def write_stats(self) -> WriteBufferStats:
+        """Queue depth, flush latency, journal size and replay lag of the write-behind buffer."""
+        return self.write_buffer.stats()
+
+    def event_stats(self) -> SubscriberStats | None:
+        """Queue depth, drops and delivery latency of the tracker's window-event subscription."""
+        return self._subscription.stats() if self._subscription is not None else None
 
     def set_interval(self, seconds: int):
         """Update tracking interval."""
         self.interval = max(1, seconds)
+        if self._subscription is not None:
+            self._subscription.set_poll_interval(self.interval)
         logger.info(f"Tracking interval set to {self.interval}s")
@@ -2,10 +2,17 @@
 """
 Categorizes window titles into productivity categories.
 Loads rules from database and falls back to defaults.
+
+When a title contains keywords of several categories, the category earliest in
+CATEGORY_PRECEDENCE wins (e.g. "GitHub - Firefox" is productive, not neutral).
 """
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from config.constants import (
@@ -14,6 +21,8 @@ from config.constants import (
     UNPRODUCTIVE_KEYWORDS,
     AppCategory,
 )
+from database.query_cache import DEFAULT_TTL
+from tracking.keyword_matcher import KeywordMatcher
 from utils.logger import setup_logger
 
 if TYPE_CHECKING:
@@ -21,37 +30,89 @@ if TYPE_CHECKING:
 
 logger = setup_logger("tracking.categorizer")
 
+# Lower index wins when a title matches keywords of more than one category
+CATEGORY_PRECEDENCE = (
+    AppCategory.PRODUCTIVE,
+    AppCategory.UNPRODUCTIVE,
+    AppCategory.NEUTRAL,
+    AppCategory.IDLE,
+)
+
+# Title recorded for a stretch without keyboard or mouse input
+AWAY_TITLE = "Away (no input)"
+
+# Titles the tracker records when no real window is focused; always idle
+IDLE_TITLES = ("No Active Window", "Error", "", AWAY_TITLE)
+
+
+@dataclass(frozen=True)
+class CategorizerCacheStats:
+    """Snapshot of the categorization result cache."""
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    max_size: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
 
 class AppCategorizer:
     """Categorizes applications/windows as productive, unproductive, neutral, or idle."""
 
-    def __init__(self, db_pool: DatabasePool | None = None) -> None:
+    def __init__(self, db_pool: DatabasePool | None = None, cache_size: int = 4096) -> None:
         self.db_pool: DatabasePool | None = db_pool
         self.rules: dict[str, AppCategory] = {}
+        self._matcher: KeywordMatcher[AppCategory] = KeywordMatcher()
+        # Lower-cased title -> (deciding keyword, category), least recently used first
+        self._cache: OrderedDict[str, tuple[str | None, AppCategory]] = OrderedDict()
+        self._cache_size = max(0, cache_size)
+        # Guards the matcher and the cache, which relink / reorder on every lookup
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
         self._load_default_rules()
         if db_pool:
             self._load_db_rules()
 
+    @classmethod
+    def from_rules(cls, rules: dict[str, str], cache_size: int = 4096) -> AppCategorizer:
+        """Build a detached categorizer from a get_all_rules() snapshot (no defaults, no database)."""
+        categorizer = cls(db_pool=None, cache_size=cache_size)
+        with categorizer._lock:
+            categorizer.rules.clear()
+            categorizer._matcher.clear()
+        for keyword, category in rules.items():
+            categorizer._set_rule(keyword, AppCategory(category))
+        return categorizer
+
     def _load_default_rules(self) -> None:
         """Load built-in default rules."""
         for keyword in PRODUCTIVE_KEYWORDS:
-            self.rules[keyword.lower()] = AppCategory.PRODUCTIVE
+            self._set_rule(keyword.lower(), AppCategory.PRODUCTIVE)
         for keyword in UNPRODUCTIVE_KEYWORDS:
-            self.rules[keyword.lower()] = AppCategory.UNPRODUCTIVE
+            self._set_rule(keyword.lower(), AppCategory.UNPRODUCTIVE)
         for keyword in NEUTRAL_KEYWORDS:
-            self.rules[keyword.lower()] = AppCategory.NEUTRAL
+            self._set_rule(keyword.lower(), AppCategory.NEUTRAL)
 
     def _load_db_rules(self) -> None:
         """Load custom rules from the database (overrides defaults)."""
         if self.db_pool is None:
             return
         try:
-            rows = self.db_pool.fetch_all("SELECT keyword, category FROM app_categories")
+            rows = self.db_pool.fetch_all(
+                "SELECT keyword, category FROM app_categories", cache_ttl=DEFAULT_TTL
+            )
             for row in rows:
                 keyword = row[0].lower().strip()
                 try:
                     category = AppCategory(row[1])
-                    self.rules[keyword] = category
+                    self._set_rule(keyword, category)
                 except ValueError:
                     logger.warning(f"Unknown category '{row[1]}' for keyword '{keyword}'")
             logger.info(f"Loaded {len(rows)} category rules from database")
@@ -60,21 +121,56 @@ class AppCategorizer:
 
     def categorize(self, window_title: str) -> AppCategory:
         """Categorize a window title."""
-        if not window_title or window_title in ("No Active Window", "Error", ""):
+        if not window_title or window_title in IDLE_TITLES:
             return AppCategory.IDLE
 
-        title_lower = window_title.lower()
-
-        for keyword, category in self.rules.items():
-            if keyword in title_lower:
-                return category
-
-        return AppCategory.NEUTRAL
+        return self._lookup(window_title.lower())[1]
+
+    def match(self, window_title: str) -> str | None:
+        """Return the keyword that decides the category of a title, if any."""
+        if not window_title:
+            return None
+        return self._lookup(window_title.lower())[0]
+
+    def cache_stats(self) -> CategorizerCacheStats:
+        """Hit/miss counters of the title -> category LRU cache."""
+        with self._lock:
+            return CategorizerCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._cache),
+                max_size=self._cache_size,
+                invalidations=self._invalidations,
+            )
+
+    def _lookup(self, title_lower: str) -> tuple[str | None, AppCategory]:
+        with self._lock:
+            cached = self._cache.get(title_lower)
+            if cached is not None:
+                self._cache.move_to_end(title_lower)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+            match = self._matcher.find(title_lower)
+            result = match if match else (None, AppCategory.NEUTRAL)
+            if self._cache_size:
+                self._cache[title_lower] = result
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+            return result
+
+    def _invalidate(self, stale: Callable[[str, str | None], bool]) -> None:
+        """Evict cached titles for which `stale(title, deciding_keyword)` is true. Caller holds the lock."""
+        evict = [title for title, (keyword, _) in self._cache.items() if stale(title, keyword)]
+        for title in evict:
+            del self._cache[title]
+        self._invalidations += len(evict)
 
     def add_rule(self, keyword: str, category: AppCategory) -> bool:
         """Add or update a categorization rule."""
         keyword = keyword.lower().strip()
-        self.rules[keyword] = category
+        self._set_rule(keyword, category)
 
         if self.db_pool is not None:
             try:
@@ -96,12 +192,24 @@ class AppCategorizer:
     def remove_rule(self, keyword: str) -> bool:
         """Remove a categorization rule."""
         keyword = keyword.lower().strip()
-        self.rules.pop(keyword, None)
+        with self._lock:
+            self.rules.pop(keyword, None)
+            if self._matcher.remove(keyword):
+                # Only titles this keyword was deciding can change category
+                self._invalidate(lambda title, decided_by: decided_by == keyword)
 
         if self.db_pool is not None:
             return self.db_pool.execute_query("DELETE FROM app_categories WHERE keyword = %s", (keyword,))
         return True
 
+    def _set_rule(self, keyword: str, category: AppCategory) -> None:
+        with self._lock:
+            self.rules[keyword] = category
+            self._matcher.add(keyword, category, CATEGORY_PRECEDENCE.index(category))
+            # Only titles containing the keyword can change category
+            self._invalidate(lambda title, decided_by: keyword in title)
+
     def get_all_rules(self) -> dict[str, str]:
         """Return all rules as keyword -> category string dict."""
-        return {k: v.value for k, v in sorted(self.rules.items())}
+        with self._lock:
+            return {k: v.value for k, v in sorted(self.rules.items())}
@@ -8,45 +8,78 @@ from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal
 from database.connection import DatabasePool
 from database.models import FocusSettings
 from database.repositories.focus_settings_repo import FocusSettingsRepository
+from tracking.keyword_matcher import KeywordMatcher
 from tracking.website_blocker import WebsiteBlocker
+from tracking.window_events import Subscription, WindowEventBus, get_window_event_bus
 from utils.logger import setup_logger
-from utils.platform_utils import get_active_window_title, minimize_window
+from utils.platform_utils import minimize_window
 
 logger = setup_logger("tracking.focus_mode")
 
 
 class AppBlockerWorker(QThread):
-    """Background thread that monitors and blocks distracting apps."""
+    """Background thread that blocks distracting apps as soon as they gain focus."""
 
     app_blocked = pyqtSignal(str)
 
-    def __init__(self, blocked_apps: list[str], parent: QObject = None) -> None:  # type: ignore[assignment]
+    def __init__(
+        self,
+        blocked_apps: list[str],
+        parent: QObject = None,  # type: ignore[assignment]
+        event_bus: WindowEventBus | None = None,
+    ) -> None:
         super().__init__(parent)
+        self.event_bus = event_bus or get_window_event_bus()
+        self._subscription: Subscription | None = None
         self.blocked_apps = [app.strip().lower() for app in blocked_apps if app.strip()]
         self.is_active = False
+        self._matcher: KeywordMatcher[str] = KeywordMatcher()
+        for priority, app in enumerate(self.blocked_apps):
+            self._matcher.add(app, app, priority)
+        # A new subscription replays the current window, so reuse the last verdict
+        self._last_title: str | None = None
+        self._last_match: str | None = None
+
+    def _blocked_app_for(self, title: str) -> str | None:
+        """Return the blocked app a window title belongs to, if any."""
+        if title != self._last_title:
+            match = self._matcher.find(title.lower())
+            self._last_title = title
+            self._last_match = match[1] if match else None
+        return self._last_match
 
     def run(self) -> None:
         self.is_active = True
         logger.info(f"App blocker started. Blocking: {self.blocked_apps}")
 
-        while self.is_active:
-            try:
-                active_title = get_active_window_title()
-                if active_title and active_title != "No Active Window":
-                    title_lower = active_title.lower()
-                    for app in self.blocked_apps:
-                        if app in title_lower:
-                            minimize_window(active_title)
-                            self.app_blocked.emit(app)
-                            logger.info(f"Blocked app: {app} (window: {active_title[:50]})")
-                            break
-            except Exception as e:
-                logger.error(f"App blocker error: {e}")
-
-            self.msleep(1000)
+        # Only the latest window matters to the blocker, so a one-slot queue keeps just that
+        self._subscription = self.event_bus.subscribe(
+            "app_blocker", poll_interval=1.0, max_queue=1, max_interval=1.0
+        )
+        try:
+            while self.is_active:
+                event = self._subscription.get()
+                if event is None:
+                    break
+                try:
+                    self._check(event.title)
+                except Exception as e:
+                    logger.error(f"App blocker error: {e}")
+        finally:
+            self._subscription.close()
+
+    def _check(self, active_title: str) -> None:
+        if active_title and active_title != "No Active Window":
+            app = self._blocked_app_for(active_title)
+            if app:
+                minimize_window(active_title)
+                self.app_blocked.emit(app)
+                logger.info(f"Blocked app: {app} (window: {active_title[:50]})")
 
     def stop(self) -> None:
         self.is_active = False
+        if self._subscription is not None:
+            self._subscription.close()
 
 
 class FocusModeManager(QObject):
@@ -59,9 +92,15 @@ class FocusModeManager(QObject):
     app_blocked = pyqtSignal(str)
     time_remaining = pyqtSignal(int)
 
-    def __init__(self, db_pool: DatabasePool, parent: QObject = None) -> None:  # type: ignore[assignment]
+    def __init__(
+        self,
+        db_pool: DatabasePool,
+        parent: QObject = None,  # type: ignore[assignment]
+        event_bus: WindowEventBus | None = None,
+    ) -> None:
         super().__init__(parent)
         self.db_pool = db_pool
+        self.event_bus = event_bus or get_window_event_bus()
         self.focus_repo = FocusSettingsRepository(db_pool)
         self.website_blocker = WebsiteBlocker()
         self.app_blocker_worker: AppBlockerWorker | None = None
@@ -92,7 +131,7 @@ class FocusModeManager(QObject):
 
         # Start app blocker thread
         if settings.blocked_apps:
-            self.app_blocker_worker = AppBlockerWorker(settings.blocked_apps)
+            self.app_blocker_worker = AppBlockerWorker(settings.blocked_apps, event_bus=self.event_bus)
             self.app_blocker_worker.app_blocked.connect(self.app_blocked.emit)
             self.app_blocker_worker.start()
 
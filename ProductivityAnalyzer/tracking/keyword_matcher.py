@@ -0,0 +1,130 @@
+# tracking/keyword_matcher.py
+"""
+Aho-Corasick multi-keyword matcher.
+
+All keywords are compiled into one trie with failure links, so finding every
+keyword contained in a title costs one pass over the title regardless of how
+many keywords there are. When several keywords match, the one with the lowest
+priority value wins, then the longest keyword, then the one that ends first.
+"""
+
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_ROOT = 0
+
+
+class KeywordMatcher(Generic[T]):
+    """Substring matcher over a mutable keyword set with explicit precedence."""
+
+    def __init__(self) -> None:
+        self._keywords: dict[str, tuple[int, T]] = {}
+        # Trie nodes are parallel lists indexed by node id
+        self._children: list[dict[str, int]] = [{}]
+        self._terminal: list[str | None] = [None]
+        self._fail: list[int] = [_ROOT]
+        self._best: list[str | None] = [None]
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def __contains__(self, keyword: object) -> bool:
+        return keyword in self._keywords
+
+    def add(self, keyword: str, value: T, priority: int = 0) -> None:
+        """Add or replace a keyword. Only the trie path is touched; links are relinked lazily."""
+        if not keyword:
+            return
+        self._keywords[keyword] = (priority, value)
+        node = _ROOT
+        for char in keyword:
+            nxt = self._children[node].get(char)
+            if nxt is None:
+                nxt = len(self._children)
+                self._children[node][char] = nxt
+                self._children.append({})
+                self._terminal.append(None)
+                self._fail.append(_ROOT)
+                self._best.append(None)
+            node = nxt
+        self._terminal[node] = keyword
+        self._dirty = True
+
+    def remove(self, keyword: str) -> bool:
+        """Remove a keyword. Returns False if it was not present."""
+        if self._keywords.pop(keyword, None) is None:
+            return False
+        node = _ROOT
+        for char in keyword:
+            node = self._children[node][char]
+        # The now-unused trie path stays; it carries no output and is dropped on clear()
+        self._terminal[node] = None
+        self._dirty = True
+        return True
+
+    def clear(self) -> None:
+        """Remove every keyword and reclaim the trie."""
+        self._keywords.clear()
+        self._children = [{}]
+        self._terminal = [None]
+        self._fail = [_ROOT]
+        self._best = [None]
+        self._dirty = False
+
+    def find(self, text: str) -> tuple[str, T] | None:
+        """Return the winning (keyword, value) contained in `text`, or None."""
+        if self._dirty:
+            self._link()
+
+        children, fail, best, rank = self._children, self._fail, self._best, self._rank
+        node = _ROOT
+        winner: str | None = None
+        for char in text:
+            while node and char not in children[node]:
+                node = fail[node]
+            node = children[node].get(char, _ROOT)
+            candidate = best[node]
+            if (
+                candidate is not None
+                and candidate != winner
+                and (winner is None or rank(candidate) < rank(winner))
+            ):
+                winner = candidate
+
+        if winner is None:
+            return None
+        return winner, self._keywords[winner][1]
+
+    def _rank(self, keyword: str) -> tuple[int, int]:
+        return self._keywords[keyword][0], -len(keyword)
+
+    def _link(self) -> None:
+        """Recompute failure links and per-node best output breadth-first."""
+        children, fail, best, terminal = self._children, self._fail, self._best, self._terminal
+        best[_ROOT] = None
+        queue = []
+        for child in children[_ROOT].values():
+            fail[child] = _ROOT
+            queue.append(child)
+
+        for node in queue:
+            # The best match ending here is this node's keyword or the best one on its suffix chain
+            inherited = best[fail[node]]
+            own = terminal[node]
+            if own is None or (inherited is not None and self._rank(inherited) < self._rank(own)):
+                best[node] = inherited
+            else:
+                best[node] = own
+
+            for char, child in children[node].items():
+                f = fail[node]
+                while f and char not in children[f]:
+                    f = fail[f]
+                fail[child] = children[f].get(char, _ROOT)
+                queue.append(child)
+
+        self._dirty = False
@@ -0,0 +1,173 @@
+# tracking/live_aggregator.py
+"""
+In-process running totals of today's activity.
+
+The tracker feeds every finished activity and the currently open window into a
+LiveAggregator, so today's per-category seconds, entry counts and per-app
+totals can be read without querying PostgreSQL, and include the window that is
+still open. Totals are seeded from the database by reconcile() at startup.
+
+Activities are attributed to the day they started, like DATE(timestamp) in the
+rollup; at midnight the totals start over for the new day.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from config.constants import AppCategory
+from database.models import ActivityLog
+from database.repositories.activity_repo import ActivityRepository
+from utils.logger import setup_logger
+
+logger = setup_logger("tracking.live_aggregator")
+
+
+@dataclass(frozen=True)
+class OpenActivity:
+    """The focused window that has not been logged yet."""
+
+    window_title: str
+    category: AppCategory
+    started: datetime
+
+    def seconds(self, now: datetime) -> int:
+        return max(0, int((now - self.started).total_seconds()))
+
+
+class LiveAggregator:
+    """Thread-safe running totals for one day. Writers hold `lock` to make multi-step updates atomic."""
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.day = date.today()
+        self._seconds: dict[str, int] = {}
+        self._counts: dict[str, int] = {}
+        self._apps: dict[str, list[int]] = {}  # title -> [count, seconds]
+        self._open: OpenActivity | None = None
+        self._reconciled = False
+
+    @property
+    def reconciled(self) -> bool:
+        return self._reconciled
+
+    def covers(self, target_date: date) -> bool:
+        """Whether totals for `target_date` can be served from memory."""
+        with self.lock:
+            self._roll_over(date.today())
+            return self._reconciled and target_date == self.day
+
+    def record(self, activity: ActivityLog) -> None:
+        """Add a finished activity to the running totals."""
+        day = activity.timestamp.date()
+        with self.lock:
+            self._roll_over(day)
+            if day != self.day:
+                # Started before the current day; only yesterday's rollup would contain it
+                return
+            category = activity.category.value
+            self._seconds[category] = self._seconds.get(category, 0) + activity.duration_seconds
+            self._counts[category] = self._counts.get(category, 0) + 1
+            app = self._apps.setdefault(activity.window_title, [0, 0])
+            app[0] += 1
+            app[1] += activity.duration_seconds
+
+    def open(self, window_title: str, category: AppCategory, started: datetime) -> None:
+        """Set the window that is currently focused and not yet logged."""
+        with self.lock:
+            self._roll_over(started.date())
+            self._open = OpenActivity(window_title, category, started)
+
+    def open_activity(self) -> OpenActivity | None:
+        with self.lock:
+            return self._open
+
+    def summary(self, now: datetime | None = None) -> dict[str, dict[str, int]]:
+        """
+        Today's {category: {"count", "total_seconds"}} including the open window,
+        in the shape of ActivityRepository.get_productivity_summary.
+        """
+        now = now or datetime.now()
+        with self.lock:
+            self._roll_over(now.date())
+            result = {
+                category: {"count": self._counts.get(category, 0), "total_seconds": seconds}
+                for category, seconds in self._seconds.items()
+            }
+            current = self._current_open()
+            if current is not None:
+                totals = result.setdefault(current.category.value, {"count": 0, "total_seconds": 0})
+                totals["count"] += 1
+                totals["total_seconds"] += current.seconds(now)
+            return result
+
+    def top_apps(self, limit: int | None = 10, now: datetime | None = None) -> list[dict]:
+        """Today's apps by time spent, in the shape of ActivityRepository.get_top_apps."""
+        now = now or datetime.now()
+        with self.lock:
+            self._roll_over(now.date())
+            apps = {title: (count, seconds) for title, (count, seconds) in self._apps.items()}
+            current = self._current_open()
+            if current is not None:
+                count, seconds = apps.get(current.window_title, (0, 0))
+                apps[current.window_title] = (count + 1, seconds + current.seconds(now))
+
+        items = apps.items()
+        ranked = (
+            heapq.nlargest(limit, items, key=lambda item: item[1][1])
+            if limit is not None
+            else sorted(items, key=lambda item: item[1][1], reverse=True)
+        )
+        return [
+            {"window_title": title, "count": count, "total_seconds": seconds}
+            for title, (count, seconds) in ranked
+        ]
+
+    def reconcile(
+        self,
+        activity_repo: ActivityRepository,
+        pending: Callable[[], Iterable[ActivityLog]] = tuple,
+        today: date | None = None,
+    ) -> bool:
+        """
+        Replace the totals with the day's rows in the database plus `pending()` rows not yet
+        written. The caller must keep rows from being written meanwhile (see
+        ActivityWriteBuffer.hold_flushes). Returns False if the database could not be read.
+        """
+        today = today or date.today()
+        try:
+            summary = activity_repo.get_productivity_summary(today, today)
+            apps = activity_repo.get_top_apps(today, limit=None)
+        except Exception as e:
+            logger.error(f"Could not reconcile live totals: {e}")
+            return False
+
+        with self.lock:
+            self.day = today
+            self._seconds = {c: int(d["total_seconds"]) for c, d in summary.items()}
+            self._counts = {c: int(d["count"]) for c, d in summary.items()}
+            self._apps = {a["window_title"]: [int(a["count"]), int(a["total_seconds"])] for a in apps}
+            self._reconciled = True
+            # Rows still buffered are read under the lock, so a concurrent record() counts them once
+            for activity in pending():
+                self.record(activity)
+
+        logger.info(f"Live totals reconciled for {today}: {sum(self._counts.values())} entries")
+        return True
+
+    def _current_open(self) -> OpenActivity | None:
+        if self._open is not None and self._open.started.date() == self.day:
+            return self._open
+        return None
+
+    def _roll_over(self, day: date) -> None:
+        if day > self.day:
+            # A new day starts empty: nothing is logged for it until its first window closes
+            self.day = day
+            self._seconds.clear()
+            self._counts.clear()
+            self._apps.clear()
@@ -0,0 +1,213 @@
+# tracking/spool.py
+"""
+Local append-only journal for tracked activity.
+
+Every finished activity is appended to a memory-mapped file before it is
+queued for PostgreSQL, so rows survive a database outage and an application
+restart. The write buffer commits the journal up to the last row it managed
+to write; whatever lies beyond the committed offset is replayed on the next
+start. Once everything is committed the journal starts over from the top.
+
+File layout: a 64-byte header (magic, generation, committed offset) followed
+by records of [u32 length][u32 crc32][u32 generation] + JSON payload. A record
+with a bad CRC or a different generation marks the end of the journal, so a
+write torn by a crash, or data left over from an earlier generation, is ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from config.constants import AppCategory
+from database.models import ActivityLog
+from utils.logger import setup_logger
+
+logger = setup_logger("tracking.spool")
+
+MAGIC = b"PASPOOL1"
+HEADER = struct.Struct("<8sIQ")  # magic, generation, committed offset
+HEADER_SIZE = 64
+RECORD = struct.Struct("<III")  # payload length, crc32, generation
+DEFAULT_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class SpoolStats:
+    """Size of the journal and how far replay into the database is behind."""
+
+    pending_records: int = 0
+    pending_bytes: int = 0
+    file_bytes: int = 0
+    replay_lag_seconds: float = 0.0
+
+
+class ActivitySpool:
+    """Memory-mapped journal of activities not yet confirmed written to the database. Thread-safe."""
+
+    def __init__(self, path: str, initial_size: int = DEFAULT_SIZE) -> None:
+        self.path = path
+        self.initial_size = max(HEADER_SIZE + RECORD.size, initial_size)
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Kept open for the lifetime of the mapping
+        self._file = os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o600), "r+b")
+        self._file.seek(0, os.SEEK_END)
+        if self._file.tell() < self.initial_size:
+            self._file.truncate(self.initial_size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+        self._generation: int
+        self._committed: int
+        magic, self._generation, self._committed = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or not HEADER_SIZE <= self._committed <= len(self._map):
+            if magic != b"\0" * len(MAGIC):
+                logger.warning(f"Spool {path} has an unreadable header, starting a new one")
+            self._generation, self._committed = 1, HEADER_SIZE
+            self._write_header()
+
+        self._records = 0
+        self._oldest_spooled: float | None = None
+        self._tail = self._committed
+        for _, end, spooled_at in self._scan(self._committed):
+            if self._oldest_spooled is None:
+                self._oldest_spooled = spooled_at
+            self._records += 1
+            self._tail = end
+        if self._records:
+            logger.info(f"Spool {path} holds {self._records} activities not yet written")
+
+    @property
+    def tail(self) -> int:
+        """Offset just past the last record."""
+        with self._lock:
+            return self._tail
+
+    def append(self, activity: ActivityLog) -> int:
+        """Durably journal `activity`. Returns the offset to commit once it is in the database."""
+        spooled_at = time.time()
+        payload = json.dumps(
+            [
+                activity.row_key,
+                activity.timestamp.isoformat(),
+                activity.window_title,
+                activity.category.value,
+                activity.duration_seconds,
+                spooled_at,
+            ],
+            ensure_ascii=False,
+        ).encode("utf-8")
+        with self._lock:
+            end = self._tail + RECORD.size + len(payload)
+            if end > len(self._map):
+                self._resize(max(end, len(self._map) * 2))
+            RECORD.pack_into(self._map, self._tail, len(payload), zlib.crc32(payload), self._generation)
+            self._map[self._tail + RECORD.size : end] = payload
+            self._map.flush()
+            if self._oldest_spooled is None:
+                self._oldest_spooled = spooled_at
+            self._records += 1
+            self._tail = end
+            return end
+
+    def pending(self) -> list[ActivityLog]:
+        """Activities journaled after the committed offset, oldest first."""
+        return [activity for activity, _ in self.read()]
+
+    def read(self, offset: int = 0, limit: int | None = None) -> list[tuple[ActivityLog, int]]:
+        """
+        Up to `limit` uncommitted activities from `offset` on (a record boundary), oldest first,
+        each with the offset to commit once it is in the database.
+        """
+        with self._lock:
+            records: list[tuple[ActivityLog, int]] = []
+            for start, end, _ in self._scan(max(offset, self._committed)):
+                if limit is not None and len(records) >= limit:
+                    break
+                records.append((self._decode(start), end))
+            return records
+
+    def commit(self, offset: int) -> None:
+        """Mark every record before `offset` as written to the database."""
+        with self._lock:
+            if offset <= self._committed:
+                return
+            if offset >= self._tail:
+                # Fully drained: start over, and let the new generation mask the old records
+                self._generation += 1
+                self._committed = self._tail = HEADER_SIZE
+                self._records = 0
+                self._oldest_spooled = None
+                if len(self._map) > self.initial_size:
+                    self._resize(self.initial_size)
+            else:
+                remaining = [spooled_at for _, _, spooled_at in self._scan(offset)]
+                self._committed = offset
+                self._records = len(remaining)
+                self._oldest_spooled = remaining[0] if remaining else None
+            self._write_header()
+
+    def stats(self) -> SpoolStats:
+        with self._lock:
+            lag = time.time() - self._oldest_spooled if self._oldest_spooled is not None else 0.0
+            return SpoolStats(
+                pending_records=self._records,
+                pending_bytes=self._tail - self._committed,
+                file_bytes=len(self._map),
+                replay_lag_seconds=max(0.0, lag),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._map.flush()
+            self._map.close()
+            self._file.close()
+
+    def _scan(self, offset: int) -> Iterator[tuple[int, int, float]]:
+        """Yield (start, end, spooled_at) for each intact record from `offset` on."""
+        while offset + RECORD.size <= len(self._map):
+            length, crc, generation = RECORD.unpack_from(self._map, offset)
+            end = offset + RECORD.size + length
+            if length == 0 or generation != self._generation or end > len(self._map):
+                return
+            payload = self._map[offset + RECORD.size : end]
+            if zlib.crc32(payload) != crc:
+                logger.warning(f"Spool {self.path}: ignoring torn record at offset {offset}")
+                return
+            yield offset, end, json.loads(payload)[5]
+            offset = end
+
+    def _decode(self, start: int) -> ActivityLog:
+        length, _, _ = RECORD.unpack_from(self._map, start)
+        row_key, timestamp, title, category, duration, _ = json.loads(
+            self._map[start + RECORD.size : start + RECORD.size + length]
+        )
+        return ActivityLog(
+            timestamp=datetime.fromisoformat(timestamp),
+            window_title=title,
+            category=AppCategory(category),
+            duration_seconds=duration,
+            row_key=row_key,
+        )
+
+    def _write_header(self) -> None:
+        HEADER.pack_into(self._map, 0, MAGIC, self._generation, self._committed)
+        self._map.flush()
+
+    def _resize(self, size: int) -> None:
+        # The mapping has to be released before the file changes size (required on Windows)
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
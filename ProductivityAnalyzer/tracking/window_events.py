@@ -0,0 +1,418 @@
+# tracking/window_events.py
+"""
+Shared stream of window-change events.
+
+One sampler publishes a WindowChangeEvent whenever the focused window's title
+changes, and every consumer (activity tracker, app blocker, ...) reads from its
+own bounded Subscription. A slow consumer never delays the sampler or the other
+subscribers: when its queue is full the oldest events are dropped and counted.
+
+On X11 the sampler follows the X11WindowWatcher's events; elsewhere it polls
+get_active_window_title(). The polling interval adapts to how often the window
+changed recently: bursts of switching are sampled faster than the subscribers'
+nominal interval, stable stretches back off towards their ceiling.
+
+While there has been no keyboard or mouse input for the idle threshold, titles
+are not sampled at all. A single "away" event, backdated to the last input,
+stands for the whole stretch until input resumes.
+
+The sampler only runs while somebody is subscribed.
+"""
+
+from __future__ import annotations
+
+import datetime
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from config.settings import app_config
+from tracking.categorizer import AWAY_TITLE
+from utils.logger import setup_logger
+from utils.platform_utils import get_active_window_title, get_idle_seconds, get_window_watcher
+from utils.x11_window_watcher import X11WindowWatcher
+
+logger = setup_logger("tracking.window_events")
+
+DEFAULT_POLL_INTERVAL = 1.0
+# Adaptive polling never samples faster than this or than a quarter of the nominal interval
+MIN_POLL_INTERVAL = 0.25
+# Window changes within this many seconds count towards the current change rate
+CHANGE_RATE_WINDOW = 60.0
+# How often an event-driven sampler checks that its X11 watcher is still alive
+WATCHER_CHECK_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class WindowChangeEvent:
+    """The focused window changed to `title` at `timestamp`."""
+
+    title: str
+    timestamp: datetime.datetime
+    sequence: int
+    published: float  # time.perf_counter() when published, for latency
+    idle: bool = False  # True for the away event that starts an input-idle stretch
+
+
+@dataclass(frozen=True)
+class SubscriberStats:
+    """Snapshot of one subscriber's queue and delivery latency."""
+
+    name: str
+    depth: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    last_latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+    total_latency_seconds: float = 0.0
+
+    @property
+    def avg_latency_seconds(self) -> float:
+        return self.total_latency_seconds / self.delivered if self.delivered else 0.0
+
+
+class Subscription:
+    """A consumer's bounded queue of window-change events. Create with WindowEventBus.subscribe."""
+
+    def __init__(
+        self,
+        bus: WindowEventBus,
+        name: str,
+        poll_interval: float,
+        max_interval: float | None,
+        max_queue: int,
+    ) -> None:
+        self.name = name
+        self.max_queue = max(1, max_queue)
+        self._bus = bus
+        self._poll_interval = poll_interval
+        self._max_interval = max(poll_interval, max_interval or poll_interval * 2)
+        self._queue: deque[WindowChangeEvent] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self._delivered = 0
+        self._dropped = 0
+        self._last_latency = 0.0
+        self._max_latency = 0.0
+        self._total_latency = 0.0
+
+    @property
+    def closed(self) -> bool:
+        with self._cond:
+            return self._closed
+
+    @property
+    def poll_interval(self) -> float:
+        return self._poll_interval
+
+    @property
+    def max_interval(self) -> float:
+        return self._max_interval
+
+    def set_poll_interval(self, seconds: float, max_interval: float | None = None) -> None:
+        """Ask for a different nominal interval and ceiling (defaults to twice the interval)."""
+        self._poll_interval = seconds
+        self._max_interval = max(seconds, max_interval or seconds * 2)
+        self._bus._reschedule()
+
+    def get(self, timeout: float | None = None) -> WindowChangeEvent | None:
+        """Next event, blocking up to `timeout` seconds. Returns None on timeout or once closed."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._queue or self._closed, timeout)
+            if not self._queue:
+                return None
+            event = self._queue.popleft()
+            latency = time.perf_counter() - event.published
+            self._delivered += 1
+            self._last_latency = latency
+            self._max_latency = max(self._max_latency, latency)
+            self._total_latency += latency
+            return event
+
+    def close(self) -> None:
+        """Unsubscribe; a blocked get() returns None immediately."""
+        self._bus.unsubscribe(self)
+
+    def stats(self) -> SubscriberStats:
+        with self._cond:
+            return SubscriberStats(
+                name=self.name,
+                depth=len(self._queue),
+                delivered=self._delivered,
+                dropped=self._dropped,
+                last_latency_seconds=self._last_latency,
+                max_latency_seconds=self._max_latency,
+                total_latency_seconds=self._total_latency,
+            )
+
+    def _offer(self, event: WindowChangeEvent) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._queue.append(event)
+            if len(self._queue) > self.max_queue:
+                self._queue.popleft()
+                self._dropped += 1
+                logger.debug(f"Subscriber '{self.name}' is falling behind, dropped a window event")
+            self._cond.notify_all()
+
+    def _close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class WindowEventBus:
+    """Samples the focused window once and fans changes out to any number of subscribers."""
+
+    def __init__(
+        self,
+        title_source: Callable[[], str] | None = None,
+        idle_source: Callable[[], float | None] | None = None,
+        idle_threshold: float | None = None,
+    ) -> None:
+        # An explicit title source is always polled and only idle-aware with an explicit idle source;
+        # the defaults prefer X11 events and the platform's input idle time
+        self._title_source = title_source
+        if idle_source is None and title_source is None:
+            idle_source = get_idle_seconds
+        self._idle_source = idle_source
+        self.idle_threshold = app_config.idle_threshold_seconds if idle_threshold is None else idle_threshold
+        self._idle = False
+        self._recent_changes: deque[float] = deque()
+        self.interval = DEFAULT_POLL_INTERVAL
+        self._subscriptions: list[Subscription] = []
+        self._cond = threading.Condition()
+        self._lifecycle = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._watcher: X11WindowWatcher | None = None
+        self._running = False
+        self._current: WindowChangeEvent | None = None
+        self._sequence = 0
+        self.samples = 0
+
+    @property
+    def poll_interval(self) -> float:
+        with self._cond:
+            return min(
+                (s.poll_interval for s in self._subscriptions),
+                default=DEFAULT_POLL_INTERVAL,
+            )
+
+    @property
+    def max_interval(self) -> float:
+        with self._cond:
+            return min((s.max_interval for s in self._subscriptions), default=self.poll_interval * 2)
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def is_idle(self) -> bool:
+        return self._idle
+
+    def adaptive_interval(self) -> float:
+        """
+        Polling interval for the recent window-change rate: twice the nominal interval when
+        nothing changed for a minute, shrinking as changes pile up, within [floor, ceiling].
+        """
+        with self._cond:
+            horizon = time.monotonic() - CHANGE_RATE_WINDOW
+            while self._recent_changes and self._recent_changes[0] < horizon:
+                self._recent_changes.popleft()
+            nominal = self.poll_interval
+            floor = max(MIN_POLL_INTERVAL, nominal / 4)
+            interval = nominal * 2 / (1 + len(self._recent_changes))
+            return min(max(interval, floor), max(self.max_interval, floor))
+
+    def current(self) -> WindowChangeEvent | None:
+        """Most recent event, or None before the first sample."""
+        with self._cond:
+            return self._current
+
+    def subscribe(
+        self,
+        name: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_queue: int = 256,
+        max_interval: float | None = None,
+    ) -> Subscription:
+        """
+        Start receiving events. The current window, if already known, is delivered first.
+        `poll_interval` is the nominal sampling interval and `max_interval` the slowest the
+        subscriber tolerates (default twice the interval). `max_queue` bounds how many
+        undelivered events are kept; older ones are dropped.
+        """
+        subscription = Subscription(self, name, max(0.05, poll_interval), max_interval, max_queue)
+        with self._cond:
+            previous_interval = self.poll_interval
+            self._subscriptions.append(subscription)
+            if self._current is not None:
+                subscription._offer(self._current)
+            if subscription.poll_interval < previous_interval:
+                # A shorter interval takes effect right away
+                self._cond.notify_all()
+        self._start()
+        logger.debug(f"Window event subscriber '{name}' added")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._cond:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+        subscription._close()
+        self._stop()
+
+    def stats(self) -> list[SubscriberStats]:
+        with self._cond:
+            subscriptions = list(self._subscriptions)
+        return [s.stats() for s in subscriptions]
+
+    def publish(
+        self,
+        title: str,
+        idle: bool = False,
+        timestamp: datetime.datetime | None = None,
+    ) -> WindowChangeEvent | None:
+        """Publish `title` if it differs from the current window. Returns the new event, if any."""
+        with self._cond:
+            current = self._current
+            if current is not None and title == current.title and idle == current.idle:
+                return None
+            timestamp = timestamp or datetime.datetime.now()
+            if current is not None and timestamp < current.timestamp:
+                # A backdated event never reaches before the window it replaces
+                timestamp = current.timestamp
+            self._sequence += 1
+            event = WindowChangeEvent(
+                title=title,
+                timestamp=timestamp,
+                sequence=self._sequence,
+                published=time.perf_counter(),
+                idle=idle,
+            )
+            self._current = event
+            if not idle:
+                self._recent_changes.append(time.monotonic())
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription._offer(event)
+        return event
+
+    def _start(self) -> None:
+        with self._lifecycle:
+            if self._running or not self._has_subscribers():
+                return
+            if self._title_source is None:
+                watcher = get_window_watcher()
+                if watcher is not None and watcher.is_running:
+                    self._watcher = watcher
+                    watcher.subscribe(self._on_watcher_title)
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="window-event-sampler", daemon=True)
+            self._thread.start()
+            mode = "X11 events" if self._watcher is not None else f"polling every {self.poll_interval}s"
+            logger.info(f"Window event sampler started ({mode})")
+
+    def _stop(self) -> None:
+        with self._lifecycle:
+            if not self._running or self._has_subscribers():
+                return
+            with self._cond:
+                self._running = False
+                self._cond.notify_all()
+            if self._watcher is not None:
+                self._watcher.unsubscribe(self._on_watcher_title)
+                self._watcher = None
+            if self._thread is not None:
+                self._thread.join(5.0)
+                self._thread = None
+            with self._cond:
+                # Nobody is watching, so the last known window goes stale
+                self._current = None
+                self._idle = False
+                self._recent_changes.clear()
+            logger.info("Window event sampler stopped")
+
+    def _reschedule(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+
+    def _has_subscribers(self) -> bool:
+        with self._cond:
+            return bool(self._subscriptions)
+
+    def _run(self) -> None:
+        while True:
+            watching = self._watcher is not None and self._watcher.is_running
+            idle_for = self._idle_seconds()
+            if idle_for is not None and 0 < self.idle_threshold <= idle_for:
+                if not self._idle:
+                    self._enter_idle(idle_for)
+                # Only the cheap idle query runs until input resumes
+                wait = self.poll_interval
+            else:
+                if self._idle:
+                    self._idle = False
+                    logger.info("Input resumed, window sampling continues")
+                if watching and self._watcher is not None:
+                    # Changes arrive through the watcher callback; this only re-syncs the cached title
+                    self.publish(self._watcher.current_title())
+                    wait = self.poll_interval if self._idle_source else WATCHER_CHECK_SECONDS
+                else:
+                    self._sample()
+                    wait = self.adaptive_interval()
+            with self._cond:
+                if self._running:
+                    self.interval = wait
+                    self._cond.wait(wait)
+                if not self._running:
+                    return
+
+    def _enter_idle(self, idle_for: float) -> None:
+        with self._cond:
+            self._idle = True
+            since = datetime.datetime.now() - datetime.timedelta(seconds=idle_for)
+            self.publish(AWAY_TITLE, idle=True, timestamp=since)
+        logger.info(f"No input for {idle_for:.0f}s, window sampling paused")
+
+    def _idle_seconds(self) -> float | None:
+        if self._idle_source is None:
+            return None
+        try:
+            return self._idle_source()
+        except Exception as e:
+            logger.error(f"Idle time error: {e}")
+            return None
+
+    def _on_watcher_title(self, title: str) -> None:
+        # Focus changes without input (e.g. a popup) don't end an away stretch
+        if not self._idle:
+            self.publish(title)
+
+    def _sample(self) -> None:
+        source = self._title_source or get_active_window_title
+        try:
+            title = source()
+        except Exception as e:
+            logger.error(f"Window sampling error: {e}")
+            return
+        self.samples += 1
+        self.publish(title)
+
+
+_bus_lock = threading.Lock()
+_shared_bus: WindowEventBus | None = None
+
+
+def get_window_event_bus() -> WindowEventBus:
+    """Process-wide bus shared by the tracker, the app blocker and other consumers."""
+    global _shared_bus
+    with _bus_lock:
+        if _shared_bus is None:
+            _shared_bus = WindowEventBus()
+        return _shared_bus
@@ -0,0 +1,294 @@
+"""
+Write-behind buffer for tracked activity.
+
+The tracker hands finished ActivityLog entries to the buffer instead of
+inserting them one by one. A background flusher writes them to activity_log
+in a single multi-row INSERT when the batch fills up or the flush interval
+elapses, so the tracking thread never waits on the database.
+
+With an ActivitySpool attached, rows are journaled to disk before they are
+queued and are never dropped: whatever the database has not accepted is
+reloaded from the spool on start and replayed (in bulk, via COPY, once the
+backlog is large) when the database comes back. Every row gets a row_key, so
+a batch that is retried after an unacknowledged commit is not counted twice.
+During a long outage only the oldest max_pending rows are kept in memory; the
+rest stay in the spool alone and are read back as the backlog drains.
+"""
+
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from database.models import ActivityLog
+from database.repositories.activity_repo import ActivityRepository
+from tracking.spool import ActivitySpool
+from utils.logger import setup_logger
+
+logger = setup_logger("tracking.write_buffer")
+
+# Backlogs at least this large (e.g. after a DB outage) are replayed with COPY instead of INSERT
+COPY_THRESHOLD = 1000
+
+
+@dataclass(frozen=True)
+class WriteBufferStats:
+    """Snapshot of write-behind queue depth and flush timings."""
+
+    depth: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    flushed_rows: int = 0
+    dropped_rows: int = 0
+    spilled_rows: int = 0
+    last_flush_seconds: float = 0.0
+    max_flush_seconds: float = 0.0
+    total_flush_seconds: float = 0.0
+    journal_bytes: int = 0
+    replay_lag_seconds: float = 0.0
+
+    @property
+    def avg_flush_seconds(self) -> float:
+        attempts = self.flushes + self.failed_flushes
+        return self.total_flush_seconds / attempts if attempts else 0.0
+
+
+class ActivityWriteBuffer:
+    """Buffers ActivityLog rows and flushes them in batches from a background thread."""
+
+    def __init__(
+        self,
+        activity_repo: ActivityRepository,
+        batch_size: int = 50,
+        flush_interval: float = 30.0,
+        max_pending: int = 10_000,
+        spool: ActivitySpool | None = None,
+    ) -> None:
+        self.activity_repo = activity_repo
+        self.spool = spool
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_pending = max(self.batch_size, max_pending)
+
+        self._pending: deque[ActivityLog] = deque()
+        self._pending_ends: deque[int] = deque()  # spool offset just past each pending row
+        self._spool_offset = 0  # spool offset just past the newest pending row
+        self._spilled_rows = 0  # rows after _spool_offset that only the spool holds
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._flushed_rows = 0
+        self._dropped_rows = 0
+        self._last_flush = 0.0
+        self._max_flush = 0.0
+        self._total_flush = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of rows waiting to be written."""
+        with self._cond:
+            return self._depth_locked()
+
+    def start(self) -> None:
+        """Start the background flusher thread, first reloading rows left in the spool."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            if self.spool is not None:
+                # Everything pending is in the spool, along with whatever an earlier run left behind
+                self._pending.clear()
+                self._pending_ends.clear()
+                self._spool_offset = 0
+                self._spilled_rows = self.spool.stats().pending_records
+                if self._spilled_rows:
+                    logger.info(f"Replaying {self._spilled_rows} spooled activities")
+                self._refill_locked()
+        self._thread = threading.Thread(target=self._run, name="activity-write-buffer", daemon=True)
+        self._thread.start()
+        logger.debug(f"Write buffer started (batch={self.batch_size}, interval={self.flush_interval}s)")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the flusher thread, which writes out everything still pending first.
+        Waits at most `timeout` seconds; rows a stalled database has not taken by
+        then stay in the spool for the next start.
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        thread, self._thread = self._thread, None
+        if thread is None:
+            self.flush()
+            return
+        thread.join(timeout)
+        if thread.is_alive():
+            kept = "kept in the spool" if self.spool is not None else "lost"
+            logger.warning(
+                f"Final flush did not finish within {timeout:.1f}s; {self.depth} activities {kept}"
+            )
+
+    def add(self, activity: ActivityLog) -> None:
+        """Queue an activity for writing (journaling it first if spooled). Never blocks on the database."""
+        if activity.row_key is None:
+            activity.row_key = str(uuid.uuid4())
+        with self._cond:
+            end = 0
+            if self.spool is not None:
+                end = self.spool.append(activity)
+                if self._spilled_rows:
+                    # Older rows are waiting in the spool; this one is read back after them
+                    self._spilled_rows += 1
+                    return
+                self._spool_offset = end
+            filling = len(self._pending) < self.batch_size
+            self._pending.append(activity)
+            self._pending_ends.append(end)
+            self._trim_locked()
+            # Wake the flusher once, when the batch fills; it ignores wakeups while backing off
+            if filling and len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+
+    def flush(self) -> bool:
+        """Write all pending rows now. Returns False if the insert failed (rows are kept)."""
+        with self._flush_lock:
+            with self._cond:
+                if not self._pending:
+                    return True
+                batch = list(self._pending)
+                ends = list(self._pending_ends)
+                self._pending.clear()
+                self._pending_ends.clear()
+                commit_to = self._spool_offset
+
+            started = time.perf_counter()
+            try:
+                if len(batch) >= COPY_THRESHOLD:
+                    success = self.activity_repo.bulk_load_activities(batch).success
+                else:
+                    success = self.activity_repo.log_activities(batch)
+            except Exception as e:
+                logger.error(f"Write buffer flush error: {e}")
+                success = False
+            elapsed = time.perf_counter() - started
+
+            with self._cond:
+                self._last_flush = elapsed
+                self._max_flush = max(self._max_flush, elapsed)
+                self._total_flush += elapsed
+                if success:
+                    self._flushes += 1
+                    self._flushed_rows += len(batch)
+                    if self.spool is not None:
+                        self.spool.commit(commit_to)
+                        self._refill_locked()
+                else:
+                    # Put the batch back in front of anything queued meanwhile and retry later
+                    self._failed_flushes += 1
+                    self._pending.extendleft(reversed(batch))
+                    self._pending_ends.extendleft(reversed(ends))
+                    self._trim_locked()
+
+        if success:
+            logger.debug(f"Flushed {len(batch)} activities in {elapsed * 1000:.1f}ms")
+        else:
+            logger.warning(f"Failed to flush {len(batch)} activities, will retry")
+        return success
+
+    def pending(self) -> list[ActivityLog]:
+        """Snapshot of the rows not yet written, including those only the spool holds."""
+        with self._cond:
+            rows = list(self._pending)
+            if self.spool is not None and self._spilled_rows:
+                rows.extend(activity for activity, _ in self.spool.read(self._spool_offset))
+            return rows
+
+    @contextmanager
+    def hold_flushes(self) -> Iterator[None]:
+        """Keep rows from being written (an in-flight flush finishes first) while the block runs."""
+        with self._flush_lock:
+            yield
+
+    def stats(self) -> WriteBufferStats:
+        journal = self.spool.stats() if self.spool is not None else None
+        with self._cond:
+            return WriteBufferStats(
+                depth=self._depth_locked(),
+                flushes=self._flushes,
+                failed_flushes=self._failed_flushes,
+                flushed_rows=self._flushed_rows,
+                dropped_rows=self._dropped_rows,
+                spilled_rows=self._spilled_rows,
+                last_flush_seconds=self._last_flush,
+                max_flush_seconds=self._max_flush,
+                total_flush_seconds=self._total_flush,
+                journal_bytes=journal.pending_bytes if journal else 0,
+                replay_lag_seconds=journal.replay_lag_seconds if journal else 0.0,
+            )
+
+    def _depth_locked(self) -> int:
+        """Rows waiting to be written, including those only the spool holds."""
+        return len(self._pending) + self._spilled_rows
+
+    def _trim_locked(self) -> None:
+        """Shed rows beyond max_pending: the newest to the spool alone, or without one the oldest for good."""
+        overflow = len(self._pending) - self.max_pending
+        if overflow <= 0:
+            return
+        if self.spool is not None:
+            # Written in spool order, so the newest rows go; they are read back by _refill_locked()
+            for _ in range(overflow):
+                self._pending.pop()
+                self._pending_ends.pop()
+            self._spool_offset = self._pending_ends[-1]
+            if not self._spilled_rows:
+                logger.warning(
+                    f"Write buffer full, holding newer activities in the spool only ({self.spool.path})"
+                )
+            self._spilled_rows += overflow
+            return
+        for _ in range(overflow):
+            self._pending.popleft()
+            self._pending_ends.popleft()
+        self._dropped_rows += overflow
+        logger.error(f"Write buffer full, dropped {overflow} oldest activities")
+
+    def _refill_locked(self) -> None:
+        """Read rows that only the spool holds back into memory, up to max_pending."""
+        if self.spool is None or not self._spilled_rows:
+            return
+        room = self.max_pending - len(self._pending)
+        if room <= 0:
+            return
+        records = self.spool.read(self._spool_offset, limit=room)
+        for activity, end in records:
+            self._pending.append(activity)
+            self._pending_ends.append(end)
+        if records:
+            self._spool_offset = records[-1][1]
+        self._spilled_rows = 0 if len(records) < room else max(0, self._spilled_rows - len(records))
+
+    def _run(self) -> None:
+        retry_at = 0.0
+        while True:
+            with self._cond:
+                if retry_at:
+                    # After a failed flush, wait a full interval however many rows arrive meanwhile
+                    remaining = retry_at - time.monotonic()
+                    while self._running and remaining > 0:
+                        self._cond.wait(remaining)
+                        remaining = retry_at - time.monotonic()
+                elif self._running and len(self._pending) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                running = self._running
+            failed = not self.flush()
+            if not running:
+                return
+            retry_at = time.monotonic() + self.flush_interval if failed else 0.0
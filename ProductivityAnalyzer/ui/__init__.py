@@ -1,4 +1,12 @@
 # ui/__init__.py
-from ui.main_window import MainWindow
+from typing import TYPE_CHECKING
+
+from utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from ui.main_window import MainWindow
+
+# Importing a single ui module (e.g. ui.data_loader) must not build the whole window's import graph
+__getattr__, __dir__ = lazy_exports(__name__, {"MainWindow": "ui.main_window"})
 
 __all__ = ["MainWindow"]
@@ -0,0 +1,161 @@
+# ui/activity_table_model.py
+"""
+Lazily loaded table model for the Activity Log page.
+
+Rows are fetched a page at a time with keyset-paginated queries (category
+filtering happens in SQL), and the next page is requested only when the view
+scrolls near the end (canFetchMore / fetchMore). Pages load on the page's
+DataLoader, so scrolling never waits on the database.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtGui import QColor
+
+from config.constants import AppCategory
+from database.models import ActivityLog
+from database.repositories.activity_repo import ActivityRepository
+from ui.data_loader import DataLoader
+from utils.logger import setup_logger
+
+logger = setup_logger("ui.activity_model")
+
+PAGE_SIZE = 200
+
+CATEGORY_COLORS = {
+    AppCategory.PRODUCTIVE: QColor("#2ecc71"),
+    AppCategory.UNPRODUCTIVE: QColor("#e74c3c"),
+    AppCategory.NEUTRAL: QColor("#f39c12"),
+    AppCategory.IDLE: QColor("#95a5a6"),
+}
+DEFAULT_COLOR = QColor("#333")
+
+
+class ActivityTableModel(QAbstractTableModel):
+    """
+    One day's activities, newest first, loaded page by page as the view scrolls.
+
+    Signals:
+        total_changed(int): Number of matching activities, once the first page has loaded.
+    """
+
+    HEADERS = ("ID", "Timestamp", "Window Title", "Category", "Duration")
+    COL_ID, COL_TIMESTAMP, COL_TITLE, COL_CATEGORY, COL_DURATION = range(5)
+
+    total_changed = pyqtSignal(int)
+
+    def __init__(
+        self,
+        activity_repo: ActivityRepository,
+        loader: DataLoader,
+        page_size: int = PAGE_SIZE,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self.activity_repo = activity_repo
+        self.loader = loader
+        self.page_size = page_size
+        self._rows: list[ActivityLog] = []
+        self._target_date: date | None = None
+        self._category: str | None = None
+        self._exhausted = True
+        self._total: int | None = None
+
+    @property
+    def total(self) -> int | None:
+        """Number of matching activities, or None until it has been counted."""
+        return self._total
+
+    def set_filter(self, target_date: date, category: str | None = None) -> None:
+        """Show `target_date`'s activities (of one category, if given) starting from the newest."""
+        self.beginResetModel()
+        self._rows = []
+        self._target_date, self._category = target_date, category
+        self._exhausted = False
+        self._total = None
+        self.endResetModel()
+        self._request_page()
+
+    def activity(self, row: int) -> ActivityLog:
+        return self._rows[row]
+
+    # ── QAbstractTableModel ──
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        activity = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == self.COL_ID:
+                return str(activity.id or "")
+            if column == self.COL_TIMESTAMP:
+                return activity.timestamp.strftime("%H:%M:%S") if activity.timestamp else ""
+            if column == self.COL_TITLE:
+                return activity.window_title[:80]
+            if column == self.COL_CATEGORY:
+                return activity.category.value.capitalize()
+            if column == self.COL_DURATION:
+                return f"{activity.duration_seconds}s" if activity.duration_seconds else "—"
+        elif role == Qt.ToolTipRole and column == self.COL_TITLE:
+            return activity.window_title
+        elif role == Qt.ForegroundRole and column == self.COL_CATEGORY:
+            return CATEGORY_COLORS.get(activity.category, DEFAULT_COLOR)
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted and not self.loader.is_loading
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if self.canFetchMore(parent):
+            self._request_page()
+
+    # ── Paging ──
+
+    def _request_page(self) -> None:
+        if self._target_date is None:
+            return
+        target_date, category = self._target_date, self._category
+        # Counted with the first page delivered after a filter change
+        count = self._total is None
+        last = self._rows[-1] if self._rows else None
+        after = (last.timestamp, last.id) if last is not None and last.id is not None else None
+
+        def fetch() -> tuple[list[ActivityLog], int | None]:
+            page = self.activity_repo.get_activities_page(target_date, category, after, self.page_size)
+            total = self.activity_repo.count_activities(target_date, category) if count else None
+            return page, total
+
+        self.loader.load(fetch, self._append_page, self._on_error)
+
+    def _append_page(self, result: tuple[list[ActivityLog], int | None]) -> None:
+        page, total = result
+        if len(page) < self.page_size:
+            self._exhausted = True
+        if page:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+            self._rows.extend(page)
+            self.endInsertRows()
+        if total is not None:
+            self._total = total
+            self.total_changed.emit(total)
+        logger.debug(f"Activity log: {len(self._rows)} rows loaded for {self._target_date}")
+
+    def _on_error(self, error: Exception) -> None:
+        logger.error(f"Error loading activity log page: {error}", exc_info=error)
@@ -0,0 +1,45 @@
+# ui/chart_view.py
+"""
+Widget that displays a chart rendered off the GUI thread.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtWidgets import QLabel, QSizePolicy
+
+if TYPE_CHECKING:
+    from reporting.charts.base import ChartImage
+
+
+class ChartView(QLabel):
+    """Shows a ChartImage scaled to fit, keeping its aspect ratio."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setAlignment(Qt.AlignCenter)
+        # The image follows the layout, never the other way round
+        self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.setMinimumSize(200, 150)
+        self.chart_key: str | None = None
+        self._pixmap: QPixmap | None = None
+
+    def show_image(self, image: ChartImage) -> None:
+        if image.key and image.key == self.chart_key:
+            return
+        qimage = QImage(image.rgba, image.width, image.height, 4 * image.width, QImage.Format_RGBA8888)
+        # fromImage copies the pixels, so the pixmap does not keep `image` alive
+        self._pixmap = QPixmap.fromImage(qimage)
+        self.chart_key = image.key
+        self._rescale()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._rescale()
+
+    def _rescale(self) -> None:
+        if self._pixmap is not None:
+            self.setPixmap(self._pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
@@ -0,0 +1,156 @@
+# ui/data_loader.py
+"""
+Background data loading for page widgets.
+
+A page's refresh_data() hands its database work to a DataLoader. The fetch
+runs on a QThreadPool worker and its result is delivered back on the GUI
+thread, where the page builds its widgets. Starting a new load, or calling
+cancel() when the user navigates away, makes any earlier request stale: a
+request still queued is taken off the pool, and a result that arrives late
+is dropped.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from utils.logger import setup_logger
+
+logger = setup_logger("ui.data_loader")
+
+# Page loads share the database pool, so only a few are worth running at once
+MAX_LOADER_THREADS = 4
+
+_pool: QThreadPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_loader_pool() -> QThreadPool:
+    """The worker pool shared by every page's DataLoader."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = QThreadPool()
+            _pool.setMaxThreadCount(MAX_LOADER_THREADS)
+        return _pool
+
+
+class _LoadSignals(QObject):
+    # Emitted from the worker; queued to the loader on the GUI thread
+    done = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, request_id: int, fetch: Callable[[], Any], signals: _LoadSignals) -> None:
+        super().__init__()
+        self.request_id = request_id
+        self.fetch = fetch
+        self.signals = signals
+        self.cancelled = False
+        # The loader keeps the task alive until it reports back
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        if self.cancelled:
+            # Still report back so the loader can release the task; the result is stale anyway
+            self.signals.done.emit(self.request_id, None)
+            return
+        try:
+            result = self.fetch()
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, e)
+        else:
+            self.signals.done.emit(self.request_id, result)
+
+
+class DataLoader(QObject):
+    """
+    Runs one page's data fetches off the GUI thread; only the newest request is delivered.
+
+    Signals:
+        loading_changed(bool): Emitted when a load starts or the page stops waiting for one.
+    """
+
+    loading_changed = pyqtSignal(bool)
+
+    def __init__(self, name: str, pool: QThreadPool | None = None, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.name = name
+        self.pool = pool or get_loader_pool()
+        self._request_id = 0
+        self._task: _LoadTask | None = None
+        self._tasks: dict[int, _LoadTask] = {}  # started tasks that have not reported back
+        self._on_done: Callable[[Any], None] | None = None
+        self._on_error: Callable[[Exception], None] | None = None
+        self._signals = _LoadSignals()
+        self._signals.done.connect(self._deliver)
+        self._signals.failed.connect(self._fail)
+
+    @property
+    def is_loading(self) -> bool:
+        return self._task is not None
+
+    def load(
+        self,
+        fetch: Callable[[], Any],
+        on_done: Callable[[Any], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> int:
+        """
+        Run `fetch()` on the worker pool, then `on_done(result)` (or `on_error(exc)`) on the
+        GUI thread, unless another load or cancel() happens first. Returns the request id.
+        """
+        self._drop_pending()
+        self._request_id += 1
+        self._task = _LoadTask(self._request_id, fetch, self._signals)
+        self._tasks[self._request_id] = self._task
+        self._on_done, self._on_error = on_done, on_error
+        self.loading_changed.emit(True)
+        self.pool.start(self._task)
+        return self._request_id
+
+    def cancel(self) -> None:
+        """Forget the pending request; its result will not be delivered."""
+        if self._task is None:
+            return
+        self._drop_pending()
+        self._request_id += 1
+        self.loading_changed.emit(False)
+        logger.debug(f"{self.name}: pending load cancelled")
+
+    def _drop_pending(self) -> None:
+        if self._task is not None:
+            # A task that has already started cannot be stopped; its result is ignored instead
+            self._task.cancelled = True
+            if self.pool.tryTake(self._task):
+                del self._tasks[self._task.request_id]
+            self._task = None
+
+    def _finish(self, request_id: int) -> tuple[Callable | None, Callable | None] | None:
+        self._tasks.pop(request_id, None)
+        if request_id != self._request_id or self._task is None:
+            logger.debug(f"{self.name}: dropped stale result of request {request_id}")
+            return None
+        callbacks = (self._on_done, self._on_error)
+        self._task = self._on_done = self._on_error = None
+        self.loading_changed.emit(False)
+        return callbacks
+
+    def _deliver(self, request_id: int, result: object) -> None:
+        callbacks = self._finish(request_id)
+        if callbacks is not None and callbacks[0] is not None:
+            callbacks[0](result)
+
+    def _fail(self, request_id: int, error: Exception) -> None:
+        callbacks = self._finish(request_id)
+        if callbacks is None:
+            return
+        if callbacks[1] is not None:
+            callbacks[1](error)
+        else:
+            logger.error(f"{self.name}: load failed: {error}")
@@ -4,6 +4,8 @@ Main application window with sidebar navigation and stacked pages.
 """
 
 import os
+from collections import deque
+from collections.abc import Callable
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
@@ -26,7 +28,9 @@ from services.notification_service import NotificationService
 from services.suggestion_engine import SuggestionEngine
 from tracking.activity_tracker import ActivityTracker
 from tracking.focus_mode import FocusModeManager
-from ui.widgets.activity_log_widget import ActivityLogWidget
+from tracking.window_events import get_window_event_bus
+from ui.data_loader import get_loader_pool
+from ui.widgets.activity_log_widget import LIVE_FEED_MAX_LINES, ActivityLogWidget
 from ui.widgets.dashboard_widget import DashboardWidget
 from ui.widgets.focus_mode_widget import FocusModeWidget
 from ui.widgets.goals_widget import GoalsWidget
@@ -38,7 +42,13 @@ logger = setup_logger("ui.main_window")
 
 
 class MainWindow(QMainWindow):
-    """Main application window with sidebar navigation."""
+    """
+    Main application window with sidebar navigation.
+
+    Pages are built the first time they are shown. Tracking, navigation and
+    the first dashboard load wait for start(), which main() calls once the
+    database migrations have finished.
+    """
 
     PAGE_DASHBOARD = 0
     PAGE_ACTIVITY_LOG = 1
@@ -51,27 +61,49 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
         self.db_pool = db_pool
 
-        # Initialize services
-        self.activity_tracker = ActivityTracker(db_pool, parent=self)
-        self.focus_manager = FocusModeManager(db_pool, parent=self)
+        # Initialize services (one window sampler feeds the tracker and the app blocker)
+        self.window_events = get_window_event_bus()
+        self.activity_tracker = ActivityTracker(db_pool, parent=self, event_bus=self.window_events)
+        self.focus_manager = FocusModeManager(db_pool, parent=self, event_bus=self.window_events)
         self.notification_service = NotificationService(parent=self)
-        self.suggestion_engine = SuggestionEngine(db_pool)
-        self.report_generator = ReportGenerator(db_pool)
+        # Today's numbers are served from the tracker's live totals
+        self.suggestion_engine = SuggestionEngine(db_pool, live=self.activity_tracker.live)
+        self.report_generator = ReportGenerator(db_pool, live=self.activity_tracker.live)
 
         # Setup UI
         self.setWindowTitle(f"{app_config.app_name} v{app_config.version}")
         self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
         self.resize(1200, 750)
 
+        # Live feed lines that arrive before the Activity Log page exists
+        self._early_log: deque[str] = deque(maxlen=LIVE_FEED_MAX_LINES)
+        self._page_factories: dict[int, Callable[[], QWidget]] = {
+            self.PAGE_DASHBOARD: self._create_dashboard,
+            self.PAGE_ACTIVITY_LOG: self._create_activity_log,
+            self.PAGE_FOCUS_MODE: self._create_focus_mode,
+            self.PAGE_REPORTS: self._create_reports,
+            self.PAGE_GOALS: self._create_goals,
+            self.PAGE_SETTINGS: self._create_settings,
+        }
+        self._built_pages: set[int] = set()
+        self._started = False
+
         self._load_stylesheet()
         self._build_ui()
         self._connect_signals()
 
-        # Start tracking on launch
+        logger.info("Main window initialized")
+
+    def start(self) -> None:
+        """Start tracking and load the current page; call once the database schema is ready."""
+        if self._started:
+            return
+        self._started = True
         self.activity_tracker.start()
         self.notification_service.start_break_reminders()
-
-        logger.info("Main window initialized")
+        for btn in self.nav_buttons:
+            btn.setEnabled(True)
+        self._navigate_to(self.content_stack.currentIndex())
 
     def _load_stylesheet(self) -> None:
         """Load the QSS stylesheet with explicit UTF-8 encoding."""
@@ -100,35 +132,10 @@ class MainWindow(QMainWindow):
         self.content_stack = QStackedWidget()
         self.content_stack.setObjectName("contentStack")
 
-        # Create page widgets
-        self.dashboard_widget = DashboardWidget(
-            db_pool=self.db_pool,
-            report_gen=self.report_generator,
-            suggestion_engine=self.suggestion_engine,
-            parent=self,
-        )
-        self.activity_log_widget = ActivityLogWidget(db_pool=self.db_pool, parent=self)
-        self.focus_mode_widget = FocusModeWidget(
-            db_pool=self.db_pool,
-            focus_manager=self.focus_manager,
-            notification_service=self.notification_service,
-            parent=self,
-        )
-        self.reports_widget = ReportsWidget(db_pool=self.db_pool, parent=self)
-        self.goals_widget = GoalsWidget(db_pool=self.db_pool, parent=self)
-        self.settings_widget = SettingsWidget(
-            db_pool=self.db_pool,
-            tracker=self.activity_tracker,
-            parent=self,
-        )
-
-        # Add pages to stack
-        self.content_stack.addWidget(self.dashboard_widget)
-        self.content_stack.addWidget(self.activity_log_widget)
-        self.content_stack.addWidget(self.focus_mode_widget)
-        self.content_stack.addWidget(self.reports_widget)
-        self.content_stack.addWidget(self.goals_widget)
-        self.content_stack.addWidget(self.settings_widget)
+        # Every page starts as an empty placeholder and is built on first navigation
+        for _ in self._page_factories:
+            self.content_stack.addWidget(QWidget())
+        self._page(self.PAGE_DASHBOARD)
 
         main_layout.addWidget(self.content_stack)
 
@@ -171,6 +178,8 @@ class MainWindow(QMainWindow):
             btn.setFixedHeight(45)
             btn.setCursor(Qt.PointingHandCursor)
             btn.setCheckable(True)
+            # Pages query tables the migrations may not have created yet; start() enables these
+            btn.setEnabled(False)
             btn.clicked.connect(lambda checked, idx=page_index: self._navigate_to(idx))
             sidebar_layout.addWidget(btn)
             self.nav_buttons.append(btn)
@@ -195,15 +204,77 @@ class MainWindow(QMainWindow):
 
         return sidebar
 
+    def _page(self, page_index: int) -> QWidget:
+        """The page at `page_index`, built in place of its placeholder the first time it is needed."""
+        if page_index not in self._built_pages:
+            placeholder = self.content_stack.widget(page_index)
+            was_current = self.content_stack.currentIndex() == page_index
+            page = self._page_factories[page_index]()
+            self._built_pages.add(page_index)
+            self.content_stack.insertWidget(page_index, page)
+            self.content_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            if was_current:
+                self.content_stack.setCurrentIndex(page_index)
+            logger.debug(f"Built page {page_index}")
+        return self.content_stack.widget(page_index)
+
+    def _create_dashboard(self) -> QWidget:
+        self.dashboard_widget = DashboardWidget(
+            db_pool=self.db_pool,
+            report_gen=self.report_generator,
+            suggestion_engine=self.suggestion_engine,
+            parent=self,
+        )
+        return self.dashboard_widget
+
+    def _create_activity_log(self) -> QWidget:
+        self.activity_log_widget = ActivityLogWidget(db_pool=self.db_pool, parent=self)
+        while self._early_log:
+            self.activity_log_widget.append_log(self._early_log.popleft())
+        return self.activity_log_widget
+
+    def _create_focus_mode(self) -> QWidget:
+        self.focus_mode_widget = FocusModeWidget(
+            db_pool=self.db_pool,
+            focus_manager=self.focus_manager,
+            notification_service=self.notification_service,
+            parent=self,
+        )
+        return self.focus_mode_widget
+
+    def _create_reports(self) -> QWidget:
+        self.reports_widget = ReportsWidget(
+            db_pool=self.db_pool, live=self.activity_tracker.live, parent=self
+        )
+        return self.reports_widget
+
+    def _create_goals(self) -> QWidget:
+        self.goals_widget = GoalsWidget(db_pool=self.db_pool, parent=self)
+        return self.goals_widget
+
+    def _create_settings(self) -> QWidget:
+        self.settings_widget = SettingsWidget(
+            db_pool=self.db_pool,
+            tracker=self.activity_tracker,
+            parent=self,
+        )
+        return self.settings_widget
+
     def _navigate_to(self, page_index: int) -> None:
-        """Switch to a specific page."""
+        """Switch to a specific page; its data loads in the background once start() has run."""
+        previous_widget = self.content_stack.currentWidget()
+        if previous_widget is not self._page(page_index) and hasattr(previous_widget, "loader"):
+            # Results for a page that is no longer shown are not worth waiting for
+            previous_widget.loader.cancel()
+
         self.content_stack.setCurrentIndex(page_index)
 
         for i, btn in enumerate(self.nav_buttons):
             btn.setChecked(i == page_index)
 
         current_widget = self.content_stack.currentWidget()
-        if hasattr(current_widget, "refresh_data"):
+        if self._started and hasattr(current_widget, "refresh_data"):
             current_widget.refresh_data()
 
         logger.debug(f"Navigated to page {page_index}")
@@ -224,6 +295,8 @@ class MainWindow(QMainWindow):
         """Handle new activity log from tracker."""
         if hasattr(self, "activity_log_widget"):
             self.activity_log_widget.append_log(log_message)
+        else:
+            self._early_log.append(log_message)
 
     def _on_tracking_status_changed(self, is_tracking: bool) -> None:
         """Update tracking status indicator."""
@@ -245,4 +318,11 @@ class MainWindow(QMainWindow):
 
         self.notification_service.stop_break_reminders()
 
+        # Let page loads still using the database finish before the pool is closed
+        for i in range(self.content_stack.count()):
+            page = self.content_stack.widget(i)
+            if hasattr(page, "loader"):
+                page.loader.cancel()
+        get_loader_pool().waitForDone(3000)
+
         event.accept()
@@ -3,30 +3,37 @@
 Activity log page — shows real-time and historical activity entries.
 """
 
+from collections import deque
 from datetime import date
 
-from PyQt5.QtCore import QDate
+from PyQt5.QtCore import QDate, QTimer
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
     QComboBox,
     QDateEdit,
     QHBoxLayout,
     QHeaderView,
     QLabel,
+    QPlainTextEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextEdit,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from config.constants import AppCategory
 from database.connection import DatabasePool
 from database.repositories.activity_repo import ActivityRepository
+from ui.activity_table_model import ActivityTableModel
+from ui.data_loader import DataLoader
 from utils.logger import setup_logger
 
 logger = setup_logger("ui.activity_log")
 
+# The live feed keeps only the newest lines; older ones are in the history table
+LIVE_FEED_MAX_LINES = 500
+# Messages arriving within this window are written to the feed in one go
+LIVE_FEED_FLUSH_MS = 100
+
 
 class ActivityLogWidget(QWidget):
     """Activity log viewer with live feed and historical data."""
@@ -34,7 +41,16 @@ class ActivityLogWidget(QWidget):
     def __init__(self, db_pool: DatabasePool, parent=None):
         super().__init__(parent)
         self.activity_repo = ActivityRepository(db_pool)
+        self.loader = DataLoader("activity_log", parent=self)
+        self.model = ActivityTableModel(self.activity_repo, self.loader, parent=self)
+        self._pending_log: deque[str] = deque(maxlen=LIVE_FEED_MAX_LINES)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LIVE_FEED_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
         self._build_ui()
+        self.loader.loading_changed.connect(self.loading_label.setVisible)
+        self.model.total_changed.connect(lambda total: self.total_count_label.setText(str(total)))
 
     def _build_ui(self):
         layout = QVBoxLayout(self)
@@ -55,9 +71,10 @@ class ActivityLogWidget(QWidget):
         live_label.setStyleSheet("font-size: 15px; font-weight: bold;")
         layout.addWidget(live_label)
 
-        self.live_log = QTextEdit()
+        self.live_log = QPlainTextEdit()
         self.live_log.setObjectName("logArea")
         self.live_log.setReadOnly(True)
+        self.live_log.setMaximumBlockCount(LIVE_FEED_MAX_LINES)
         self.live_log.setMaximumHeight(180)
         self.live_log.setPlaceholderText("Activity will appear here as it's tracked...")
         layout.addWidget(self.live_log)
@@ -83,6 +100,11 @@ class ActivityLogWidget(QWidget):
         filter_btn.clicked.connect(self.refresh_data)
         filter_row.addWidget(filter_btn)
 
+        self.loading_label = QLabel("⏳ Loading...")
+        self.loading_label.setObjectName("loadingLabel")
+        self.loading_label.setVisible(False)
+        filter_row.addWidget(self.loading_label)
+
         filter_row.addStretch()
 
         total_label_title = QLabel("Total entries:")
@@ -94,63 +116,37 @@ class ActivityLogWidget(QWidget):
 
         layout.addLayout(filter_row)
 
-        # ── History Table ──
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["ID", "Timestamp", "Window Title", "Category", "Duration"])
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        # ── History Table ── (rows are fetched page by page as the view scrolls)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSectionResizeMode(ActivityTableModel.COL_TITLE, QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setAlternatingRowColors(True)
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         layout.addWidget(self.table)
 
     def refresh_data(self):
-        """Reload table data based on filters."""
-        try:
-            qdate = self.date_filter.date()
-            target_date = date(qdate.year(), qdate.month(), qdate.day())
-            activities = self.activity_repo.get_activities_by_date(target_date)
-
-            # Apply category filter
-            category_text = self.category_filter.currentText()
-            if category_text != "All":
-                activities = [a for a in activities if a.category.value == category_text.lower()]
-
-            self.table.setRowCount(len(activities))
-            for row, activity in enumerate(activities):
-                self.table.setItem(row, 0, QTableWidgetItem(str(activity.id or "")))
-                self.table.setItem(
-                    row,
-                    1,
-                    QTableWidgetItem(activity.timestamp.strftime("%H:%M:%S") if activity.timestamp else ""),
-                )
-                self.table.setItem(row, 2, QTableWidgetItem(activity.window_title[:80]))
-
-                cat_item = QTableWidgetItem(activity.category.value.capitalize())
-                cat_colors = {
-                    AppCategory.PRODUCTIVE: "#2ecc71",
-                    AppCategory.UNPRODUCTIVE: "#e74c3c",
-                    AppCategory.NEUTRAL: "#f39c12",
-                    AppCategory.IDLE: "#95a5a6",
-                }
-                from PyQt5.QtGui import QColor
-
-                cat_item.setForeground(QColor(cat_colors.get(activity.category, "#333")))
-                self.table.setItem(row, 3, cat_item)
-
-                duration_str = f"{activity.duration_seconds}s" if activity.duration_seconds else "—"
-                self.table.setItem(row, 4, QTableWidgetItem(duration_str))
-
-            self.total_count_label.setText(str(len(activities)))
-            logger.debug(f"Activity log refreshed: {len(activities)} entries for {target_date}")
-
-        except Exception as e:
-            logger.error(f"Error refreshing activity log: {e}", exc_info=True)
+        """Reload table data based on filters; rows load in pages as the table scrolls."""
+        qdate = self.date_filter.date()
+        target_date = date(qdate.year(), qdate.month(), qdate.day())
+        category_text = self.category_filter.currentText()
+        self.total_count_label.setText("…")
+        self.model.set_filter(target_date, None if category_text == "All" else category_text.lower())
 
     def append_log(self, message: str):
-        """Append a message to the live feed."""
-        self.live_log.append(message)
-        # Auto-scroll to bottom
+        """Queue a message for the live feed; bursts are written together on the next flush."""
+        self._pending_log.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._pending_log:
+            return
         scrollbar = self.live_log.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        self.live_log.appendPlainText("\n".join(self._pending_log))
+        self._pending_log.clear()
+        # Follow new entries unless the user has scrolled up to read older ones
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
@@ -3,8 +3,12 @@
 Dashboard page — shows overview stats, charts, and suggestions.
 """
 
+from __future__ import annotations
+
 from datetime import date
+from typing import TYPE_CHECKING
 
+from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -16,13 +20,18 @@ from PyQt5.QtWidgets import (
 )
 
 from database.connection import DatabasePool
-from reporting.charts.productivity_pie import ProductivityPieChart
-from reporting.charts.trend_line import ProductivityTrendChart
+from database.models import DailySummary
+from reporting.charts.renderer import get_chart_renderer
 from reporting.report_generator import ReportGenerator
-from services.suggestion_engine import SuggestionEngine
+from services.suggestion_engine import Suggestion, SuggestionEngine
+from ui.chart_view import ChartView
+from ui.data_loader import DataLoader
 from utils.logger import setup_logger
 from utils.validators import format_score_color, format_seconds
 
+if TYPE_CHECKING:
+    from reporting.charts.base import ChartImage
+
 logger = setup_logger("ui.dashboard")
 
 
@@ -59,7 +68,14 @@ class StatCard(QFrame):
 
 
 class DashboardWidget(QWidget):
-    """Main dashboard showing overview of productivity."""
+    """
+    Main dashboard showing overview of productivity.
+
+    Signals:
+        data_shown(): Emitted each time freshly loaded data has been displayed.
+    """
+
+    data_shown = pyqtSignal()
 
     def __init__(
         self,
@@ -72,8 +88,10 @@ class DashboardWidget(QWidget):
         self.db_pool = db_pool
         self.report_gen = report_gen
         self.suggestion_engine = suggestion_engine
+        self.loader = DataLoader("dashboard", parent=self)
+        self.chart_renderer = get_chart_renderer()
         self._build_ui()
-        self.refresh_data()
+        self.loader.loading_changed.connect(self.loading_label.setVisible)
 
     def _build_ui(self):
         scroll = QScrollArea()
@@ -94,6 +112,11 @@ class DashboardWidget(QWidget):
         subtitle.setObjectName("pageSubtitle")
         self.main_layout.addWidget(subtitle)
 
+        self.loading_label = QLabel("⏳ Loading...")
+        self.loading_label.setObjectName("loadingLabel")
+        self.loading_label.setVisible(False)
+        self.main_layout.addWidget(self.loading_label)
+
         # ── Stat Cards Row ──
         stats_row = QHBoxLayout()
         stats_row.setSpacing(15)
@@ -116,11 +139,17 @@ class DashboardWidget(QWidget):
         self.pie_container = QFrame()
         self.pie_container.setObjectName("card")
         self.pie_layout = QVBoxLayout(self.pie_container)
+        self.pie_view = ChartView(self.pie_container)
+        self.pie_view.setMinimumHeight(350)
+        self.pie_layout.addWidget(self.pie_view)
         charts_row.addWidget(self.pie_container, 1)
 
         self.trend_container = QFrame()
         self.trend_container.setObjectName("card")
         self.trend_layout = QVBoxLayout(self.trend_container)
+        self.trend_view = ChartView(self.trend_container)
+        self.trend_view.setMinimumHeight(350)
+        self.trend_layout.addWidget(self.trend_view)
         charts_row.addWidget(self.trend_container, 2)
 
         self.main_layout.addLayout(charts_row)
@@ -141,11 +170,24 @@ class DashboardWidget(QWidget):
         outer_layout.addWidget(scroll)
 
     def refresh_data(self):
-        """Reload all dashboard data."""
-        try:
-            # Get daily summary
-            summary = self.report_gen.get_daily_summary()
+        """Reload all dashboard data in the background."""
+        self.loader.load(self._fetch_data, self._show_data, self._on_load_error)
 
+    def _fetch_data(self) -> tuple[DailySummary, list[Suggestion], ChartImage, ChartImage]:
+        """Runs on a loader thread: query everything the page shows and render its charts."""
+        summary = self.report_gen.get_daily_summary()
+        weekly = self.report_gen.get_weekly_summaries()
+        suggestions = self.suggestion_engine.get_suggestions()
+        return (
+            summary,
+            suggestions,
+            self.chart_renderer.render("pie", summary, width=4, height=3.5),
+            self.chart_renderer.render("trend", weekly, width=6, height=3.5),
+        )
+
+    def _show_data(self, data: tuple[DailySummary, list[Suggestion], ChartImage, ChartImage]) -> None:
+        summary, suggestions, pie_image, trend_image = data
+        try:
             # Update stat cards
             score_color = format_score_color(summary.score)
             self.score_card.update_value(f"{summary.score}", score_color)
@@ -153,28 +195,24 @@ class DashboardWidget(QWidget):
             self.unproductive_card.update_value(format_seconds(summary.unproductive_seconds), "#e74c3c")
             self.total_card.update_value(format_seconds(summary.total_seconds), "#0984e3")
 
-            # Update pie chart
-            self._clear_layout(self.pie_layout)
-            pie_chart = ProductivityPieChart(summary, parent=self.pie_container, width=4, height=3.5)
-            self.pie_layout.addWidget(pie_chart)
-
-            # Update trend chart
-            self._clear_layout(self.trend_layout)
-            weekly = self.report_gen.get_weekly_summaries()
-            trend_chart = ProductivityTrendChart(weekly, parent=self.trend_container, width=6, height=3.5)
-            self.trend_layout.addWidget(trend_chart)
+            # Charts were rendered with the data; only the images change here
+            self.pie_view.show_image(pie_image)
+            self.trend_view.show_image(trend_image)
 
             # Update suggestions
-            self._update_suggestions()
+            self._update_suggestions(suggestions)
+            self.data_shown.emit()
 
         except Exception as e:
             logger.error(f"Dashboard refresh error: {e}", exc_info=True)
 
-    def _update_suggestions(self):
+    def _on_load_error(self, error: Exception) -> None:
+        logger.error(f"Dashboard refresh error: {error}", exc_info=error)
+
+    def _update_suggestions(self, suggestions: list[Suggestion]):
         """Refresh the suggestions list."""
         self._clear_layout(self.suggestions_container)
 
-        suggestions = self.suggestion_engine.get_suggestions()
         for suggestion in suggestions[:5]:  # Show top 5
             card = QFrame()
             card.setObjectName("suggestionCard")
@@ -25,6 +25,7 @@ from config.constants import GoalPeriod
 from database.connection import DatabasePool
 from database.models import ProductivityGoal
 from database.repositories.goals_repo import GoalsRepository
+from ui.data_loader import DataLoader
 from utils.logger import setup_logger
 from utils.validators import validate_goal_input
 
@@ -107,7 +108,9 @@ class GoalsWidget(QWidget):
     def __init__(self, db_pool: DatabasePool, parent=None):
         super().__init__(parent)
         self.goals_repo = GoalsRepository(db_pool)
+        self.loader = DataLoader("goals", parent=self)
         self._build_ui()
+        self.loader.loading_changed.connect(self.loading_label.setVisible)
 
     def _build_ui(self):
         layout = QVBoxLayout(self)
@@ -123,6 +126,11 @@ class GoalsWidget(QWidget):
         subtitle.setObjectName("pageSubtitle")
         layout.addWidget(subtitle)
 
+        self.loading_label = QLabel("⏳ Loading...")
+        self.loading_label.setObjectName("loadingLabel")
+        self.loading_label.setVisible(False)
+        layout.addWidget(self.loading_label)
+
         # ── Add Goal Form ──
         form_group = QGroupBox("Add New Goal")
         form_layout = QFormLayout(form_group)
@@ -176,15 +184,16 @@ class GoalsWidget(QWidget):
         layout.addWidget(scroll, 1)
 
     def refresh_data(self):
-        """Reload goals from database."""
+        """Reload goals from database in the background."""
+        self.loader.load(self.goals_repo.get_active_goals, self._show_goals, self._on_load_error)
+
+    def _show_goals(self, goals: list[ProductivityGoal]):
         # Clear existing cards
         while self.goals_list_layout.count() > 1:  # Keep the stretch
             item = self.goals_list_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
 
-        goals = self.goals_repo.get_active_goals()
-
         if not goals:
             no_goals = QLabel("No active goals. Add one above to get started! 🎯")
             no_goals.setStyleSheet("color: #636e72; font-size: 14px; padding: 20px;")
@@ -197,6 +206,9 @@ class GoalsWidget(QWidget):
 
         logger.debug(f"Goals refreshed: {len(goals)} active goals")
 
+    def _on_load_error(self, error: Exception):
+        logger.error(f"Error loading goals: {error}", exc_info=error)
+
     def _add_goal(self):
         """Validate and add a new goal."""
         title = self.goal_title_input.text().strip()
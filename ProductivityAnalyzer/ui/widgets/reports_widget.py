@@ -3,7 +3,10 @@
 Reports page - view charts and export reports.
 """
 
+from __future__ import annotations
+
 from datetime import date
+from typing import TYPE_CHECKING, Any
 
 from PyQt5.QtCore import QDate, Qt
 from PyQt5.QtWidgets import (
@@ -20,28 +23,45 @@ from PyQt5.QtWidgets import (
 
 from database.connection import DatabasePool
 from database.repositories.activity_repo import ActivityRepository
-from reporting.charts.activity_chart import ActivityBarChart
-from reporting.charts.productivity_pie import ProductivityPieChart
-from reporting.charts.trend_line import ProductivityTrendChart
-from reporting.exporters.csv_exporter import CSVExporter
-from reporting.exporters.pdf_exporter import PDFExporter
+from reporting.charts.renderer import get_chart_renderer
 from reporting.report_generator import ReportGenerator
+from ui.chart_view import ChartView
+from ui.data_loader import DataLoader
 from utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from reporting.charts.base import ChartImage
+    from tracking.live_aggregator import LiveAggregator
+
 logger = setup_logger("ui.reports")
 
+# Chart type -> (renderer kind, width and height in inches, chart options)
+CHART_SPECS: dict[str, tuple[str, float, float, dict[str, Any]]] = {
+    "Productivity Pie": ("pie", 6, 5, {}),
+    "Weekly Trend": ("trend", 9, 5, {}),
+    "Monthly Trend": ("trend", 9, 5, {"title": "Productivity Trend (Last 30 Days)"}),
+    "Quarterly Trend": ("trend", 9, 5, {"title": "Productivity Trend (Weekly, Last 12 Weeks)"}),
+    "Daily Activity Bars": ("bars", 9, 5, {}),
+}
+
 
 class ReportsWidget(QWidget):
     """Reports and data visualization page."""
 
-    def __init__(self, db_pool: DatabasePool, parent=None) -> None:
+    def __init__(self, db_pool: DatabasePool, live: LiveAggregator | None = None, parent=None) -> None:
         super().__init__(parent)
         self.db_pool = db_pool
-        self.report_gen = ReportGenerator(db_pool)
+        self.live = live
+        self.report_gen = ReportGenerator(db_pool, live=live)
         self.activity_repo = ActivityRepository(db_pool)
-        self.csv_exporter = CSVExporter(db_pool)
-        self.pdf_exporter = PDFExporter(db_pool)
+        self.loader = DataLoader("reports", parent=self)
+        # Exports are not cancelled when the user navigates away
+        self.export_loader = DataLoader("reports_export", parent=self)
+        self.chart_renderer = get_chart_renderer()
+        # Last image of each chart type, shown straight away when the user switches back to it
+        self.images: dict[str, ChartImage] = {}
         self._build_ui()
+        self.loader.loading_changed.connect(self.loading_label.setVisible)
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -85,6 +105,11 @@ class ReportsWidget(QWidget):
         generate_btn.clicked.connect(self.refresh_data)
         controls.addWidget(generate_btn)
 
+        self.loading_label = QLabel("⏳ Loading...")
+        self.loading_label.setObjectName("loadingLabel")
+        self.loading_label.setVisible(False)
+        controls.addWidget(self.loading_label)
+
         controls.addStretch()
 
         export_csv_btn = QPushButton("Export CSV")
@@ -105,73 +130,91 @@ class ReportsWidget(QWidget):
         self.chart_layout = QVBoxLayout(self.chart_container)
         self.chart_layout.setContentsMargins(10, 10, 10, 10)
 
-        placeholder = QLabel("Select a chart type and click Generate")
-        placeholder.setAlignment(Qt.AlignCenter)
-        placeholder.setStyleSheet("color: #636e72; font-size: 16px; padding: 50px;")
-        self.chart_layout.addWidget(placeholder)
+        self.placeholder = QLabel("Select a chart type and click Generate")
+        self.placeholder.setAlignment(Qt.AlignCenter)
+        self.placeholder.setStyleSheet("color: #636e72; font-size: 16px; padding: 50px;")
+        self.chart_layout.addWidget(self.placeholder)
+
+        self.chart_view = ChartView(self.chart_container)
+        self.chart_view.setVisible(False)
+        self.chart_layout.addWidget(self.chart_view)
 
         layout.addWidget(self.chart_container, 1)
 
     def refresh_data(self) -> None:
-        """Generate and display the selected chart."""
-        try:
-            self._clear_chart()
-
-            chart_type = self.chart_selector.currentText()
-            qdate = self.date_input.date()
-            target_date = date(qdate.year(), qdate.month(), qdate.day())
-
-            if chart_type == "Productivity Pie":
-                summary = self.report_gen.get_daily_summary(target_date)
-                chart = ProductivityPieChart(summary, parent=self.chart_container, width=6, height=5)
-                self.chart_layout.addWidget(chart)
-
-            elif chart_type == "Weekly Trend":
-                summaries = self.report_gen.get_weekly_summaries()
-                chart = ProductivityTrendChart(summaries, parent=self.chart_container, width=9, height=5)
-                self.chart_layout.addWidget(chart)
-
-            elif chart_type == "Monthly Trend":
-                summaries = self.report_gen.get_monthly_summaries()
-                chart = ProductivityTrendChart(summaries, parent=self.chart_container, width=9, height=5)
-                self.chart_layout.addWidget(chart)
-
-            elif chart_type == "Quarterly Trend":
-                summaries = self.report_gen.get_quarterly_summaries()
-                chart = ProductivityTrendChart(summaries, parent=self.chart_container, width=9, height=5)
-                self.chart_layout.addWidget(chart)
-
-            elif chart_type == "Daily Activity Bars":
-                daily_counts = self.activity_repo.get_daily_counts(days=7)
-                chart = ActivityBarChart(daily_counts, parent=self.chart_container, width=9, height=5)
-                self.chart_layout.addWidget(chart)
-
-            logger.info(f"Generated chart: {chart_type}")
+        """Load the data for the selected chart in the background, then display it."""
+        chart_type = self.chart_selector.currentText()
+        qdate = self.date_input.date()
+        target_date = date(qdate.year(), qdate.month(), qdate.day())
+        if chart_type in self.images:
+            # Show the last render now; the load below replaces it if the data has changed
+            self._show_chart(chart_type, self.images[chart_type])
+        self.loader.load(
+            lambda: self._render_chart(chart_type, target_date),
+            lambda image: self._show_chart(chart_type, image),
+            self._on_load_error,
+        )
 
-        except Exception as e:
-            logger.error(f"Error generating report: {e}", exc_info=True)
-            QMessageBox.warning(self, "Error", f"Could not generate report: {e}")
+    def _render_chart(self, chart_type: str, target_date: date) -> ChartImage:
+        """Runs on a loader thread: query the chart's data and render it."""
+        kind, width, height, options = CHART_SPECS[chart_type]
+        data = self._fetch_chart_data(chart_type, target_date)
+        return self.chart_renderer.render(kind, data, width, height, **options)
+
+    def _fetch_chart_data(self, chart_type: str, target_date: date) -> Any:
+        """Runs on a loader thread."""
+        if chart_type == "Productivity Pie":
+            return self.report_gen.get_daily_summary(target_date)
+        if chart_type == "Weekly Trend":
+            return self.report_gen.get_weekly_summaries()
+        if chart_type == "Monthly Trend":
+            return self.report_gen.get_monthly_summaries()
+        if chart_type == "Quarterly Trend":
+            return self.report_gen.get_quarterly_summaries()
+        if chart_type == "Daily Activity Bars":
+            # numpy, like matplotlib, stays off the startup import path
+            from reporting.charts.activity_counts import DailyCountMatrix
+
+            return DailyCountMatrix.from_rows(self.activity_repo.get_daily_counts(days=7))
+        return None
+
+    def _show_chart(self, chart_type: str, image: ChartImage) -> None:
+        self.images[chart_type] = image
+        self.placeholder.setVisible(False)
+        self.chart_view.setVisible(True)
+        self.chart_view.show_image(image)
+        logger.info(f"Generated chart: {chart_type}")
+
+    def _on_load_error(self, error: Exception) -> None:
+        logger.error(f"Error generating report: {error}", exc_info=error)
+        QMessageBox.warning(self, "Error", f"Could not generate report: {error}")
 
     def _export_csv(self) -> None:
+        from reporting.exporters.csv_exporter import CSVExporter
+
         try:
-            filepath = self.csv_exporter.export_weekly_report()
+            filepath = CSVExporter(self.db_pool).export_weekly_report()
             QMessageBox.information(self, "Export Complete", f"CSV report saved to:\n{filepath}")
         except Exception as e:
             QMessageBox.warning(self, "Export Error", f"Failed to export CSV: {e}")
 
     def _export_pdf(self) -> None:
-        try:
-            qdate = self.date_input.date()
-            target_date = date(qdate.year(), qdate.month(), qdate.day())
-            filepath = self.pdf_exporter.export_daily_report(target_date)
-            QMessageBox.information(self, "Export Complete", f"PDF report saved to:\n{filepath}")
-        except ImportError:
-            QMessageBox.warning(self, "Missing Dependency", "Install reportlab: pip install reportlab")
-        except Exception as e:
-            QMessageBox.warning(self, "Export Error", f"Failed to export PDF: {e}")
+        """Build the PDF on a loader thread; the result is reported back on the GUI thread."""
+        from reporting.exporters.pdf_exporter import PDFExporter
+
+        qdate = self.date_input.date()
+        target_date = date(qdate.year(), qdate.month(), qdate.day())
+        self.export_loader.load(
+            lambda: PDFExporter(self.db_pool, live=self.live).export_daily_report(target_date),
+            self._on_pdf_exported,
+            self._on_pdf_export_error,
+        )
 
-    def _clear_chart(self) -> None:
-        while self.chart_layout.count():
-            item = self.chart_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def _on_pdf_exported(self, filepath: str) -> None:
+        QMessageBox.information(self, "Export Complete", f"PDF report saved to:\n{filepath}")
+
+    def _on_pdf_export_error(self, error: Exception) -> None:
+        if isinstance(error, ImportError):
+            QMessageBox.warning(self, "Missing Dependency", "Install reportlab: pip install reportlab")
+        else:
+            QMessageBox.warning(self, "Export Error", f"Failed to export PDF: {error}")
@@ -4,7 +4,9 @@ Settings page — configure app behavior, categories, themes, and preferences.
 """
 
 import os
+from collections.abc import Callable
 
+from PyQt5.QtCore import QThread, pyqtSignal
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import (
     QComboBox,
@@ -26,6 +28,7 @@ from PyQt5.QtWidgets import (
 from config.constants import AppCategory
 from config.settings import app_config
 from database.connection import DatabasePool
+from services.recategorizer import Recategorizer, RecategorizeStats
 from tracking.activity_tracker import ActivityTracker
 from tracking.categorizer import AppCategorizer
 from utils.logger import setup_logger
@@ -33,6 +36,40 @@ from utils.logger import setup_logger
 logger = setup_logger("ui.settings")
 
 
+class RecategorizeWorker(QThread):
+    """Applies a rule change to stored activity, then re-seeds live totals, without blocking the UI."""
+
+    done = pyqtSignal(object)
+
+    def __init__(
+        self,
+        db_pool: DatabasePool,
+        categorizer: AppCategorizer,
+        keyword: str,
+        category: AppCategory | None,
+        previous: AppCategory | None,
+        reconcile: Callable[[], object] | None = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self.recategorizer = Recategorizer(db_pool, categorizer)
+        self.keyword = keyword
+        self.category = category
+        self.previous = previous
+        self.reconcile = reconcile
+
+    def run(self) -> None:
+        try:
+            stats = self.recategorizer.apply_rule_change(self.keyword, self.category, self.previous)
+            if stats.changed and not stats.failed and self.reconcile is not None:
+                # Today's live totals still carry the old categories; this waits on the database
+                self.reconcile()
+        except Exception as e:
+            logger.error(f"Recategorization failed: {e}", exc_info=True)
+            stats = RecategorizeStats(failed=1)
+        self.done.emit(stats)
+
+
 class SettingsWidget(QWidget):
     """Application settings page with theme toggle."""
 
@@ -40,7 +77,9 @@ class SettingsWidget(QWidget):
         super().__init__(parent)
         self.db_pool = db_pool
         self.tracker = tracker
-        self.categorizer = AppCategorizer(db_pool)
+        # The tracker's own categorizer, so rule changes reach its cache and the rows it writes next
+        self.categorizer = tracker.categorizer
+        self._recategorize_workers: list[RecategorizeWorker] = []
         self._current_theme = "light"
         self._build_ui()
 
@@ -128,6 +167,10 @@ class SettingsWidget(QWidget):
         self.rules_table.setEditTriggers(QTableWidget.NoEditTriggers)
         categories_layout.addWidget(self.rules_table)
 
+        self.recategorize_status = QLabel("")
+        self.recategorize_status.setObjectName("pageSubtitle")
+        categories_layout.addWidget(self.recategorize_status)
+
         layout.addWidget(categories_group, 1)
 
         # ──── Danger Zone ────
@@ -135,7 +178,7 @@ class SettingsWidget(QWidget):
         danger_layout = QVBoxLayout(danger_group)
 
         cleanup_row = QHBoxLayout()
-        cleanup_label = QLabel("Permanently delete old activity logs beyond retention period")
+        cleanup_label = QLabel("Permanently delete whole months of activity logs beyond the retention period")
         cleanup_label.setStyleSheet("color: #8e8ea0;")
         cleanup_row.addWidget(cleanup_label)
         cleanup_row.addStretch()
@@ -211,35 +254,66 @@ class SettingsWidget(QWidget):
             return
 
         category = AppCategory(self.new_category_input.currentText())
+        previous = self.categorizer.rules.get(keyword.lower())
         success = self.categorizer.add_rule(keyword, category)
 
         if success:
             self.new_keyword_input.clear()
             self._load_category_rules()
+            self._recategorize_history(keyword, category, previous)
             QMessageBox.information(self, "Success", f"✅ Rule added: '{keyword}' → {category.value}")
         else:
             QMessageBox.warning(self, "Error", "Failed to add rule.")
 
     def _delete_rule(self, keyword: str):
         """Delete a categorization rule."""
+        previous = self.categorizer.rules.get(keyword)
         self.categorizer.remove_rule(keyword)
         self._load_category_rules()
+        self._recategorize_history(keyword, None, previous)
+
+    def _recategorize_history(self, keyword: str, category: AppCategory | None, previous: AppCategory | None):
+        """Bring already-logged activity in line with a rule change in the background."""
+        if previous == category:
+            return
+        worker = RecategorizeWorker(
+            self.db_pool, self.categorizer, keyword, category, previous, self.tracker.reconcile_live, self
+        )
+        worker.done.connect(lambda stats, w=worker: self._on_recategorized(w, stats))
+        self._recategorize_workers.append(worker)
+        self.recategorize_status.setText(f"Updating history for '{keyword}'…")
+        worker.start()
+
+    def _on_recategorized(self, worker: RecategorizeWorker, stats: RecategorizeStats):
+        self._recategorize_workers.remove(worker)
+        if stats.failed:
+            self.recategorize_status.setText(
+                "⚠️ Could not update history; run python -m services.recategorizer"
+            )
+        else:
+            self.recategorize_status.setText(f"✅ {stats.changed} past activities recategorized")
 
     def _cleanup_logs(self):
-        """Delete old activity logs."""
+        """Delete the months of activity logs that are entirely past the retention period."""
         days = self.retention_input.value()
         reply = QMessageBox.question(
             self,
             "Confirm Cleanup",
-            f"⚠️ This will permanently delete all activity logs older than {days} days.\n\nContinue?",
+            f"⚠️ This will permanently delete every whole month of activity logs that ended more than "
+            f"{days} days ago.\n\nLogs are removed a month at a time, so older entries in a month that "
+            f"is not yet fully past the cutoff are kept until it is.\n\nContinue?",
             QMessageBox.Yes | QMessageBox.No,
         )
         if reply == QMessageBox.Yes:
             from database.repositories.activity_repo import ActivityRepository
 
             repo = ActivityRepository(self.db_pool)
-            success = repo.cleanup_old_logs(days)
-            if success:
-                QMessageBox.information(self, "Done", f"✅ Logs older than {days} days deleted.")
+            dropped = repo.cleanup_old_logs(days)
+            if dropped is not None:
+                QMessageBox.information(
+                    self,
+                    "Done",
+                    f"✅ Removed {dropped} month(s) of logs that were entirely older than {days} days.",
+                )
             else:
                 QMessageBox.warning(self, "Error", "Cleanup failed.")
@@ -0,0 +1,40 @@
+# utils/lazy_import.py
+"""
+Module-level lazy loading for package re-exports (PEP 562).
+
+A package __init__ that re-exports classes from its submodules would import
+all of them, and everything they depend on, as soon as any one submodule is
+used. With lazy_exports() each name is imported on first access instead:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {"ReportGenerator": "reporting.report_generator"})
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build `__getattr__` and `__dir__` for `package` that import each exported name from its
+    module (`exports` maps name -> module path) the first time it is looked up.
+    """
+
+    def getattr_(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return getattr_, dir_
@@ -3,19 +3,55 @@
 Cross-platform utility functions for window management and OS-specific paths.
 """
 
+from __future__ import annotations
+
 import platform
+import threading
+from typing import TYPE_CHECKING, Any
 
 from utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from utils.x11_window_watcher import X11WindowWatcher
+
 logger = setup_logger("utils.platform")
 
 SYSTEM = platform.system()
 
+_watcher_lock = threading.Lock()
+_window_watcher: X11WindowWatcher | None = None
+_watcher_unavailable = False
+
+_idle_lock = threading.Lock()
+_idle_display: Any = None
+_idle_unavailable = False
+
+
+def get_window_watcher() -> X11WindowWatcher | None:
+    """
+    Shared X11 window watcher, started on first use.
+    Returns None off Linux, without python-xlib, or when no X display is reachable.
+    """
+    global _window_watcher, _watcher_unavailable
+    if SYSTEM != "Linux" or _watcher_unavailable:
+        return None
+    with _watcher_lock:
+        if _window_watcher is None and not _watcher_unavailable:
+            from utils.x11_window_watcher import X11WindowWatcher
+
+            watcher = X11WindowWatcher()
+            if watcher.start():
+                _window_watcher = watcher
+            else:
+                # Don't retry the connection on every poll
+                _watcher_unavailable = True
+        return _window_watcher
+
 
 def get_active_window_title() -> str:
     """
     Get the title of the currently active/focused window.
-    Works on Windows. Returns placeholder on other platforms.
+    On Linux the title comes from the X11 event watcher; xdotool is the fallback.
     """
     try:
         if SYSTEM == "Windows":
@@ -42,6 +78,10 @@ def get_active_window_title() -> str:
                 return "macOS (install pyobjc for tracking)"
 
         elif SYSTEM == "Linux":
+            watcher = get_window_watcher()
+            if watcher is not None and watcher.is_running:
+                return watcher.current_title()
+
             import subprocess
 
             try:
@@ -62,6 +102,76 @@ def get_active_window_title() -> str:
         return "Error"
 
 
+def get_idle_seconds() -> float | None:
+    """
+    Seconds since the last keyboard or mouse input.
+    Returns None when the platform can't tell (e.g. no X display or missing extension).
+    """
+    try:
+        if SYSTEM == "Windows":
+            import ctypes
+
+            class LASTINPUTINFO(ctypes.Structure):
+                _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+
+            info = LASTINPUTINFO()
+            info.cbSize = ctypes.sizeof(info)
+            if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):  # type: ignore[attr-defined]
+                return None
+            ticks = ctypes.windll.kernel32.GetTickCount()  # type: ignore[attr-defined]
+            return float((ticks - info.dwTime) & 0xFFFFFFFF) / 1000
+
+        elif SYSTEM == "Darwin":
+            try:
+                from Quartz import (  # type: ignore[import-not-found]
+                    CGEventSourceSecondsSinceLastEventType,
+                    kCGAnyInputEventType,
+                    kCGEventSourceStateCombinedSessionState,
+                )
+
+                return float(
+                    CGEventSourceSecondsSinceLastEventType(
+                        kCGEventSourceStateCombinedSessionState, kCGAnyInputEventType
+                    )
+                )
+            except ImportError:
+                return None
+
+        elif SYSTEM == "Linux":
+            return _x11_idle_seconds()
+
+        return None
+
+    except Exception as e:
+        logger.error(f"Error getting idle time: {e}")
+        return None
+
+
+def _x11_idle_seconds() -> float | None:
+    """Idle time from the XScreenSaver extension over one persistent connection."""
+    global _idle_display, _idle_unavailable
+    if _idle_unavailable:
+        return None
+    with _idle_lock:
+        if _idle_display is None:
+            try:
+                from Xlib import display
+
+                _idle_display = display.Display()
+            except Exception as e:
+                logger.info(f"X11 idle time unavailable: {e}")
+                _idle_unavailable = True
+                return None
+            if not _idle_display.has_extension("MIT-SCREEN-SAVER"):
+                logger.info("X server lacks the MIT-SCREEN-SAVER extension; idle time unavailable")
+                _idle_display.close()
+                _idle_display = None
+                _idle_unavailable = True
+                return None
+        info = _idle_display.screen().root.screensaver_query_info()
+        return float(info.idle) / 1000
+
+
 def minimize_window(window_title: str) -> bool:
     """Minimize a window by its title. Windows only."""
     try:
@@ -0,0 +1,100 @@
+# utils/startup_trace.py
+"""
+Timing trace of application startup.
+
+main() wraps each startup step in a phase; phases that finish on another
+thread or later in the event loop use begin()/end(). The summary logged
+once startup completes shows where time-to-first-window went.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from utils.logger import setup_logger
+
+logger = setup_logger("utils.startup")
+
+
+@dataclass(frozen=True)
+class StartupPhase:
+    """One timed startup step; `started` is seconds since the trace began."""
+
+    name: str
+    started: float
+    duration: float
+
+    @property
+    def finished(self) -> float:
+        return self.started + self.duration
+
+
+class StartupTrace:
+    """Records named startup phases relative to when the trace was created."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._open: dict[str, float] = {}
+        self._phases: list[StartupPhase] = []
+
+    def elapsed(self) -> float:
+        """Seconds since the trace began."""
+        return self._clock() - self._origin
+
+    def begin(self, name: str) -> None:
+        with self._lock:
+            self._open.setdefault(name, self.elapsed())
+
+    def end(self, name: str) -> StartupPhase | None:
+        """Close the phase started with begin(name); ignored if it is not open."""
+        now = self.elapsed()
+        with self._lock:
+            started = self._open.pop(name, None)
+            if started is None:
+                return None
+            phase = StartupPhase(name, started, now - started)
+            self._phases.append(phase)
+        logger.debug(f"Startup phase {name}: {phase.duration * 1000:.0f} ms")
+        return phase
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def mark(self, name: str) -> StartupPhase:
+        """Record a point in time (a zero-length phase), e.g. when the window is first shown."""
+        self.begin(name)
+        phase = self.end(name)
+        assert phase is not None
+        return phase
+
+    def phases(self) -> list[StartupPhase]:
+        with self._lock:
+            return sorted(self._phases, key=lambda phase: phase.started)
+
+    def get(self, name: str) -> StartupPhase | None:
+        with self._lock:
+            return next((phase for phase in self._phases if phase.name == name), None)
+
+    def log_summary(self) -> None:
+        phases = self.phases()
+        steps = ", ".join(
+            (
+                f"{phase.name} {phase.duration * 1000:.0f} ms"
+                if phase.duration
+                else f"{phase.name} at {phase.started * 1000:.0f} ms"
+            )
+            for phase in phases
+        )
+        total = max((phase.finished for phase in phases), default=0.0)
+        logger.info(f"Startup took {total * 1000:.0f} ms ({steps})")
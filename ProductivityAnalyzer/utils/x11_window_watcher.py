@@ -0,0 +1,203 @@
+# utils/x11_window_watcher.py
+"""
+Event-driven active-window tracking for X11.
+
+Instead of spawning `xdotool` on every poll, one persistent X connection
+listens for PropertyNotify events: _NET_ACTIVE_WINDOW on the root window
+(focus moved) and _NET_WM_NAME / WM_NAME on the focused window (title
+changed). The current title is cached, so reading it costs nothing, and
+subscribers are called only when it really changes.
+
+Requires python-xlib and an EWMH-compliant window manager.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from utils.logger import setup_logger
+
+logger = setup_logger("utils.x11_watcher")
+
+NO_ACTIVE_WINDOW = "No Active Window"
+
+
+class X11WindowWatcher:
+    """Follows the focused window's title from X11 property events on a background thread."""
+
+    def __init__(self, display_name: str | None = None) -> None:
+        self.display_name = display_name
+        self._display: Any = None
+        self._root: Any = None
+        self._atoms: dict[str, int] = {}
+        self._active_window = 0
+        self._title = NO_ACTIVE_WINDOW
+        self._callbacks: list[Callable[[str], object]] = []
+        self._lock = threading.Lock()
+        # Guards the wake pipe and the display, which the event thread closes itself if it fails
+        self._close_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._wake_r = self._wake_w = -1
+        self._running = False
+        self.changes = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> bool:
+        """Connect to the X server and start listening. Returns False if X11 is unavailable."""
+        if self._running:
+            return True
+        try:
+            from Xlib import X, display
+        except ImportError:
+            logger.info("python-xlib not installed; X11 window events unavailable")
+            return False
+        try:
+            self._display = display.Display(self.display_name)
+        except Exception as e:
+            logger.info(f"Cannot open X display: {e}")
+            return False
+
+        self._display.set_error_handler(self._on_x_error)
+        self._root = self._display.screen().root
+        for name in ("_NET_ACTIVE_WINDOW", "_NET_WM_NAME", "WM_NAME", "UTF8_STRING"):
+            self._atoms[name] = self._display.intern_atom(name)
+        self._root.change_attributes(event_mask=X.PropertyChangeMask)
+        self._set_active_window(self._read_active_window())
+        self._display.flush()
+
+        self._wake_r, self._wake_w = os.pipe()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="x11-window-watcher", daemon=True)
+        self._thread.start()
+        logger.info("X11 window watcher started")
+        return True
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the event thread and close the X connection (if the thread has not already)."""
+        self._running = False
+        with self._close_lock:
+            if self._wake_w != -1:
+                os.write(self._wake_w, b"x")
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+        self._close()
+
+    def current_title(self) -> str:
+        """Title of the focused window as of the last X event."""
+        with self._lock:
+            return self._title
+
+    def subscribe(self, callback: Callable[[str], object]) -> None:
+        """Call `callback(title)` from the watcher thread whenever the focused title changes."""
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str], object]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def _run(self) -> None:
+        display_fd = self._display.fileno()
+        while self._running:
+            try:
+                # Events may already be buffered by a previous read; drain before blocking
+                while self._display.pending_events():
+                    self._handle_event(self._display.next_event())
+                readable, _, _ = select.select([display_fd, self._wake_r], [], [])
+                if self._wake_r in readable:
+                    break
+            except Exception as e:
+                logger.error(f"X11 window watcher stopped: {e}")
+                self._running = False
+                self._close()
+
+    def _close(self) -> None:
+        """Close the wake pipe and the X connection; does nothing if they are already closed."""
+        with self._close_lock:
+            for fd in (self._wake_r, self._wake_w):
+                if fd != -1:
+                    os.close(fd)
+            self._wake_r = self._wake_w = -1
+            if self._display is not None:
+                self._display.close()
+                self._display = None
+
+    def _handle_event(self, event: Any) -> None:
+        from Xlib import X
+
+        if event.type != X.PropertyNotify:
+            return
+        if event.window.id == self._root.id and event.atom == self._atoms["_NET_ACTIVE_WINDOW"]:
+            self._set_active_window(self._read_active_window())
+        elif event.window.id == self._active_window and event.atom in (
+            self._atoms["_NET_WM_NAME"],
+            self._atoms["WM_NAME"],
+        ):
+            self._publish(self._read_title(self._active_window))
+
+    def _read_active_window(self) -> int:
+        from Xlib import X
+
+        prop = self._root.get_full_property(self._atoms["_NET_ACTIVE_WINDOW"], X.AnyPropertyType)
+        return int(prop.value[0]) if prop is not None and len(prop.value) else 0
+
+    def _set_active_window(self, window_id: int) -> None:
+        from Xlib import X
+
+        if window_id != self._active_window:
+            # Only the focused window's title changes are interesting
+            if self._active_window:
+                self._window(self._active_window).change_attributes(event_mask=X.NoEventMask)
+            if window_id:
+                self._window(window_id).change_attributes(event_mask=X.PropertyChangeMask)
+            self._active_window = window_id
+        self._publish(self._read_title(window_id))
+
+    def _read_title(self, window_id: int) -> str:
+        if not window_id:
+            return NO_ACTIVE_WINDOW
+        from Xlib import X
+        from Xlib.error import XError
+
+        window = self._window(window_id)
+        try:
+            prop = window.get_full_property(self._atoms["_NET_WM_NAME"], self._atoms["UTF8_STRING"])
+            if prop is None or not prop.value:
+                prop = window.get_full_property(self._atoms["WM_NAME"], X.AnyPropertyType)
+        except XError:
+            # The window was destroyed between the event and the request
+            return NO_ACTIVE_WINDOW
+        if prop is None or not prop.value:
+            return NO_ACTIVE_WINDOW
+        value = prop.value
+        title = value.decode("utf-8", "replace") if isinstance(value, bytes) else str(value)
+        return title.strip() or NO_ACTIVE_WINDOW
+
+    def _publish(self, title: str) -> None:
+        with self._lock:
+            if title == self._title:
+                return
+            self._title = title
+            self.changes += 1
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(title)
+            except Exception as e:
+                logger.error(f"Window change callback failed: {e}")
+
+    def _window(self, window_id: int) -> Any:
+        return self._display.create_resource_object("window", window_id)
+
+    def _on_x_error(self, error: Any, request: Any) -> None:
+        # Asynchronous errors (e.g. selecting events on a window that just closed) are expected
+        logger.debug(f"Ignored X error: {error}")